@@ -4,14 +4,33 @@ Provides a Pythonic interface to control Ableton Live via OSC.
 """
 
 from abletonosc_client.application import Application
+from abletonosc_client.async_client import (
+    AsyncAbletonOSCClient,
+    AsyncClip,
+    AsyncDevice,
+    AsyncSong,
+    AsyncTrack,
+)
 from abletonosc_client.browser import Browser
+from abletonosc_client.cache import QueryCache
 from abletonosc_client.client import AbletonOSCClient
 from abletonosc_client.clip import Clip
 from abletonosc_client.clip_slot import ClipSlot
+from abletonosc_client.coalesce import CoalescingWriter
 from abletonosc_client.device import Device
+from abletonosc_client.meters import MeterStream
+from abletonosc_client.metrics import ClientMetrics
 from abletonosc_client.midimap import MidiMap
+from abletonosc_client.mixer import MixerMirror
+from abletonosc_client.notes import Note, NoteArray
+from abletonosc_client.pool import ClientPool
+from abletonosc_client.ratelimit import RateLimiter
+from abletonosc_client.router import ListenerRouter
+from abletonosc_client.retry import RetryPolicy
 from abletonosc_client.scene import Scene
+from abletonosc_client.snapshot import SessionSnapshot
 from abletonosc_client.song import Song
+from abletonosc_client.streams import EventQueue
 from abletonosc_client.track import Track
 from abletonosc_client.view import View
 from abletonosc_client import scales
@@ -20,12 +39,30 @@ from abletonosc_client import chords
 __all__ = [
     "AbletonOSCClient",
     "Application",
+    "AsyncAbletonOSCClient",
+    "AsyncClip",
+    "AsyncDevice",
+    "AsyncSong",
+    "AsyncTrack",
     "Browser",
+    "ClientMetrics",
+    "ClientPool",
     "Clip",
     "ClipSlot",
+    "CoalescingWriter",
     "Device",
+    "EventQueue",
+    "ListenerRouter",
+    "MeterStream",
     "MidiMap",
+    "MixerMirror",
+    "Note",
+    "NoteArray",
+    "QueryCache",
+    "RateLimiter",
+    "RetryPolicy",
     "Scene",
+    "SessionSnapshot",
     "Song",
     "Track",
     "View",
@@ -40,6 +77,8 @@ def connect(
     send_port: int = 11000,
     receive_port: int = 11001,
     listen_host: str | None = None,
+    receive_mode: str = "threading",
+    callback_workers: int = 0,
 ) -> AbletonOSCClient:
     """Create and return an AbletonOSC client.
 
@@ -51,8 +90,14 @@ def connect(
         receive_port: Port to receive OSC responses (default: 11001)
         listen_host: Address to bind for receiving responses (default: same as host).
                      Set to "0.0.0.0" for WSL2->Windows connections.
+        receive_mode: "threading" (thread per datagram) or "single" (one
+                      receive thread dispatching in order)
+        callback_workers: Worker threads for listener callbacks (0 = run on
+                          the receive thread)
 
     Returns:
         Connected AbletonOSCClient instance
     """
-    return AbletonOSCClient(host, send_port, receive_port, listen_host)
+    return AbletonOSCClient(
+        host, send_port, receive_port, listen_host, receive_mode, callback_workers
+    )
@@ -0,0 +1,78 @@
+"""Structure of AbletonOSC addresses.
+
+Property addresses have the form /live/<object>/<verb>/<property>, where the
+verb is get, set, start_listen or stop_listen, and their arguments start with
+the indices of the object (track, clip slot, device...). index_count() says
+how many, so callers can tell an object's indices from the values that
+follow even when the values are integers too.
+"""
+
+from typing import Any, Sequence
+
+# Leading index arguments per object type
+INDEX_COUNTS = {
+    "song": 0,
+    "view": 0,
+    "api": 0,
+    "application": 0,
+    "track": 1,
+    "scene": 1,
+    "clip": 2,
+    "clip_slot": 2,
+    "device": 2,
+}
+
+PROPERTY_VERBS = ("get", "set", "start_listen", "stop_listen")
+
+
+def index_count(domain: str, prop: str) -> int:
+    """Return the number of index arguments of a property.
+
+    Args:
+        domain: Object type (e.g. "track")
+        prop: Property name (e.g. "volume", "parameter/value")
+
+    Returns:
+        Number of leading index arguments
+
+    Raises:
+        KeyError: If the object type is unknown
+    """
+    if domain == "device" and prop.startswith("parameter/"):
+        return 3
+    if domain == "track" and prop == "send":
+        return 2
+    return INDEX_COUNTS[domain]
+
+
+def split_property(address: str) -> tuple[str, str, str] | None:
+    """Split a property address into (object type, verb, property).
+
+    Returns:
+        The parts, or None if the address is not a property address of a
+        known object type (e.g. /live/song/create_scene)
+    """
+    parts = address.split("/", 4)
+    if (
+        len(parts) != 5
+        or parts[1] != "live"
+        or parts[2] not in INDEX_COUNTS
+        or parts[3] not in PROPERTY_VERBS
+    ):
+        return None
+    return parts[2], parts[3], parts[4]
+
+
+def index_prefix(args: Sequence[Any]) -> tuple:
+    """Return the leading integer arguments of a message.
+
+    AbletonOSC echoes a query's index arguments (track, clip, device,
+    parameter...) at the start of its response, so this prefix identifies
+    which object a message belongs to without knowing its address.
+    """
+    prefix = []
+    for arg in args:
+        if not isinstance(arg, int) or isinstance(arg, bool):
+            break
+        prefix.append(arg)
+    return tuple(prefix)
@@ -0,0 +1,2307 @@
+"""Asyncio OSC transport layer for AbletonOSC communication.
+
+Provides AbletonOSCClient's API as coroutines on top of a single
+asyncio.DatagramProtocol, so outstanding queries cost futures instead of
+threads. Async counterparts of the Song/Track/Clip/Device wrappers have a
+native coroutine for every method that queries Live, and run the
+synchronous wrappers' code for those that only send or listen.
+"""
+
+import asyncio
+import contextvars
+import dis
+import functools
+import inspect
+import time
+from collections import deque
+from contextlib import contextmanager
+from types import CodeType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+
+from pythonosc.osc_packet import OscPacket, ParseError
+
+from abletonosc_client.addresses import index_prefix
+from abletonosc_client.client import _PendingTable
+from abletonosc_client.clip import Clip, _notes_from_response
+from abletonosc_client.device import (
+    PARAMETER_STRATEGIES,
+    Device,
+    Parameter,
+    _bulk_parameter_requests,
+    _parameters_from_bulk,
+)
+from abletonosc_client.encoding import (
+    DEFAULT_MAX_DATAGRAM_SIZE,
+    build_message,
+    pack_bundles,
+)
+from abletonosc_client.metrics import ClientMetrics
+from abletonosc_client.notes import Note, NoteArray
+from abletonosc_client.ratelimit import RateLimiter
+from abletonosc_client.retry import RetryPolicy
+from abletonosc_client.router import ListenerRouter
+from abletonosc_client.snapshot import SessionSnapshot, take_snapshot_async
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+
+
+class _AsyncPendingQuery:
+    """A query waiting for its response on the event loop."""
+
+    __slots__ = ("address", "key", "seq", "sent", "future")
+
+    def __init__(self, address: str, key: tuple, future: asyncio.Future):
+        self.address = address
+        self.key = key
+        self.seq = 0
+        # perf_counter() of the first send, when metrics are enabled
+        self.sent = 0.0
+        self.future = future
+
+
+class _Protocol(asyncio.DatagramProtocol):
+    """Feeds received datagrams into the client."""
+
+    def __init__(self, client: "AsyncAbletonOSCClient"):
+        self._client = client
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            packet = OscPacket(data)
+        except ParseError:
+            return
+        for timed in packet.messages:
+            self._client._handle_response(
+                timed.message.address, *timed.message.params
+            )
+
+
+class AsyncAbletonOSCClient:
+    """Asyncio OSC client for communicating with AbletonOSC.
+
+    Sends and receives on one UDP socket bound to the receive port.
+    Default ports: send to 11000, receive on 11001.
+
+    Use as an async context manager, or call start() before use:
+
+        async with AsyncAbletonOSCClient() as client:
+            tempo = await AsyncSong(client).get_tempo()
+
+    Set `retry` to a RetryPolicy to resend /get/ queries whose request or
+    response was lost (see abletonosc_client.retry).
+
+    Set `metrics` to a ClientMetrics to record per-address counts, bytes,
+    latency and timeouts (see abletonosc_client.metrics).
+
+    Set `rate_limit` to a RateLimiter to hold back messages beyond Live's
+    budget (see abletonosc_client.ratelimit). Queries await their turn;
+    send() and flush() never block but queue datagrams, released in order
+    by the event loop.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        send_port: int = 11000,
+        receive_port: int = 11001,
+        listen_host: str | None = None,
+        max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+        retry: RetryPolicy | None = None,
+        metrics: ClientMetrics | None = None,
+        rate_limit: RateLimiter | None = None,
+    ):
+        self.host = host
+        self.send_port = send_port
+        self.receive_port = receive_port
+        # For WSL2->Windows: send to remote host, listen on local interface
+        self.listen_host = listen_host if listen_host is not None else host
+        # Largest datagram to emit when bundling or chunking
+        self.max_datagram_size = max_datagram_size
+        # Optional resending of lost queries
+        self.retry = retry
+        # Optional per-address instrumentation
+        self.metrics = metrics
+        # Optional outbound budgets
+        self.rate_limit = rate_limit
+        # Datagrams held back by the rate limit: (loop time, datagram), in
+        # send order; nothing is sent before _release_at
+        self._outbox: deque[tuple[float, bytes]] = deque()
+        self._release_at = 0.0
+        self._drain_handle: asyncio.TimerHandle | None = None
+        # Per-task bundle state (see bundle())
+        self._bundle: contextvars.ContextVar[list | None] = contextvars.ContextVar(
+            "bundle", default=None
+        )
+
+        self._transport: asyncio.DatagramTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Response handling
+        self._pending = _PendingTable()
+        self._listeners: dict[str, Callable] = {}
+        # Subscriptions of the wrappers' on_* listeners
+        self.router = ListenerRouter(self)
+        self._streams: dict[str, set[asyncio.Queue]] = {}
+
+    async def start(self) -> "AsyncAbletonOSCClient":
+        """Bind the receive socket.
+
+        Returns:
+            This client, for chaining
+        """
+        self._loop = asyncio.get_running_loop()
+        self._transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: _Protocol(self),
+            local_addr=(self.listen_host, self.receive_port),
+        )
+        return self
+
+    async def __aenter__(self) -> "AsyncAbletonOSCClient":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def _handle_response(self, address: str, *args: Any) -> None:
+        """Handle incoming OSC messages.
+
+        Routes to pending query responses, registered listeners and streams.
+        """
+        pending = self._pending.pop_match(address, args)
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.on_receive(address, args)
+            if pending is not None and pending.sent:
+                metrics.on_response(pending.address, pending.sent)
+        if pending is None and self._pending.pop_late(address, args):
+            # Another answer to a query that was resent
+            return
+        if pending is not None and not pending.future.done():
+            pending.future.set_result(args)
+
+        if address in self._listeners:
+            self._listeners[address](address, *args)
+
+        for queue in self._streams.get(address, ()):
+            if queue.full():
+                # Drop the oldest update rather than stall the receive path
+                queue.get_nowait()
+            queue.put_nowait(args)
+
+    def send(self, address: str, *args: Any) -> None:
+        """Send an OSC message (fire-and-forget).
+
+        Args:
+            address: OSC address pattern (e.g., "/live/song/set/tempo")
+            *args: Arguments to send with the message
+        """
+        if self.rate_limit is not None:
+            self._hold(self.rate_limit.reserve(address))
+        message = build_message(address, args)
+        if self.metrics is not None:
+            self.metrics.on_send(address, len(message))
+        pending = self._bundle.get()
+        if pending is not None:
+            pending.append(message)
+        else:
+            self._emit(message)
+
+    def _hold(self, delay: float) -> None:
+        """Keep anything sent from now on back for delay seconds."""
+        if delay > 0 and self._loop is not None:
+            self._release_at = max(self._release_at, self._loop.time() + delay)
+
+    def _emit(self, datagram: bytes) -> None:
+        """Send a datagram now, or queue it behind the rate limit."""
+        if not self._outbox and (
+            self._loop is None or self._release_at <= self._loop.time()
+        ):
+            self._send_datagram(datagram)
+            return
+        self._outbox.append((self._release_at, datagram))
+        if self._drain_handle is None:
+            self._drain_handle = self._loop.call_at(self._release_at, self._drain)
+
+    def _drain(self) -> None:
+        """Send the queued datagrams that are due and reschedule for the rest."""
+        if self._drain_handle is not None:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        now = self._loop.time()
+        while self._outbox and self._outbox[0][0] <= now:
+            self._send_datagram(self._outbox.popleft()[1])
+        if self._outbox:
+            self._drain_handle = self._loop.call_at(self._outbox[0][0], self._drain)
+
+    async def _throttle(self, address: str) -> None:
+        """Wait until a query may be sent, after everything queued before it."""
+        if self.rate_limit is None:
+            return
+        self._hold(self.rate_limit.reserve(address))
+        delay = self._release_at - self._loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._drain()
+
+    def _send_datagram(self, datagram: bytes) -> None:
+        """Send an encoded message or bundle."""
+        if self._transport is None:
+            raise RuntimeError("Client not started; use 'async with' or start()")
+        self._transport.sendto(datagram, (self.host, self.send_port))
+
+    def _send_query(self, pending: _AsyncPendingQuery, message: bytes) -> None:
+        """Send (or resend) a registered query's encoded request."""
+        metrics = self.metrics
+        if metrics is not None:
+            if not pending.sent:
+                pending.sent = time.perf_counter()
+            metrics.on_send(pending.address, len(message))
+        self._send_datagram(message)
+
+    @contextmanager
+    def bundle(self) -> Iterator[None]:
+        """Group send() calls made by the current task into OSC bundles.
+
+        Messages sent inside the block are packed into as few datagrams as
+        possible (each at most max_datagram_size bytes) and sent when the
+        outermost block exits. Queries made inside the block flush pending
+        messages first.
+        """
+        owner = self._bundle.get() is None
+        if owner:
+            token = self._bundle.set([])
+        try:
+            yield
+        finally:
+            if owner:
+                try:
+                    self.flush()
+                finally:
+                    self._bundle.reset(token)
+
+    def flush(self) -> None:
+        """Send messages accumulated by the current task's bundle() block.
+
+        Does nothing outside a bundle() block.
+        """
+        pending = self._bundle.get()
+        if not pending:
+            return
+        self._bundle.set([])
+        for datagram in pack_bundles(pending, self.max_datagram_size):
+            self._emit(datagram)
+
+    def _register(self, address: str, args: Sequence[Any]) -> _AsyncPendingQuery:
+        pending = _AsyncPendingQuery(
+            address, index_prefix(args), self._loop.create_future()
+        )
+        self._pending.add(pending)
+        return pending
+
+    async def barrier(self, timeout: float = 2.0) -> None:
+        """Wait until Live has processed every message sent so far.
+
+        See AbletonOSCClient.barrier. Use it after the async wrappers'
+        create_* methods; the sync *_and_wait helpers are not wrapped.
+
+        Args:
+            timeout: How long to wait for the answer in seconds
+
+        Raises:
+            TimeoutError: If Live does not answer within timeout
+        """
+        await self.query("/live/test", timeout=timeout)
+
+    async def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
+        """Send an OSC message and wait for response.
+
+        Args:
+            address: OSC address pattern (e.g., "/live/song/get/tempo")
+            *args: Arguments to send with the message
+            timeout: How long to wait for response in seconds
+
+        Returns:
+            Tuple of response arguments
+
+        Raises:
+            TimeoutError: If no response received within timeout
+        """
+        pending = self._register(address, args)
+        try:
+            self.flush()
+            message = build_message(address, args)
+            await self._throttle(address)
+            self._send_query(pending, message)
+            if not await self._await_responses([pending], [message], timeout):
+                if self.metrics is not None:
+                    self.metrics.on_timeout(address)
+                raise TimeoutError(f"No response for {address} within {timeout}s")
+            return pending.future.result()
+        finally:
+            self._pending.discard(pending)
+
+    async def _await_responses(
+        self,
+        pendings: Sequence[_AsyncPendingQuery],
+        messages: Sequence[bytes],
+        timeout: float,
+    ) -> bool:
+        """Wait for sent queries, resending lost ones per the retry policy.
+
+        Args:
+            pendings: Registered queries
+            messages: Encoded request for each query, for resending
+            timeout: Overall deadline in seconds
+
+        Returns:
+            True if every query was answered before the deadline
+        """
+        policy = self.retry
+        if policy is not None:
+            timeout = policy.limit(timeout)
+        deadline = self._loop.time() + timeout
+        retryable = [
+            policy is not None and policy.should_retry(p.address) for p in pendings
+        ]
+        waits = policy.waits() if any(retryable) else iter(())
+        resends = [0] * len(pendings)
+
+        while True:
+            wait = next(waits, None)
+            now = self._loop.time()
+            stop = deadline if wait is None else min(now + wait, deadline)
+            missing = [p.future for p in pendings if not p.future.done()]
+            if missing:
+                _, missing = await asyncio.wait(missing, timeout=max(stop - now, 0.0))
+            if not missing or wait is None or self._loop.time() >= deadline:
+                break
+            for i, pending in enumerate(pendings):
+                if retryable[i] and not pending.future.done():
+                    await self._throttle(pending.address)
+                    self._send_query(pending, messages[i])
+                    resends[i] += 1
+
+        for i, pending in enumerate(pendings):
+            if retryable[i]:
+                policy.record(resends[i], pending.future.done())
+            if resends[i]:
+                # Every send that didn't produce the answer may still do so
+                late = resends[i] + (not pending.future.done())
+                self._pending.expect_late(pending, late, policy.max_timeout)
+        return not missing
+
+    async def query_many(
+        self,
+        requests: Iterable[tuple[str, Sequence[Any]]],
+        timeout: float = 2.0,
+    ) -> list[tuple]:
+        """Send several queries back-to-back and wait for all responses.
+
+        Args:
+            requests: (address, args) pairs, e.g. [("/live/track/get/name", (0,))]
+            timeout: Overall deadline for all responses in seconds
+
+        Returns:
+            List of response tuples, in the same order as requests
+
+        Raises:
+            TimeoutError: If any response is not received within timeout
+        """
+        batch = [(address, tuple(args)) for address, args in requests]
+        pendings = [self._register(address, args) for address, args in batch]
+        try:
+            self.flush()
+            messages = [build_message(address, args) for address, args in batch]
+            for pending, message in zip(pendings, messages):
+                await self._throttle(pending.address)
+                self._send_query(pending, message)
+            if not pendings:
+                return []
+            if not await self._await_responses(pendings, messages, timeout):
+                missing = sum(not pending.future.done() for pending in pendings)
+                if self.metrics is not None:
+                    for pending in pendings:
+                        if not pending.future.done():
+                            self.metrics.on_timeout(pending.address)
+                raise TimeoutError(
+                    f"No response for {missing} of {len(pendings)} queries "
+                    f"within {timeout}s"
+                )
+            return [pending.future.result() for pending in pendings]
+        finally:
+            for pending in pendings:
+                self._pending.discard(pending)
+
+    def start_listener(self, address: str, callback: Callable) -> None:
+        """Register a callback for messages at an address.
+
+        The callback runs on the event loop and must not block.
+
+        Args:
+            address: OSC address to listen for
+            callback: Function(address, *args) to call on message
+        """
+        self._listeners[address] = callback
+
+    def stop_listener(self, address: str) -> None:
+        """Unregister a callback for an address.
+
+        Args:
+            address: OSC address to stop listening for
+        """
+        self._listeners.pop(address, None)
+
+    async def listen(self, address: str, maxsize: int = 256) -> AsyncIterator[tuple]:
+        """Iterate over messages arriving at an address.
+
+        Only routes messages locally; use the wrappers' on_* methods or
+        send(".../start_listen/...") to ask AbletonOSC for updates.
+
+        Args:
+            address: OSC address to listen for (e.g., "/live/song/get/beat")
+            maxsize: Updates to buffer before dropping the oldest (0 = unbounded)
+
+        Yields:
+            Tuple of message arguments for each update
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._streams.setdefault(address, set()).add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            streams = self._streams.get(address)
+            if streams is not None:
+                streams.discard(queue)
+                if not streams:
+                    del self._streams[address]
+
+    def close(self) -> None:
+        """Close the socket, dropping datagrams still held by the rate limit."""
+        if self._drain_handle is not None:
+            self._drain_handle.cancel()
+            self._drain_handle = None
+        self._outbox.clear()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+# Async wrappers
+
+
+# Members of the client a synchronous wrapper method may use without
+# waiting for Live
+_SYNC_CLIENT_MEMBERS = frozenset(
+    {
+        "send",
+        "bundle",
+        "flush",
+        "start_listener",
+        "stop_listener",
+        "router",
+        "max_datagram_size",
+    }
+)
+
+
+def _client_uses(code: CodeType) -> set[str]:
+    """Return the attributes of self._client a function's code reads.
+
+    Passing self._client itself on (e.g. to take_snapshot) is reported as
+    "_client". Nested code such as lambdas and comprehensions is included.
+    """
+    uses = set()
+    instructions = list(dis.get_instructions(code))
+    for instruction, following in zip(instructions, instructions[1:]):
+        if instruction.opname == "LOAD_ATTR" and instruction.argval == "_client":
+            if following.opname in ("LOAD_ATTR", "LOAD_METHOD"):
+                uses.add(following.argval)
+            else:
+                uses.add("_client")
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            uses |= _client_uses(const)
+    return uses
+
+
+def _names(code: CodeType) -> set[str]:
+    """Return the global and attribute names used by code, nested code included."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _names(const)
+    return names
+
+
+def _querying_methods(cls: type) -> set[str]:
+    """Return the names of a sync wrapper's methods that wait for Live.
+
+    A method waits if it uses the client for anything but sending and
+    listening, or calls a method of the class that does.
+    """
+    methods = dict(inspect.getmembers(cls, inspect.isfunction))
+    querying = {
+        name
+        for name, func in methods.items()
+        if _client_uses(func.__code__) - _SYNC_CLIENT_MEMBERS
+    }
+    while True:
+        callers = {
+            name
+            for name, func in methods.items()
+            if name not in querying and _names(func.__code__) & querying
+        }
+        if not callers:
+            return querying
+        querying |= callers
+
+
+class _AsyncWrapper:
+    """Base for async counterparts of the synchronous wrapper classes.
+
+    Subclasses set `_wrapped` to a wrapper class. Methods of it that only
+    send or listen become coroutine methods running the sync code, with the
+    same signature and docstring. Methods that query must be defined as
+    native coroutines in the subclass; defining the subclass raises
+    TypeError if one is missing.
+    """
+
+    _wrapped: type
+
+    def __init__(self, client: AsyncAbletonOSCClient):
+        self._client = client
+        # Sync instance holding the wrapper's state (e.g. listener callbacks)
+        self._sync = self._wrapped(client)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        querying = _querying_methods(cls._wrapped)
+        for name, func in inspect.getmembers(cls._wrapped, inspect.isfunction):
+            # *_and_wait helpers poll with time.sleep, which would block
+            # the event loop; async callers await client.barrier() instead
+            if name.startswith("_") or name.endswith("_and_wait"):
+                continue
+            if name in vars(cls):
+                if not inspect.iscoroutinefunction(vars(cls)[name]):
+                    raise TypeError(f"{cls.__name__}.{name} must be a coroutine")
+            elif name in querying:
+                raise TypeError(
+                    f"{cls.__name__} must define {name} as a coroutine: "
+                    f"{cls._wrapped.__name__}.{name} queries Live"
+                )
+            else:
+                setattr(cls, name, cls._make_method(func))
+
+    @staticmethod
+    def _make_method(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def method(self, *args, **kwargs):
+            return func(self._sync, *args, **kwargs)
+
+        return method
+
+
+class AsyncSong(_AsyncWrapper):
+    """Async counterpart of Song; every method is a coroutine."""
+
+    _wrapped = Song
+
+    async def get_tempo(self) -> float:
+        """Get the current song tempo in BPM.
+
+        Returns:
+            Tempo in beats per minute (20-999)
+        """
+        result = await self._client.query("/live/song/get/tempo")
+        return float(result[0])
+
+    async def get_is_playing(self) -> bool:
+        """Check if the song is currently playing.
+
+        Returns:
+            True if playing, False if stopped
+        """
+        result = await self._client.query("/live/song/get/is_playing")
+        return bool(result[0])
+
+    async def get_signature_numerator(self) -> int:
+        """Get the time signature numerator.
+
+        Returns:
+            Time signature numerator (e.g., 4 for 4/4)
+        """
+        result = await self._client.query("/live/song/get/signature_numerator")
+        return int(result[0])
+
+    async def get_signature_denominator(self) -> int:
+        """Get the time signature denominator.
+
+        Returns:
+            Time signature denominator (e.g., 4 for 4/4)
+        """
+        result = await self._client.query("/live/song/get/signature_denominator")
+        return int(result[0])
+
+    async def get_num_tracks(self) -> int:
+        """Get the number of tracks in the song.
+
+        Returns:
+            Number of tracks (including return tracks and master)
+        """
+        result = await self._client.query("/live/song/get/num_tracks")
+        return int(result[0])
+
+    async def get_num_scenes(self) -> int:
+        """Get the number of scenes in the song.
+
+        Returns:
+            Number of scenes
+        """
+        result = await self._client.query("/live/song/get/num_scenes")
+        return int(result[0])
+
+    async def get_current_song_time(self) -> float:
+        """Get the current playback position in beats.
+
+        Returns:
+            Current position in beats
+        """
+        result = await self._client.query("/live/song/get/current_song_time")
+        return float(result[0])
+
+    async def get_metronome(self) -> bool:
+        """Check if the metronome is enabled.
+
+        Returns:
+            True if metronome is on
+        """
+        result = await self._client.query("/live/song/get/metronome")
+        return bool(result[0])
+
+    async def get_record_mode(self) -> bool:
+        """Check if record mode is enabled.
+
+        Returns:
+            True if record mode is on
+        """
+        result = await self._client.query("/live/song/get/record_mode")
+        return bool(result[0])
+
+    async def get_groove_amount(self) -> float:
+        """Get the global groove amount.
+
+        Returns:
+            Groove amount (0.0-1.0)
+        """
+        result = await self._client.query("/live/song/get/groove_amount")
+        return float(result[0])
+
+    async def can_undo(self) -> bool:
+        """Check if undo is available.
+
+        Returns:
+            True if undo is possible
+        """
+        result = await self._client.query("/live/song/get/can_undo")
+        return bool(result[0])
+
+    async def can_redo(self) -> bool:
+        """Check if redo is available.
+
+        Returns:
+            True if redo is possible
+        """
+        result = await self._client.query("/live/song/get/can_redo")
+        return bool(result[0])
+
+    async def get_song_length(self) -> float:
+        """Get the total song length in beats.
+
+        Returns:
+            Song length in beats
+        """
+        result = await self._client.query("/live/song/get/song_length")
+        return float(result[0])
+
+    async def get_loop(self) -> bool:
+        """Check if loop is enabled.
+
+        Returns:
+            True if loop is enabled
+        """
+        result = await self._client.query("/live/song/get/loop")
+        return bool(result[0])
+
+    async def get_loop_start(self) -> float:
+        """Get the loop start position in beats.
+
+        Returns:
+            Loop start position in beats
+        """
+        result = await self._client.query("/live/song/get/loop_start")
+        return float(result[0])
+
+    async def get_loop_length(self) -> float:
+        """Get the loop length in beats.
+
+        Returns:
+            Loop length in beats
+        """
+        result = await self._client.query("/live/song/get/loop_length")
+        return float(result[0])
+
+    async def get_midi_recording_quantization(self) -> int:
+        """Get the MIDI recording quantization setting.
+
+        Returns:
+            Quantization value (0=None, 1=1/4, 2=1/8, 3=1/8T, 4=1/8+1/8T,
+            5=1/16, 6=1/16T, 7=1/16+1/16T, 8=1/32)
+        """
+        result = await self._client.query("/live/song/get/midi_recording_quantization")
+        return int(result[0])
+
+    async def get_clip_trigger_quantization(self) -> int:
+        """Get the clip trigger quantization setting.
+
+        Returns:
+            Quantization value (0=None, 1=8 bars, 2=4 bars, 3=2 bars,
+            4=1 bar, 5=1/2, 6=1/2T, 7=1/4, 8=1/4T, 9=1/8, 10=1/8T,
+            11=1/16, 12=1/16T, 13=1/32)
+        """
+        result = await self._client.query("/live/song/get/clip_trigger_quantization")
+        return int(result[0])
+
+    async def get_session_record(self) -> bool:
+        """Check if session recording is enabled.
+
+        Returns:
+            True if session recording is enabled
+        """
+        result = await self._client.query("/live/song/get/session_record")
+        return bool(result[0])
+
+    async def get_arrangement_overdub(self) -> bool:
+        """Check if arrangement overdub is enabled.
+
+        Returns:
+            True if arrangement overdub is enabled
+        """
+        result = await self._client.query("/live/song/get/arrangement_overdub")
+        return bool(result[0])
+
+    async def get_punch_in(self) -> bool:
+        """Check if punch-in is enabled.
+
+        Returns:
+            True if punch-in is enabled
+        """
+        result = await self._client.query("/live/song/get/punch_in")
+        return bool(result[0])
+
+    async def get_punch_out(self) -> bool:
+        """Check if punch-out is enabled.
+
+        Returns:
+            True if punch-out is enabled
+        """
+        result = await self._client.query("/live/song/get/punch_out")
+        return bool(result[0])
+
+    async def get_cue_points(self) -> tuple:
+        """Get all cue points in the song.
+
+        Returns:
+            Tuple of cue point data (name, time pairs)
+        """
+        result = await self._client.query("/live/song/get/cue_points")
+        return result
+
+    async def get_root_note(self) -> int:
+        """Get the root note of the song's key.
+
+        Returns:
+            Root note as MIDI note number (0-11, where 0=C, 1=C#, etc.)
+        """
+        result = await self._client.query("/live/song/get/root_note")
+        return int(result[0])
+
+    async def get_scale_name(self) -> str:
+        """Get the scale name of the song.
+
+        Returns:
+            Scale name (e.g., "Major", "Minor", "Dorian")
+        """
+        result = await self._client.query("/live/song/get/scale_name")
+        return str(result[0])
+
+    async def get_track_names(self, start: int = 0, end: int = -1) -> tuple:
+        """Get names of all tracks in a range.
+
+        Args:
+            start: Starting track index (default 0)
+            end: Ending track index, exclusive (-1 for all)
+
+        Returns:
+            Tuple of track names
+        """
+        if end == -1:
+            end = await self.get_num_tracks()
+        return await self._client.query("/live/song/get/track_names", start, end)
+
+    async def get_back_to_arranger(self) -> bool:
+        """Check if back-to-arranger button is highlighted.
+
+        Returns:
+            True if back-to-arranger is active (session changes pending)
+        """
+        result = await self._client.query("/live/song/get/back_to_arranger")
+        return bool(result[0])
+
+    async def get_session_record_status(self) -> int:
+        """Get the session record status.
+
+        Returns:
+            Session record status (0=Off, 1=On, 2=Transition)
+        """
+        result = await self._client.query("/live/song/get/session_record_status")
+        return int(result[0]) if result else 0
+
+    async def get_beat(self) -> float:
+        """Get the current beat position.
+
+        Returns:
+            Current beat position
+        """
+        result = await self._client.query("/live/song/get/beat")
+        return float(result[0]) if result else 0.0
+
+    async def snapshot(
+        self, parameters: bool = True, notes: bool = False
+    ) -> SessionSnapshot:
+        """Capture the state of the whole set with pipelined bulk queries.
+
+        Args:
+            parameters: Include device parameters
+            notes: Include notes of MIDI clips
+
+        Returns:
+            Immutable SessionSnapshot (see abletonosc_client.snapshot)
+        """
+        return await take_snapshot_async(
+            self._client, parameters=parameters, notes=notes
+        )
+
+
+class AsyncTrack(_AsyncWrapper):
+    """Async counterpart of Track; every method is a coroutine."""
+
+    _wrapped = Track
+
+    async def get_name(self, track_index: int) -> str:
+        """Get the track name.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Track name
+        """
+        result = await self._client.query("/live/track/get/name", track_index)
+        # Response format: (track_index, name)
+        return str(result[1]) if len(result) > 1 else ""
+
+    async def get_volume(self, track_index: int) -> float:
+        """Get the track volume.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Volume level (0.0-1.0, where 0.85 is 0dB)
+        """
+        result = await self._client.query("/live/track/get/volume", track_index)
+        # Response format: (track_index, volume)
+        return float(result[1])
+
+    async def get_panning(self, track_index: int) -> float:
+        """Get the track pan position.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Pan position (-1.0 left to 1.0 right, 0.0 center)
+        """
+        result = await self._client.query("/live/track/get/panning", track_index)
+        # Response format: (track_index, panning)
+        return float(result[1])
+
+    async def get_mute(self, track_index: int) -> bool:
+        """Check if track is muted.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if muted
+        """
+        result = await self._client.query("/live/track/get/mute", track_index)
+        # Response format: (track_index, mute)
+        return bool(result[1])
+
+    async def get_solo(self, track_index: int) -> bool:
+        """Check if track is soloed.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if soloed
+        """
+        result = await self._client.query("/live/track/get/solo", track_index)
+        # Response format: (track_index, solo)
+        return bool(result[1])
+
+    async def get_arm(self, track_index: int) -> bool:
+        """Check if track is armed for recording.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if armed
+        """
+        result = await self._client.query("/live/track/get/arm", track_index)
+        # Response format: (track_index, arm)
+        return bool(result[1])
+
+    async def get_color(self, track_index: int) -> int:
+        """Get the track color.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Color as integer
+        """
+        result = await self._client.query("/live/track/get/color", track_index)
+        # Response format: (track_index, color)
+        return int(result[1])
+
+    async def get_is_foldable(self, track_index: int) -> bool:
+        """Check if track is a group track (foldable).
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track is a group
+        """
+        result = await self._client.query("/live/track/get/is_foldable", track_index)
+        # Response format: (track_index, is_foldable)
+        return bool(result[1])
+
+    async def get_is_grouped(self, track_index: int) -> bool:
+        """Check if track is inside a group.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track is in a group
+        """
+        result = await self._client.query("/live/track/get/is_grouped", track_index)
+        # Response format: (track_index, is_grouped)
+        return bool(result[1])
+
+    async def get_num_devices(self, track_index: int) -> int:
+        """Get the number of devices on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Number of devices
+        """
+        result = await self._client.query("/live/track/get/num_devices", track_index)
+        # Response format: (track_index, num_devices)
+        return int(result[1])
+
+    async def get_send(self, track_index: int, send_index: int) -> float:
+        """Get the send level for a track.
+
+        Args:
+            track_index: Track index (0-based)
+            send_index: Send index (0-based, corresponds to return track order)
+
+        Returns:
+            Send level (0.0-1.0)
+        """
+        result = await self._client.query(
+            "/live/track/get/send", track_index, send_index
+        )
+        # Response format: (track_index, send_index, level)
+        return float(result[2])
+
+    async def insert_device(
+        self, track_index: int, device_name: str, device_index: int = -1
+    ) -> int:
+        """Insert a device onto a track by name.
+
+        Searches instruments, audio effects, midi effects, drums, and sounds
+        for a matching device name and loads it onto the track.
+
+        Args:
+            track_index: Track index (0-based)
+            device_name: Name of the device to load (e.g., "Wavetable", "Reverb")
+            device_index: Position to insert device (-1 = end of chain)
+
+        Returns:
+            Index of newly inserted device, or -1 if device not found
+        """
+        result = await self._client.query(
+            "/live/track/insert_device", track_index, device_name, device_index
+        )
+        # Response format: (track_index, device_index)
+        return int(result[1]) if len(result) > 1 else -1
+
+    async def get_device_names(self, track_index: int) -> tuple:
+        """Get names of all devices on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of device names
+        """
+        result = await self._client.query("/live/track/get/devices/name", track_index)
+        # Response format: (track_index, name1, name2, ...)
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_device_types(self, track_index: int) -> tuple:
+        """Get types of all devices on a track.
+
+        Device types: 0 = audio_effect, 1 = instrument, 2 = midi_effect
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of device types (integers)
+        """
+        result = await self._client.query("/live/track/get/devices/type", track_index)
+        # Response format: (track_index, type1, type2, ...)
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_input_routing_type(self, track_index: int) -> str:
+        """Get the input routing type for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Input routing type name (e.g., "Ext. In", "No Input")
+        """
+        result = await self._client.query(
+            "/live/track/get/input_routing_type", track_index
+        )
+        return str(result[1]) if len(result) > 1 else ""
+
+    async def get_input_routing_channel(self, track_index: int) -> str:
+        """Get the input routing channel for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Input routing channel name
+        """
+        result = await self._client.query(
+            "/live/track/get/input_routing_channel", track_index
+        )
+        return str(result[1]) if len(result) > 1 else ""
+
+    async def get_output_routing_type(self, track_index: int) -> str:
+        """Get the output routing type for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Output routing type name (e.g., "Master", "Sends Only")
+        """
+        result = await self._client.query(
+            "/live/track/get/output_routing_type", track_index
+        )
+        return str(result[1]) if len(result) > 1 else ""
+
+    async def get_output_routing_channel(self, track_index: int) -> str:
+        """Get the output routing channel for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Output routing channel name
+        """
+        result = await self._client.query(
+            "/live/track/get/output_routing_channel", track_index
+        )
+        return str(result[1]) if len(result) > 1 else ""
+
+    async def get_available_input_routing_types(self, track_index: int) -> tuple:
+        """Get available input routing types for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of available input routing type names
+        """
+        result = await self._client.query(
+            "/live/track/get/available_input_routing_types", track_index
+        )
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_available_output_routing_types(self, track_index: int) -> tuple:
+        """Get available output routing types for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of available output routing type names
+        """
+        result = await self._client.query(
+            "/live/track/get/available_output_routing_types", track_index
+        )
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_available_input_routing_channels(self, track_index: int) -> tuple:
+        """Get available input routing channels for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of available input routing channel names
+        """
+        result = await self._client.query(
+            "/live/track/get/available_input_routing_channels", track_index
+        )
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_available_output_routing_channels(self, track_index: int) -> tuple:
+        """Get available output routing channels for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of available output routing channel names
+        """
+        result = await self._client.query(
+            "/live/track/get/available_output_routing_channels", track_index
+        )
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_clips_names(self, track_index: int) -> tuple:
+        """Get names of all clips on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of clip names (empty string for empty slots)
+        """
+        result = await self._client.query("/live/track/get/clips/name", track_index)
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_clips_lengths(self, track_index: int) -> tuple:
+        """Get lengths of all clips on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of clip lengths in beats (0 for empty slots)
+        """
+        result = await self._client.query("/live/track/get/clips/length", track_index)
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_clips_colors(self, track_index: int) -> tuple:
+        """Get colors of all clips on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of clip colors as integers
+        """
+        result = await self._client.query("/live/track/get/clips/color", track_index)
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_devices_class_names(self, track_index: int) -> tuple:
+        """Get class names (types) of all devices on a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Tuple of device class names (e.g., "Compressor", "Reverb")
+        """
+        result = await self._client.query(
+            "/live/track/get/devices/class_name", track_index
+        )
+        return result[1:] if len(result) > 1 else ()
+
+    async def get_current_monitoring_state(self, track_index: int) -> int:
+        """Get the current monitoring state for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Monitoring state (0=In, 1=Auto, 2=Off)
+        """
+        result = await self._client.query(
+            "/live/track/get/current_monitoring_state", track_index
+        )
+        return int(result[1])
+
+    async def get_can_be_armed(self, track_index: int) -> bool:
+        """Check if a track can be armed for recording.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track can be armed
+        """
+        result = await self._client.query(
+            "/live/track/get/can_be_armed", track_index
+        )
+        return bool(result[1])
+
+    async def get_has_midi_input(self, track_index: int) -> bool:
+        """Check if a track has MIDI input.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track has MIDI input
+        """
+        result = await self._client.query(
+            "/live/track/get/has_midi_input", track_index
+        )
+        return bool(result[1])
+
+    async def get_has_midi_output(self, track_index: int) -> bool:
+        """Check if a track has MIDI output.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track has MIDI output
+        """
+        result = await self._client.query(
+            "/live/track/get/has_midi_output", track_index
+        )
+        return bool(result[1])
+
+    async def get_has_audio_input(self, track_index: int) -> bool:
+        """Check if a track has audio input.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track has audio input
+        """
+        result = await self._client.query(
+            "/live/track/get/has_audio_input", track_index
+        )
+        return bool(result[1])
+
+    async def get_has_audio_output(self, track_index: int) -> bool:
+        """Check if a track has audio output.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track has audio output
+        """
+        result = await self._client.query(
+            "/live/track/get/has_audio_output", track_index
+        )
+        return bool(result[1])
+
+    async def get_fired_slot_index(self, track_index: int) -> int:
+        """Get the index of the clip slot that was fired (triggered).
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Fired slot index, or -1 if none
+        """
+        result = await self._client.query(
+            "/live/track/get/fired_slot_index", track_index
+        )
+        return int(result[1])
+
+    async def get_playing_slot_index(self, track_index: int) -> int:
+        """Get the index of the currently playing clip slot.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Playing slot index, or -1 if none
+        """
+        result = await self._client.query(
+            "/live/track/get/playing_slot_index", track_index
+        )
+        return int(result[1])
+
+    async def get_color_index(self, track_index: int) -> int:
+        """Get the color index of a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Color index (0-69)
+        """
+        result = await self._client.query(
+            "/live/track/get/color_index", track_index
+        )
+        return int(result[1])
+
+    async def get_fold_state(self, track_index: int) -> bool:
+        """Get the fold state of a group track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track is folded (collapsed)
+        """
+        result = await self._client.query(
+            "/live/track/get/fold_state", track_index
+        )
+        return bool(result[1])
+
+    async def get_is_visible(self, track_index: int) -> bool:
+        """Check if a track is visible.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            True if track is visible
+        """
+        result = await self._client.query(
+            "/live/track/get/is_visible", track_index
+        )
+        return bool(result[1])
+
+    async def get_output_meter_level(self, track_index: int) -> float:
+        """Get the output meter level for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Output meter level (0.0-1.0)
+        """
+        result = await self._client.query(
+            "/live/track/get/output_meter_level", track_index
+        )
+        return float(result[1])
+
+    async def get_output_meter_left(self, track_index: int) -> float:
+        """Get the left channel output meter level for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Left channel meter level (0.0-1.0)
+        """
+        result = await self._client.query(
+            "/live/track/get/output_meter_left", track_index
+        )
+        return float(result[1]) if len(result) > 1 and result[1] is not None else 0.0
+
+    async def get_output_meter_right(self, track_index: int) -> float:
+        """Get the right channel output meter level for a track.
+
+        Args:
+            track_index: Track index (0-based)
+
+        Returns:
+            Right channel meter level (0.0-1.0)
+        """
+        result = await self._client.query(
+            "/live/track/get/output_meter_right", track_index
+        )
+        return float(result[1]) if len(result) > 1 and result[1] is not None else 0.0
+
+
+class AsyncClip(_AsyncWrapper):
+    """Async counterpart of Clip; every method is a coroutine."""
+
+    _wrapped = Clip
+
+    async def get_name(self, track_index: int, clip_index: int) -> str:
+        """Get the clip name.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Clip name
+        """
+        result = await self._client.query(
+            "/live/clip/get/name", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, name)
+        return str(result[2]) if len(result) > 2 else ""
+
+    async def get_length(self, track_index: int, clip_index: int) -> float:
+        """Get the clip length in beats.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Clip length in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/length", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, length)
+        return float(result[2])
+
+    async def get_is_midi_clip(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is a MIDI clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if MIDI clip, False if audio clip
+        """
+        result = await self._client.query(
+            "/live/clip/get/is_midi_clip", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, is_midi_clip)
+        return bool(result[2])
+
+    async def get_is_audio_clip(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if audio clip, False if MIDI clip
+        """
+        result = await self._client.query(
+            "/live/clip/get/is_audio_clip", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, is_audio_clip)
+        return bool(result[2])
+
+    async def get_is_playing(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is currently playing.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if playing
+        """
+        result = await self._client.query(
+            "/live/clip/get/is_playing", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, is_playing)
+        return bool(result[2])
+
+    async def get_color(self, track_index: int, clip_index: int) -> int:
+        """Get the clip color.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Color as integer
+        """
+        result = await self._client.query(
+            "/live/clip/get/color", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, color)
+        return int(result[2])
+
+    async def get_notes(
+        self, track_index: int, clip_index: int, as_array: bool = False
+    ) -> list[Note] | NoteArray:
+        """Get all notes from a MIDI clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+            as_array: Return a columnar NoteArray instead of Note objects
+
+        Returns:
+            List of Note objects, or a NoteArray if as_array is True
+        """
+        result = await self._client.query(
+            "/live/clip/get/notes", track_index, clip_index
+        )
+        return _notes_from_response(result, as_array)
+
+    async def get_loop_start(self, track_index: int, clip_index: int) -> float:
+        """Get the loop start position in beats.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Loop start position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/loop_start", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, loop_start)
+        return float(result[2])
+
+    async def get_loop_end(self, track_index: int, clip_index: int) -> float:
+        """Get the loop end position in beats.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Loop end position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/loop_end", track_index, clip_index
+        )
+        # Response format: (track_index, clip_index, loop_end)
+        return float(result[2])
+
+    async def get_start_time(self, track_index: int, clip_index: int) -> float:
+        """Get the clip start time in beats.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Start time in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/start_time", track_index, clip_index
+        )
+        return float(result[2])
+
+    async def get_end_time(self, track_index: int, clip_index: int) -> float:
+        """Get the clip end time in beats.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            End time in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/end_time", track_index, clip_index
+        )
+        return float(result[2])
+
+    async def get_looping(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip looping is enabled.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if looping is enabled
+        """
+        result = await self._client.query(
+            "/live/clip/get/looping", track_index, clip_index
+        )
+        return bool(result[2])
+
+    async def get_warp_mode(self, track_index: int, clip_index: int) -> int:
+        """Get the warp mode for an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Warp mode (0=Beats, 1=Tones, 2=Texture, 3=Re-Pitch, 4=Complex,
+            5=Complex Pro)
+        """
+        result = await self._client.query(
+            "/live/clip/get/warp_mode", track_index, clip_index
+        )
+        return int(result[2])
+
+    async def get_pitch_coarse(self, track_index: int, clip_index: int) -> int:
+        """Get the coarse pitch adjustment for a clip (audio clips only).
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Pitch adjustment in semitones (-48 to +48), or 0 for MIDI clips
+        """
+        result = await self._client.query(
+            "/live/clip/get/pitch_coarse", track_index, clip_index
+        )
+        return int(result[2]) if len(result) > 2 and result[2] is not None else 0
+
+    async def get_pitch_fine(self, track_index: int, clip_index: int) -> float:
+        """Get the fine pitch adjustment for a clip (audio clips only).
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Fine pitch adjustment in cents (-50 to +50), or 0.0 for MIDI clips
+        """
+        result = await self._client.query(
+            "/live/clip/get/pitch_fine", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 and result[2] is not None else 0.0
+
+    async def get_gain(self, track_index: int, clip_index: int) -> float:
+        """Get the gain for an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Gain level (typically 0.0-1.0, where 1.0 is unity gain)
+        """
+        result = await self._client.query(
+            "/live/clip/get/gain", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 1.0
+
+    async def get_warping(self, track_index: int, clip_index: int) -> bool:
+        """Check if warping is enabled for an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if warping is enabled
+        """
+        result = await self._client.query(
+            "/live/clip/get/warping", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_muted(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is muted.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if clip is muted
+        """
+        result = await self._client.query(
+            "/live/clip/get/muted", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_playing_position(self, track_index: int, clip_index: int) -> float:
+        """Get the current playhead position in the clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Playhead position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/playing_position", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 0.0
+
+    async def get_color_index(self, track_index: int, clip_index: int) -> int:
+        """Get the color index of a clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Color index (0-69)
+        """
+        result = await self._client.query(
+            "/live/clip/get/color_index", track_index, clip_index
+        )
+        return int(result[2]) if len(result) > 2 else 0
+
+    async def get_start_marker(self, track_index: int, clip_index: int) -> float:
+        """Get the start marker position.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Start marker position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/start_marker", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 0.0
+
+    async def get_end_marker(self, track_index: int, clip_index: int) -> float:
+        """Get the end marker position.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            End marker position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/end_marker", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 0.0
+
+    async def get_sample_length(self, track_index: int, clip_index: int) -> float:
+        """Get the sample length of an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Sample length in samples
+        """
+        result = await self._client.query(
+            "/live/clip/get/sample_length", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 0.0
+
+    async def get_is_overdubbing(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is currently overdubbing.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if overdubbing
+        """
+        result = await self._client.query(
+            "/live/clip/get/is_overdubbing", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_is_recording(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip is currently recording.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if recording
+        """
+        result = await self._client.query(
+            "/live/clip/get/is_recording", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_will_record_on_start(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip will start recording when launched.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if will record on start
+        """
+        result = await self._client.query(
+            "/live/clip/get/will_record_on_start", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_launch_mode(self, track_index: int, clip_index: int) -> int:
+        """Get the launch mode of a clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Launch mode (0=Trigger, 1=Gate, 2=Toggle, 3=Repeat)
+        """
+        result = await self._client.query(
+            "/live/clip/get/launch_mode", track_index, clip_index
+        )
+        return int(result[2]) if len(result) > 2 else 0
+
+    async def get_launch_quantization(self, track_index: int, clip_index: int) -> int:
+        """Get the launch quantization of a clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Launch quantization value
+        """
+        result = await self._client.query(
+            "/live/clip/get/launch_quantization", track_index, clip_index
+        )
+        return int(result[2]) if len(result) > 2 else 0
+
+    async def get_file_path(self, track_index: int, clip_index: int) -> str:
+        """Get the file path of an audio clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            File path string, or empty string for MIDI clips
+        """
+        result = await self._client.query(
+            "/live/clip/get/file_path", track_index, clip_index
+        )
+        return str(result[2]) if len(result) > 2 else ""
+
+    async def get_velocity_amount(self, track_index: int, clip_index: int) -> float:
+        """Get the velocity amount scaling for a MIDI clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Velocity amount (0.0-1.0)
+        """
+        result = await self._client.query(
+            "/live/clip/get/velocity_amount", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 1.0
+
+    async def get_legato(self, track_index: int, clip_index: int) -> bool:
+        """Check if legato mode is enabled for a MIDI clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if legato is enabled
+        """
+        result = await self._client.query(
+            "/live/clip/get/legato", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_position(self, track_index: int, clip_index: int) -> float:
+        """Get the loop position of a clip.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            Position in beats
+        """
+        result = await self._client.query(
+            "/live/clip/get/position", track_index, clip_index
+        )
+        return float(result[2]) if len(result) > 2 else 0.0
+
+    async def get_ram_mode(self, track_index: int, clip_index: int) -> bool:
+        """Check if RAM mode is enabled for an audio clip.
+
+        When RAM mode is enabled, the entire clip is loaded into RAM.
+        When disabled, it streams from disk.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if RAM mode is enabled
+        """
+        result = await self._client.query(
+            "/live/clip/get/ram_mode", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+    async def get_has_groove(self, track_index: int, clip_index: int) -> bool:
+        """Check if clip has a groove applied.
+
+        Args:
+            track_index: Track index (0-based)
+            clip_index: Clip/scene index (0-based)
+
+        Returns:
+            True if clip has a groove
+        """
+        result = await self._client.query(
+            "/live/clip/get/has_groove", track_index, clip_index
+        )
+        return bool(result[2]) if len(result) > 2 else False
+
+
+class AsyncDevice(_AsyncWrapper):
+    """Async counterpart of Device; every method is a coroutine."""
+
+    _wrapped = Device
+
+    async def get_name(self, track_index: int, device_index: int) -> str:
+        """Get the device name.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Device name
+        """
+        result = await self._client.query(
+            "/live/device/get/name", track_index, device_index
+        )
+        # Response format: (track_index, device_index, name)
+        return str(result[2]) if len(result) > 2 else ""
+
+    async def get_class_name(self, track_index: int, device_index: int) -> str:
+        """Get the device class name (type).
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Device class name (e.g., "Compressor", "Reverb")
+        """
+        result = await self._client.query(
+            "/live/device/get/class_name", track_index, device_index
+        )
+        # Response format: (track_index, device_index, class_name)
+        return str(result[2]) if len(result) > 2 else ""
+
+    async def get_is_active(self, track_index: int, device_index: int) -> bool:
+        """Check if the device is active (enabled).
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            True if device is active
+        """
+        result = await self._client.query(
+            "/live/device/get/is_active", track_index, device_index
+        )
+        # Response format: (track_index, device_index, is_active)
+        return bool(result[2])
+
+    async def get_num_parameters(self, track_index: int, device_index: int) -> int:
+        """Get the number of parameters on a device.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Number of parameters
+        """
+        result = await self._client.query(
+            "/live/device/get/num_parameters", track_index, device_index
+        )
+        # Response format: (track_index, device_index, num_parameters)
+        return int(result[2])
+
+    async def get_parameter_value(
+        self, track_index: int, device_index: int, parameter_index: int
+    ) -> float:
+        """Get a parameter value.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            parameter_index: Parameter index (0-based)
+
+        Returns:
+            Current parameter value
+        """
+        result = await self._client.query(
+            "/live/device/get/parameter/value",
+            track_index,
+            device_index,
+            parameter_index,
+        )
+        # Response format: (track_index, device_index, parameter_index, value)
+        return float(result[3])
+
+    async def get_parameter_name(
+        self, track_index: int, device_index: int, parameter_index: int
+    ) -> str:
+        """Get a parameter name.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            parameter_index: Parameter index (0-based)
+
+        Returns:
+            Parameter name
+        """
+        result = await self._client.query(
+            "/live/device/get/parameter/name",
+            track_index,
+            device_index,
+            parameter_index,
+        )
+        # Response format: (track_index, device_index, parameter_index, name)
+        return str(result[3]) if len(result) > 3 else ""
+
+    async def get_parameter_min(
+        self, track_index: int, device_index: int, parameter_index: int
+    ) -> float:
+        """Get a parameter's minimum value.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            parameter_index: Parameter index (0-based)
+
+        Returns:
+            Minimum parameter value
+        """
+        result = await self._client.query(
+            "/live/device/get/parameter/min",
+            track_index,
+            device_index,
+            parameter_index,
+        )
+        # Response format: (track_index, device_index, parameter_index, min)
+        return float(result[3])
+
+    async def get_parameter_max(
+        self, track_index: int, device_index: int, parameter_index: int
+    ) -> float:
+        """Get a parameter's maximum value.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            parameter_index: Parameter index (0-based)
+
+        Returns:
+            Maximum parameter value
+        """
+        result = await self._client.query(
+            "/live/device/get/parameter/max",
+            track_index,
+            device_index,
+            parameter_index,
+        )
+        # Response format: (track_index, device_index, parameter_index, max)
+        return float(result[3])
+
+    async def get_parameters(
+        self, track_index: int, device_index: int, strategy: str = "bulk"
+    ) -> list[Parameter]:
+        """Get all parameters for a device.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            strategy: "bulk" sends the four parameters/* queries at once (one
+                      round trip); "per_parameter" queries name, value, min
+                      and max of each parameter in turn (1 + 4n round trips)
+
+        Returns:
+            List of Parameter objects
+
+        Raises:
+            ValueError: If strategy is not one of PARAMETER_STRATEGIES
+        """
+        if strategy == "bulk":
+            return _parameters_from_bulk(
+                await self._client.query_many(
+                    _bulk_parameter_requests(track_index, device_index)
+                )
+            )
+
+        if strategy != "per_parameter":
+            raise ValueError(
+                f"Invalid strategy: {strategy}. Must be one of {PARAMETER_STRATEGIES}"
+            )
+
+        num_params = await self.get_num_parameters(track_index, device_index)
+        parameters = []
+
+        for i in range(num_params):
+            name = await self.get_parameter_name(track_index, device_index, i)
+            value = await self.get_parameter_value(track_index, device_index, i)
+            min_val = await self.get_parameter_min(track_index, device_index, i)
+            max_val = await self.get_parameter_max(track_index, device_index, i)
+            parameters.append(
+                Parameter(index=i, name=name, value=value, min=min_val, max=max_val)
+            )
+
+        return parameters
+
+    async def get_type(self, track_index: int, device_index: int) -> int:
+        """Get the device type.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Device type (0=audio_effect, 1=instrument, 2=midi_effect)
+        """
+        result = await self._client.query(
+            "/live/device/get/type", track_index, device_index
+        )
+        return int(result[2]) if len(result) > 2 else 0
+
+    async def get_parameters_names(self, track_index: int, device_index: int) -> tuple:
+        """Get all parameter names for a device in a single query.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Tuple of parameter names
+        """
+        result = await self._client.query(
+            "/live/device/get/parameters/name", track_index, device_index
+        )
+        # Response format: (track_index, device_index, name1, name2, ...)
+        return result[2:] if len(result) > 2 else ()
+
+    async def get_parameters_values(self, track_index: int, device_index: int) -> tuple:
+        """Get all parameter values for a device in a single query.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Tuple of parameter values
+        """
+        result = await self._client.query(
+            "/live/device/get/parameters/value", track_index, device_index
+        )
+        return result[2:] if len(result) > 2 else ()
+
+    async def get_parameters_mins(self, track_index: int, device_index: int) -> tuple:
+        """Get all parameter minimum values for a device.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Tuple of minimum values
+        """
+        result = await self._client.query(
+            "/live/device/get/parameters/min", track_index, device_index
+        )
+        return result[2:] if len(result) > 2 else ()
+
+    async def get_parameters_maxs(self, track_index: int, device_index: int) -> tuple:
+        """Get all parameter maximum values for a device.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Tuple of maximum values
+        """
+        result = await self._client.query(
+            "/live/device/get/parameters/max", track_index, device_index
+        )
+        return result[2:] if len(result) > 2 else ()
+
+    async def get_parameters_is_quantized(
+        self, track_index: int, device_index: int
+    ) -> tuple:
+        """Get which parameters are quantized (stepped) for a device.
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+
+        Returns:
+            Tuple of booleans indicating if each parameter is quantized
+        """
+        result = await self._client.query(
+            "/live/device/get/parameters/is_quantized", track_index, device_index
+        )
+        return tuple(bool(v) for v in result[2:]) if len(result) > 2 else ()
+
+    async def get_parameter_value_string(
+        self, track_index: int, device_index: int, parameter_index: int
+    ) -> str:
+        """Get a parameter's display string (formatted value with units).
+
+        Args:
+            track_index: Track index (0-based)
+            device_index: Device index on track (0-based)
+            parameter_index: Parameter index (0-based)
+
+        Returns:
+            Formatted parameter value string (e.g., "440 Hz", "-12 dB")
+        """
+        result = await self._client.query(
+            "/live/device/get/parameter/value_string",
+            track_index,
+            device_index,
+            parameter_index,
+        )
+        return str(result[3]) if len(result) > 3 else ""
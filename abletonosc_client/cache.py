@@ -0,0 +1,260 @@
+"""Client-side cache of query responses.
+
+An opt-in layer in front of AbletonOSCClient.query: responses to /get/
+addresses are kept for a per-address TTL, evicted least-recently-used, and
+invalidated when the matching setter is sent or an update for the address
+arrives (e.g. from a start_listen subscription).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Sequence
+
+from abletonosc_client.addresses import index_prefix
+
+# Values that change continuously or during playback are never cached
+VOLATILE_ADDRESSES = (
+    "/live/song/get/beat",
+    "/live/song/get/can_redo",
+    "/live/song/get/can_undo",
+    "/live/song/get/current_song_time",
+    "/live/song/get/is_playing",
+    "/live/song/get/session_record_status",
+    "/live/clip/get/is_playing",
+    "/live/clip/get/is_recording",
+    "/live/clip/get/is_overdubbing",
+    "/live/clip/get/playing_position",
+    "/live/clip_slot/get/is_playing",
+    "/live/clip_slot/get/is_recording",
+    "/live/clip_slot/get/is_triggered",
+    "/live/scene/get/is_triggered",
+    "/live/track/get/fired_slot_index",
+    "/live/track/get/output_meter_level",
+    "/live/track/get/output_meter_left",
+    "/live/track/get/output_meter_right",
+    "/live/track/get/playing_slot_index",
+)
+
+DEFAULT_TTLS = {address: 0.0 for address in VOLATILE_ADDRESSES}
+
+# Bulk getters that also reflect a value changed by a setter
+RELATED_ADDRESSES = {
+    "/live/track/set/name": ("/live/song/get/track_names",),
+    "/live/clip/set/name": ("/live/track/get/clips/name",),
+    "/live/clip/set/color": ("/live/track/get/clips/color",),
+    "/live/device/set/parameter/value": ("/live/device/get/parameters/value",),
+    "/live/device/set/parameters/value": ("/live/device/get/parameter/value",),
+}
+
+# Sends that change what is being observed rather than the set itself
+_PASSIVE_SEGMENTS = ("/start_listen/", "/stop_listen/")
+
+# Other sends that leave the set unchanged (pings, messages, browsing)
+_PASSIVE_ADDRESSES = frozenset(
+    {
+        "/live/test",
+        "/live/api/show_message",
+        "/live/browser/search",
+    }
+)
+_PASSIVE_PREFIXES = ("/live/browser/list_",)
+
+
+def _is_passive(address: str) -> bool:
+    """Check whether a non-get, non-set send leaves cached values valid."""
+    return (
+        address in _PASSIVE_ADDRESSES
+        or address.startswith(_PASSIVE_PREFIXES)
+        or any(s in address for s in _PASSIVE_SEGMENTS)
+    )
+
+
+def _overlaps(a: tuple, b: tuple) -> bool:
+    """Check whether one index tuple is a prefix of the other."""
+    size = min(len(a), len(b))
+    return a[:size] == b[:size]
+
+
+class QueryCache:
+    """LRU cache of query responses with per-address TTLs.
+
+    Only addresses containing "/get/" are cached. Sends invalidate:
+        /live/x/set/prop: cached /live/x/get/prop entries for the same object
+            (plus related bulk getters, see RELATED_ADDRESSES)
+        start_listen/stop_listen, /live/test, status messages and browser
+            listings/searches: nothing
+        anything else (create/delete/duplicate/fire...): the whole cache,
+            since structural edits shift indices
+    Any incoming message on a cached address invalidates entries for the
+    object it refers to.
+
+    Example:
+        client.cache = QueryCache(default_ttl=0.5)
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 1.0,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 4096,
+    ):
+        """Create a cache.
+
+        Args:
+            default_ttl: Seconds to keep a response (0 disables caching)
+            ttls: Per-address TTL overrides, merged over DEFAULT_TTLS
+            max_entries: Maximum cached responses before LRU eviction
+        """
+        self.default_ttl = default_ttl
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # {(address, args): (expires_at, result)}, oldest first
+        self._entries: OrderedDict[tuple[str, tuple], tuple[float, tuple]] = (
+            OrderedDict()
+        )
+        # {address: set of cached args}
+        self._by_address: dict[str, set[tuple]] = {}
+        # {address: {args: [generation, queries]}} for queries awaiting a
+        # response; invalidating one bumps its generation so the response,
+        # read before the change, is not stored
+        self._in_flight: dict[str, dict[tuple, list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, address: str) -> float:
+        """Return the TTL in seconds for an address (0 = not cached)."""
+        if "/get/" not in address:
+            return 0.0
+        return self.ttls.get(address, self.default_ttl)
+
+    def get(self, address: str, args: Sequence[Any]) -> tuple | None:
+        """Return a cached response, or None on a miss or expiry."""
+        key = (address, tuple(args))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def begin(self, address: str, args: Sequence[Any]) -> int:
+        """Record a query about to be sent; pair with end() once it is done.
+
+        Returns:
+            Generation of the query, to pass to put()
+        """
+        if self.ttl_for(address) <= 0:
+            return 0
+        with self._lock:
+            entry = self._in_flight.setdefault(address, {}).setdefault(
+                tuple(args), [0, 0]
+            )
+            entry[1] += 1
+            return entry[0]
+
+    def end(self, address: str, args: Sequence[Any]) -> None:
+        """Stop tracking a query registered with begin()."""
+        args = tuple(args)
+        with self._lock:
+            in_flight = self._in_flight.get(address)
+            entry = None if in_flight is None else in_flight.get(args)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if not entry[1]:
+                del in_flight[args]
+                if not in_flight:
+                    del self._in_flight[address]
+
+    def put(
+        self,
+        address: str,
+        args: Sequence[Any],
+        result: tuple,
+        generation: int | None = None,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            address: Queried address
+            args: Query arguments
+            result: Response arguments
+            generation: Value of begin() for the query; the result is
+                        dropped if the query was invalidated since
+        """
+        ttl = self.ttl_for(address)
+        if ttl <= 0:
+            return
+        key = (address, tuple(args))
+        with self._lock:
+            if generation is not None:
+                entry = self._in_flight.get(address, {}).get(key[1])
+                if entry is None or entry[0] != generation:
+                    return
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            self._by_address.setdefault(address, set()).add(key[1])
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, address: str, indices: tuple | None = None) -> None:
+        """Drop cached responses for an address.
+
+        Args:
+            address: Cached (/get/) address
+            indices: Only drop entries for this object (entries whose index
+                     arguments overlap these); None drops all
+        """
+        with self._lock:
+            for args, entry in self._in_flight.get(address, {}).items():
+                if indices is None or _overlaps(index_prefix(args), indices):
+                    entry[0] += 1
+            cached = self._by_address.get(address)
+            if not cached:
+                return
+            for args in list(cached):
+                if indices is None or _overlaps(index_prefix(args), indices):
+                    self._remove((address, args))
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            for in_flight in self._in_flight.values():
+                for entry in in_flight.values():
+                    entry[0] += 1
+            self._entries.clear()
+            self._by_address.clear()
+
+    def on_send(self, address: str, args: Sequence[Any]) -> None:
+        """Invalidate entries affected by an outgoing message."""
+        if "/set/" in address:
+            self.invalidate(address.replace("/set/", "/get/", 1), index_prefix(args))
+            for related in RELATED_ADDRESSES.get(address, ()):
+                self.invalidate(related)
+        elif "/get/" in address or _is_passive(address):
+            return
+        else:
+            self.clear()
+
+    def on_message(self, address: str, args: Sequence[Any]) -> None:
+        """Invalidate entries an incoming update refers to."""
+        if address in self._by_address or address in self._in_flight:
+            self.invalidate(address, index_prefix(args))
+
+    def _remove(self, key: tuple[str, tuple]) -> None:
+        self._entries.pop(key, None)
+        cached = self._by_address.get(key[0])
+        if cached is not None:
+            cached.discard(key[1])
+            if not cached:
+                del self._by_address[key[0]]
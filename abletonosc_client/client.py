@@ -1,11 +1,251 @@
 """Core OSC transport layer for AbletonOSC communication."""
 
+import itertools
+import queue
 import threading
-from typing import Any, Callable
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from pythonosc import udp_client
 from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import ThreadingOSCUDPServer
+from pythonosc.osc_server import BlockingOSCUDPServer, ThreadingOSCUDPServer
+
+from abletonosc_client.addresses import index_prefix
+from abletonosc_client.cache import QueryCache
+from abletonosc_client.encoding import (
+    DEFAULT_MAX_DATAGRAM_SIZE,
+    build_message,
+    pack_bundles,
+)
+from abletonosc_client.metrics import ClientMetrics
+from abletonosc_client.ratelimit import RateLimiter
+from abletonosc_client.retry import RetryPolicy
+from abletonosc_client.router import ListenerRouter
+
+logger = logging.getLogger(__name__)
+
+RECEIVE_MODES = ("threading", "single")
+
+
+class _PendingQuery:
+    """A query waiting for its response."""
+
+    __slots__ = ("address", "key", "seq", "sent", "event", "result")
+
+    def __init__(self, address: str, key: tuple):
+        self.address = address
+        self.key = key
+        self.seq = 0
+        # perf_counter() of the first send, when metrics are enabled
+        self.sent = 0.0
+        self.event = threading.Event()
+        self.result: list = []
+
+
+class _PendingTable:
+    """Correlates incoming responses with in-flight queries.
+
+    Queries are keyed by address plus their index arguments, with a FIFO per
+    key so identical concurrent queries are answered in send order. Responses
+    that don't echo any query's indices (e.g. /live/song/get/track_names) go
+    to the oldest query on the address they are compatible with: one without
+    indices, or one whose indices they cannot be an echo of.
+
+    Queries that were resent may be answered more than once; expect_late()
+    records how many more answers to drop once such a query is done.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {address: {index_key: deque[pending]}}
+        self._queues: dict[str, dict[tuple, deque]] = {}
+        # {address: {key_length: number of keys with that length}}
+        self._lengths: dict[str, dict[int, int]] = {}
+        self._seq = itertools.count()
+        # {address: {index_key: [answers still expected, expiry]}} of resent
+        # queries that are done
+        self._late: dict[str, dict[tuple, list]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(
+                len(q) for queues in self._queues.values() for q in queues.values()
+            )
+
+    def add(self, pending) -> None:
+        """Register a pending query (must have address, key and seq slots)."""
+        with self._lock:
+            pending.seq = next(self._seq)
+            queues = self._queues.setdefault(pending.address, {})
+            queue = queues.get(pending.key)
+            if queue is None:
+                queue = queues[pending.key] = deque()
+                lengths = self._lengths.setdefault(pending.address, {})
+                size = len(pending.key)
+                lengths[size] = lengths.get(size, 0) + 1
+            queue.append(pending)
+
+    def discard(self, pending) -> None:
+        """Remove a pending query if it has not been answered yet."""
+        with self._lock:
+            queues = self._queues.get(pending.address)
+            if queues is None or pending.key not in queues:
+                return
+            queue = queues[pending.key]
+            try:
+                queue.remove(pending)
+            except ValueError:
+                return
+            if not queue:
+                self._drop_key(pending.address, pending.key)
+
+    def pop_match(self, address: str, args: Sequence[Any]):
+        """Remove and return the pending query a response belongs to.
+
+        Args:
+            address: OSC address of the response
+            args: Response arguments
+
+        Returns:
+            The matched pending query, or None if nothing is waiting for it
+        """
+        with self._lock:
+            queues = self._queues.get(address)
+            if not queues:
+                return None
+
+            # Echoed indices: most specific key first
+            for size in sorted(self._lengths[address], reverse=True):
+                key = tuple(args[:size])
+                if size and len(key) == size and key in queues:
+                    return self._pop(address, key)
+
+            # No echoed indices: answer the oldest query, by send order, that
+            # this response cannot be confused with (e.g. a listener update
+            # for another track)
+            echoed = len(index_prefix(args))
+            oldest_key = None
+            oldest_seq = None
+            for key, queue in queues.items():
+                if (not key or echoed < len(key)) and (
+                    oldest_seq is None or queue[0].seq < oldest_seq
+                ):
+                    oldest_key, oldest_seq = key, queue[0].seq
+            if oldest_key is None:
+                return None
+            return self._pop(address, oldest_key)
+
+    def expect_late(self, pending, count: int, window: float) -> None:
+        """Drop up to count more answers to a finished query.
+
+        Args:
+            pending: The finished query
+            count: Late answers to expect (one per send still unanswered)
+            window: Seconds after which late answers are no longer expected
+        """
+        with self._lock:
+            late = self._late.setdefault(pending.address, {})
+            entry = late.get(pending.key)
+            expires = time.monotonic() + window
+            if entry is None:
+                late[pending.key] = [count, expires]
+            else:
+                entry[0] += count
+                entry[1] = max(entry[1], expires)
+
+    def pop_late(self, address: str, args: Sequence[Any]) -> bool:
+        """Check whether an unmatched response is a late answer to drop.
+
+        Args:
+            address: OSC address of the response
+            args: Response arguments
+
+        Returns:
+            True if the response answers a finished, resent query
+        """
+        if not self._late:
+            return False
+        with self._lock:
+            late = self._late.get(address)
+            if not late:
+                return False
+            now = time.monotonic()
+            for key, entry in list(late.items()):
+                if entry[1] <= now:
+                    del late[key]
+                elif tuple(args[: len(key)]) == key:
+                    entry[0] -= 1
+                    if not entry[0]:
+                        del late[key]
+                    break
+            else:
+                entry = None
+            if not late:
+                del self._late[address]
+            return entry is not None
+
+    def _pop(self, address: str, key: tuple):
+        queue = self._queues[address][key]
+        pending = queue.popleft()
+        if not queue:
+            self._drop_key(address, key)
+        return pending
+
+    def _drop_key(self, address: str, key: tuple) -> None:
+        del self._queues[address][key]
+        lengths = self._lengths[address]
+        lengths[len(key)] -= 1
+        if not lengths[len(key)]:
+            del lengths[len(key)]
+        if not self._queues[address]:
+            del self._queues[address]
+            del self._lengths[address]
+
+
+class _CallbackPool:
+    """Runs listener callbacks off the receive thread.
+
+    Each address is pinned to one worker so its callbacks stay in order.
+    Queues are bounded: when a worker falls behind, the receive thread blocks
+    until there is room rather than buffering without limit.
+    """
+
+    def __init__(self, workers: int, queue_size: int = 1024):
+        self._queues: list[queue.Queue] = [
+            queue.Queue(queue_size) for _ in range(workers)
+        ]
+        self._threads = [
+            threading.Thread(target=self._run, args=(q,), daemon=True)
+            for q in self._queues
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, callback: Callable, address: str, args: tuple) -> None:
+        """Queue a callback invocation on the worker owning the address."""
+        self._queues[hash(address) % len(self._queues)].put((callback, address, args))
+
+    @staticmethod
+    def _run(work: queue.Queue) -> None:
+        while True:
+            item = work.get()
+            if item is None:
+                return
+            callback, address, args = item
+            try:
+                callback(address, *args)
+            except Exception:
+                logger.exception("Listener callback for %s failed", address)
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the workers once queued callbacks have run."""
+        for work in self._queues:
+            work.put(None)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
 
 
 class AbletonOSCClient:
@@ -13,6 +253,33 @@ class AbletonOSCClient:
 
     Handles sending messages and receiving responses via UDP.
     Default ports: send to 11000, receive on 11001.
+
+    Receive modes:
+        "threading": a new thread per incoming datagram (default).
+        "single": one receive thread decodes and dispatches every datagram in
+            arrival order. Listener callbacks run on that thread unless
+            callback_workers is set, so a callback must not call query()
+            without workers.
+
+    Set `cache` to a QueryCache to answer repeated /get/ queries locally
+    (see abletonosc_client.cache for the invalidation rules).
+
+    Set `retry` to a RetryPolicy to resend /get/ queries whose request or
+    response was lost (see abletonosc_client.retry).
+
+    Set `metrics` to a ClientMetrics to record per-address counts, bytes,
+    latency and timeouts (see abletonosc_client.metrics).
+
+    Set `rate_limit` to a RateLimiter to hold back messages beyond Live's
+    budget for structural edits, writes and reads; the sending thread blocks
+    until the budget refills (see abletonosc_client.ratelimit).
+
+    The wrappers' on_* listeners subscribe through `router`, so any number
+    of them can watch the same property (see abletonosc_client.router).
+
+    Set `send_from_receive_port` to send requests from the receive socket,
+    for servers that reply to the sender's port rather than a fixed one
+    (several clients can then share a server, see ClientPool).
     """
 
     def __init__(
@@ -21,28 +288,67 @@ class AbletonOSCClient:
         send_port: int = 11000,
         receive_port: int = 11001,
         listen_host: str | None = None,
+        receive_mode: str = "threading",
+        callback_workers: int = 0,
+        max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+        cache: QueryCache | None = None,
+        retry: RetryPolicy | None = None,
+        metrics: ClientMetrics | None = None,
+        send_from_receive_port: bool = False,
+        rate_limit: RateLimiter | None = None,
     ):
+        if receive_mode not in RECEIVE_MODES:
+            raise ValueError(
+                f"Invalid receive mode: {receive_mode}. Must be one of {RECEIVE_MODES}"
+            )
+
         self.host = host
         self.send_port = send_port
         self.receive_port = receive_port
         # For WSL2->Windows: send to remote host, listen on local interface
         self.listen_host = listen_host if listen_host is not None else host
+        self.receive_mode = receive_mode
+        # Largest datagram to emit when bundling or chunking
+        self.max_datagram_size = max_datagram_size
+        # Optional response cache in front of query()
+        self.cache = cache
+        # Optional resending of lost queries
+        self.retry = retry
+        # Optional per-address instrumentation
+        self.metrics = metrics
+        # Optional outbound budgets
+        self.rate_limit = rate_limit
 
         # Outbound client
         self._client = udp_client.SimpleUDPClient(host, send_port)
+        # Per-thread bundle state (see bundle())
+        self._local = threading.local()
 
         # Response handling
-        self._pending_responses: dict[str, tuple[threading.Event, list]] = {}
+        self._pending = _PendingTable()
         self._listeners: dict[str, Callable] = {}
+        # Subscriptions of the wrappers' on_* listeners
+        self.router = ListenerRouter(self)
 
         # Set up dispatcher and server for receiving
         self._dispatcher = Dispatcher()
         self._dispatcher.set_default_handler(self._handle_response)
 
-        self._server = ThreadingOSCUDPServer(
+        self._callback_pool = (
+            _CallbackPool(callback_workers) if callback_workers > 0 else None
+        )
+
+        server_class = (
+            ThreadingOSCUDPServer if receive_mode == "threading" else BlockingOSCUDPServer
+        )
+        self._server = server_class(
             (self.listen_host, receive_port),
             self._dispatcher,
         )
+        # Socket requests are sent from
+        self._send_socket = (
+            self._server.socket if send_from_receive_port else self._client._sock
+        )
         self._server_thread = threading.Thread(target=self._server.serve_forever)
         self._server_thread.daemon = True
         self._server_thread.start()
@@ -53,14 +359,29 @@ class AbletonOSCClient:
         Routes to pending query responses or registered listeners.
         """
         # Check if this is a response to a pending query
-        if address in self._pending_responses:
-            event, result = self._pending_responses[address]
-            result.extend(args)
-            event.set()
+        pending = self._pending.pop_match(address, args)
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.on_receive(address, args)
+            if pending is not None and pending.sent:
+                metrics.on_response(pending.address, pending.sent)
+        if pending is None and self._pending.pop_late(address, args):
+            # Another answer to a query that was resent
+            return
+        if pending is not None:
+            pending.result.extend(args)
+            pending.event.set()
+        elif self.cache is not None:
+            # Unsolicited update (e.g. a listener): cached value is stale
+            self.cache.on_message(address, args)
 
         # Check if there's a listener registered
-        if address in self._listeners:
-            self._listeners[address](address, *args)
+        callback = self._listeners.get(address)
+        if callback is not None:
+            if self._callback_pool is not None:
+                self._callback_pool.submit(callback, address, args)
+            else:
+                callback(address, *args)
 
     def send(self, address: str, *args: Any) -> None:
         """Send an OSC message (fire-and-forget).
@@ -69,15 +390,99 @@ class AbletonOSCClient:
             address: OSC address pattern (e.g., "/live/song/set/tempo")
             *args: Arguments to send with the message
         """
-        self._client.send_message(address, list(args) if args else [])
+        if self.rate_limit is not None:
+            self.rate_limit.acquire(address)
+        if self.cache is not None:
+            self.cache.on_send(address, args)
+        message = build_message(address, args)
+        if self.metrics is not None:
+            self.metrics.on_send(address, len(message))
+        pending = getattr(self._local, "bundle", None)
+        if pending is not None:
+            pending.append(message)
+        else:
+            self._send_datagram(message)
+
+    def _send_datagram(self, datagram: bytes) -> None:
+        """Send an encoded message or bundle."""
+        self._send_socket.sendto(datagram, (self.host, self.send_port))
+
+    def _send_query(self, pending: _PendingQuery, message: bytes) -> None:
+        """Send (or resend) a registered query's encoded request."""
+        if self.rate_limit is not None:
+            self.rate_limit.acquire(pending.address)
+        metrics = self.metrics
+        if metrics is not None:
+            if not pending.sent:
+                pending.sent = time.perf_counter()
+            metrics.on_send(pending.address, len(message))
+        self._send_datagram(message)
+
+    @contextmanager
+    def bundle(self) -> Iterator[None]:
+        """Group send() calls made on this thread into OSC bundles.
+
+        Messages sent inside the block are packed into as few datagrams as
+        possible (each at most max_datagram_size bytes) and sent, in order,
+        when the outermost block exits. Queries made inside the block flush
+        pending messages first, so they observe earlier sends.
+
+        Example:
+            with client.bundle():
+                for i, name in enumerate(names):
+                    track.set_name(i, name)
+        """
+        owner = getattr(self._local, "bundle", None) is None
+        if owner:
+            self._local.bundle = []
+        try:
+            yield
+        finally:
+            if owner:
+                try:
+                    self.flush()
+                finally:
+                    self._local.bundle = None
+
+    def flush(self) -> None:
+        """Send messages accumulated by the current thread's bundle() block.
+
+        Does nothing outside a bundle() block.
+        """
+        pending = getattr(self._local, "bundle", None)
+        if not pending:
+            return
+        self._local.bundle = []
+        for datagram in pack_bundles(pending, self.max_datagram_size):
+            self._send_datagram(datagram)
+
+    def barrier(self, timeout: float = 2.0) -> None:
+        """Wait until Live has processed every message sent so far.
+
+        AbletonOSC handles messages in arrival order on Live's main thread,
+        so once a /live/test sent after them is answered, earlier sends
+        (including this thread's pending bundle, flushed first) are applied.
+
+        Args:
+            timeout: How long to wait for the answer in seconds
+
+        Raises:
+            TimeoutError: If Live does not answer within timeout
+        """
+        self.query("/live/test", timeout=timeout)
 
     def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
         """Send an OSC message and wait for response.
 
+        Safe to call from several threads at once: responses are matched to
+        queries by address and echoed index arguments, so concurrent queries
+        for different tracks/clips/devices on the same address don't collide.
+
         Args:
             address: OSC address pattern (e.g., "/live/song/get/tempo")
             *args: Arguments to send with the message
-            timeout: How long to wait for response in seconds
+            timeout: How long to wait for response in seconds, including
+                     any resends under the retry policy
 
         Returns:
             Tuple of response arguments
@@ -85,24 +490,158 @@ class AbletonOSCClient:
         Raises:
             TimeoutError: If no response received within timeout
         """
-        event = threading.Event()
-        result: list = []
+        cache = self.cache
+        if cache is not None:
+            # Queries like /live/track/insert_device change the set too
+            cache.on_send(address, args)
+            cached = cache.get(address, args)
+            if cached is not None:
+                return cached
+            generation = cache.begin(address, args)
+
+        pending = _PendingQuery(address, index_prefix(args))
 
         # Register for response
-        self._pending_responses[address] = (event, result)
+        self._pending.add(pending)
 
         try:
-            # Send the query
-            self._client.send_message(address, list(args) if args else [])
+            # Send the query, after anything still waiting in a bundle
+            self.flush()
+            message = build_message(address, args)
+            self._send_query(pending, message)
 
             # Wait for response
-            if not event.wait(timeout):
+            if not self._await_responses([pending], [message], timeout):
+                if self.metrics is not None:
+                    self.metrics.on_timeout(address)
                 raise TimeoutError(f"No response for {address} within {timeout}s")
 
-            return tuple(result)
+            result = tuple(pending.result)
+            if cache is not None:
+                cache.put(address, args, result, generation)
+            return result
+        finally:
+            # Cleanup (no-op if the response already claimed it)
+            self._pending.discard(pending)
+            if cache is not None:
+                cache.end(address, args)
+
+    def _await_responses(
+        self,
+        pendings: Sequence[_PendingQuery],
+        messages: Sequence[bytes],
+        timeout: float,
+    ) -> bool:
+        """Wait for sent queries, resending lost ones per the retry policy.
+
+        Args:
+            pendings: Registered queries
+            messages: Encoded request for each query, for resending
+            timeout: Overall deadline in seconds
+
+        Returns:
+            True if every query was answered before the deadline
+        """
+        policy = self.retry
+        if policy is not None:
+            timeout = policy.limit(timeout)
+        deadline = time.monotonic() + timeout
+        retryable = [
+            policy is not None and policy.should_retry(p.address) for p in pendings
+        ]
+        waits = policy.waits() if any(retryable) else iter(())
+        resends = [0] * len(pendings)
+
+        while True:
+            wait = next(waits, None)
+            stop = deadline if wait is None else min(time.monotonic() + wait, deadline)
+            answered = all(
+                p.event.wait(max(stop - time.monotonic(), 0.0)) for p in pendings
+            )
+            if answered or wait is None or time.monotonic() >= deadline:
+                break
+            for i, pending in enumerate(pendings):
+                if retryable[i] and not pending.event.is_set():
+                    self._send_query(pending, messages[i])
+                    resends[i] += 1
+
+        for i, pending in enumerate(pendings):
+            if retryable[i]:
+                policy.record(resends[i], pending.event.is_set())
+            if resends[i]:
+                # Every send that didn't produce the answer may still do so
+                late = resends[i] + (not pending.event.is_set())
+                self._pending.expect_late(pending, late, policy.max_timeout)
+        return answered
+
+    def query_many(
+        self,
+        requests: Iterable[tuple[str, Sequence[Any]]],
+        timeout: float = 2.0,
+    ) -> list[tuple]:
+        """Send several queries back-to-back and wait for all responses.
+
+        All requests are sent before waiting on any of them, so the total cost
+        is roughly one round trip plus Live's processing time rather than one
+        round trip per request.
+
+        Args:
+            requests: (address, args) pairs, e.g. [("/live/track/get/name", (0,))]
+            timeout: Overall deadline for all responses in seconds
+
+        Returns:
+            List of response tuples, in the same order as requests
+
+        Raises:
+            TimeoutError: If any response is not received within timeout
+        """
+        batch = [(address, tuple(args)) for address, args in requests]
+        results: list[tuple | None] = [None] * len(batch)
+        cache = self.cache
+        if cache is not None:
+            for address, args in batch:
+                cache.on_send(address, args)
+            results = [cache.get(address, args) for address, args in batch]
+            if all(result is not None for result in results):
+                return results
+        # Only send the requests the cache couldn't answer
+        misses = [i for i, result in enumerate(results) if result is None]
+        generations = [
+            None if cache is None else cache.begin(*batch[i]) for i in misses
+        ]
+        pendings = [
+            _PendingQuery(batch[i][0], index_prefix(batch[i][1])) for i in misses
+        ]
+        for pending in pendings:
+            self._pending.add(pending)
+
+        try:
+            self.flush()
+            messages = [build_message(*batch[i]) for i in misses]
+            for pending, message in zip(pendings, messages):
+                self._send_query(pending, message)
+
+            if not self._await_responses(pendings, messages, timeout):
+                missing = [p for p in pendings if not p.event.is_set()]
+                if self.metrics is not None:
+                    for pending in missing:
+                        self.metrics.on_timeout(pending.address)
+                raise TimeoutError(
+                    f"No response for {len(missing)} of {len(pendings)} queries "
+                    f"(first: {missing[0].address}) within {timeout}s"
+                )
+
+            for i, pending, generation in zip(misses, pendings, generations):
+                results[i] = tuple(pending.result)
+                if cache is not None:
+                    cache.put(*batch[i], results[i], generation)
+            return results
         finally:
-            # Cleanup
-            self._pending_responses.pop(address, None)
+            for pending in pendings:
+                self._pending.discard(pending)
+            if cache is not None:
+                for i in misses:
+                    cache.end(*batch[i])
 
     def start_listener(self, address: str, callback: Callable) -> None:
         """Register a callback for messages at an address.
@@ -125,3 +664,7 @@ class AbletonOSCClient:
         """Cleanup resources and stop the server."""
         self._server.shutdown()
         self._server_thread.join(timeout=1.0)
+        self._server.server_close()
+        self._client._sock.close()
+        if self._callback_pool is not None:
+            self._callback_pool.shutdown()
@@ -3,27 +3,12 @@
 Covers /live/clip/* endpoints for individual clip control and note editing.
 """
 
-from typing import Callable, NamedTuple
+from typing import Callable
 
 from abletonosc_client.client import AbletonOSCClient
-
-
-class Note(NamedTuple):
-    """Represents a MIDI note in a clip.
-
-    Attributes:
-        pitch: MIDI pitch (0-127)
-        start_time: Start position in beats
-        duration: Duration in beats
-        velocity: Velocity (0-127)
-        mute: Whether the note is muted
-    """
-
-    pitch: int
-    start_time: float
-    duration: float
-    velocity: int
-    mute: bool = False
+from abletonosc_client.encoding import chunk_arguments
+from abletonosc_client.notes import Note, NoteArray
+from abletonosc_client.router import Subscription
 
 
 class Clip:
@@ -31,10 +16,8 @@ class Clip:
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
-        # Listener callbacks: {"property": {(track_idx, clip_idx): callback}}
-        self._clip_callbacks: dict[str, dict[tuple[int, int], Callable]] = {}
-        # Set of properties with dispatchers registered
-        self._dispatcher_registered: set[str] = set()
+        # Listener subscriptions: {("property", track_idx, clip_idx): subscription}
+        self._subscriptions: dict[tuple[str, int, int], Subscription] = {}
 
     # Name
 
@@ -172,51 +155,66 @@ class Clip:
 
     # Notes (MIDI clips only)
 
-    def get_notes(self, track_index: int, clip_index: int) -> list[Note]:
+    def get_notes(
+        self, track_index: int, clip_index: int, as_array: bool = False
+    ) -> list[Note] | NoteArray:
         """Get all notes from a MIDI clip.
 
         Args:
             track_index: Track index (0-based)
             clip_index: Clip/scene index (0-based)
+            as_array: Return a columnar NoteArray instead of Note objects
 
         Returns:
-            List of Note objects
+            List of Note objects, or a NoteArray if as_array is True
         """
         result = self._client.query("/live/clip/get/notes", track_index, clip_index)
-        notes = []
-
-        # Result format: (track_index, scene_index, pitch, start_time, duration, velocity, mute, ...)
-        # Skip first 2 values (indices), then each note is 5 values
-        if result and len(result) > 2:
-            values = list(result)[2:]  # Skip track_index, scene_index
-            for i in range(0, len(values), 5):
-                if i + 4 < len(values):
-                    notes.append(
-                        Note(
-                            pitch=int(values[i]),
-                            start_time=float(values[i + 1]),
-                            duration=float(values[i + 2]),
-                            velocity=int(values[i + 3]),
-                            mute=bool(values[i + 4]),
-                        )
-                    )
-        return notes
+        return _notes_from_response(result, as_array)
 
-    def add_notes(self, track_index: int, clip_index: int, notes: list[Note]) -> None:
+    def add_notes(
+        self, track_index: int, clip_index: int, notes: list[Note] | NoteArray
+    ) -> int:
         """Add notes to a MIDI clip.
 
+        Large note lists are split across several /live/clip/add/notes
+        messages, each sized from its encoded length to fit the client's
+        max_datagram_size. Inside client.bundle() the chunks are packed
+        together with the other bundled sends.
+
         Args:
             track_index: Track index (0-based)
             clip_index: Clip/scene index (0-based)
-            notes: List of Note objects to add
-        """
-        # Build flat list: pitch, start_time, duration, velocity, mute for each note
-        args = [track_index, clip_index]
-        for note in notes:
-            args.extend(
-                [note.pitch, note.start_time, note.duration, note.velocity, int(note.mute)]
-            )
-        self._client.send("/live/clip/add/notes", *args)
+            notes: List of Note objects, or a NoteArray, to add
+
+        Returns:
+            Number of notes sent
+        """
+        # pitch, start_time, duration, velocity, mute for each note
+        if isinstance(notes, NoteArray):
+            values = notes.rows()
+        else:
+            values = [
+                (
+                    int(note.pitch),
+                    float(note.start_time),
+                    float(note.duration),
+                    int(note.velocity),
+                    int(note.mute),
+                )
+                for note in notes
+            ]
+        chunks = chunk_arguments(
+            "/live/clip/add/notes",
+            (track_index, clip_index),
+            values,
+            self._client.max_datagram_size,
+        )
+        for chunk in chunks:
+            args = [track_index, clip_index]
+            for note_values in chunk:
+                args.extend(note_values)
+            self._client.send("/live/clip/add/notes", *args)
+        return len(values)
 
     def remove_notes(
         self,
@@ -241,10 +239,10 @@ class Clip:
             "/live/clip/remove/notes",
             track_index,
             clip_index,
-            start_time,
             pitch_start,
-            end_time - start_time,  # duration
             pitch_end - pitch_start + 1,  # pitch span
+            start_time,
+            end_time - start_time,  # duration
         )
 
     # Loop settings
@@ -984,29 +982,6 @@ class Clip:
 
     # Listener infrastructure
 
-    def _make_dispatcher(self, prop: str, converter: Callable) -> Callable:
-        """Create a dispatcher that routes callbacks by (track_index, clip_index).
-
-        Args:
-            prop: Property name (e.g., "playing_position")
-            converter: Function to convert the value (e.g., float, bool)
-
-        Returns:
-            Dispatcher function for the OSC callback
-        """
-
-        def dispatcher(addr, *args):
-            # Response format: (track_index, clip_index, value)
-            track_index = int(args[0])
-            clip_index = int(args[1])
-            value = converter(args[2])
-            key = (track_index, clip_index)
-            if prop in self._clip_callbacks:
-                if key in self._clip_callbacks[prop]:
-                    self._clip_callbacks[prop][key](track_index, clip_index, value)
-
-        return dispatcher
-
     def _start_clip_listener(
         self,
         track_index: int,
@@ -1024,24 +999,20 @@ class Clip:
             callback: Function(track_index, clip_index, value) to call on change
             converter: Function to convert the value
         """
-        # Initialize callback dict for this property if needed
-        if prop not in self._clip_callbacks:
-            self._clip_callbacks[prop] = {}
-
-        # Register callback for this clip
-        key = (track_index, clip_index)
-        self._clip_callbacks[prop][key] = callback
-
-        # Register dispatcher if not already done for this property
-        if prop not in self._dispatcher_registered:
-            response_addr = f"/live/clip/get/{prop}"
-            self._client.start_listener(
-                response_addr, self._make_dispatcher(prop, converter)
-            )
-            self._dispatcher_registered.add(prop)
-
-        # Tell AbletonOSC to start sending updates for this clip
-        self._client.send(f"/live/clip/start_listen/{prop}", track_index, clip_index)
+        router = self._client.router
+        # Response format: (track_index, clip_index, value)
+        subscription = router.subscribe(
+            f"/live/clip/get/{prop}",
+            (track_index, clip_index),
+            lambda t, c, value, *_: callback(int(t), int(c), converter(value)),
+        )
+        # Replace this wrapper's previous callback (after subscribing, so
+        # AbletonOSC isn't told to stop and restart)
+        key = (prop, track_index, clip_index)
+        previous = self._subscriptions.get(key)
+        self._subscriptions[key] = subscription
+        if previous is not None:
+            router.unsubscribe(previous)
 
     def _stop_clip_listener(
         self, track_index: int, clip_index: int, prop: str
@@ -1053,19 +1024,10 @@ class Clip:
             clip_index: Clip/scene index (0-based)
             prop: Property name
         """
-        # Tell AbletonOSC to stop sending updates for this clip
-        self._client.send(f"/live/clip/stop_listen/{prop}", track_index, clip_index)
-
-        # Remove callback
-        key = (track_index, clip_index)
-        if prop in self._clip_callbacks:
-            self._clip_callbacks[prop].pop(key, None)
-
-            # If no more callbacks for this property, unregister dispatcher
-            if not self._clip_callbacks[prop]:
-                response_addr = f"/live/clip/get/{prop}"
-                self._client.stop_listener(response_addr)
-                self._dispatcher_registered.discard(prop)
+        # AbletonOSC stops sending updates once no subscriber is left
+        subscription = self._subscriptions.pop((prop, track_index, clip_index), None)
+        if subscription is not None:
+            self._client.router.unsubscribe(subscription)
 
     # Playing position listener
 
@@ -1096,3 +1058,28 @@ class Clip:
             clip_index: Clip/scene index (0-based)
         """
         self._stop_clip_listener(track_index, clip_index, "playing_position")
+
+
+def _notes_from_response(result: tuple, as_array: bool) -> list[Note] | NoteArray:
+    """Parse a /live/clip/get/notes response (see Clip.get_notes)."""
+    if as_array:
+        return NoteArray.from_flat(result[2:])
+
+    notes = []
+
+    # Result format: (track_index, scene_index, pitch, start_time, duration, velocity, mute, ...)
+    # Skip first 2 values (indices), then each note is 5 values
+    if result and len(result) > 2:
+        values = list(result)[2:]  # Skip track_index, scene_index
+        for i in range(0, len(values), 5):
+            if i + 4 < len(values):
+                notes.append(
+                    Note(
+                        pitch=int(values[i]),
+                        start_time=float(values[i + 1]),
+                        duration=float(values[i + 2]),
+                        velocity=int(values[i + 3]),
+                        mute=bool(values[i + 4]),
+                    )
+                )
+    return notes
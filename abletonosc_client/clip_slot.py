@@ -4,6 +4,7 @@ Covers /live/clip_slot/* endpoints for clip slot management.
 """
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.waiting import wait_until
 
 
 class ClipSlot:
@@ -42,6 +43,32 @@ class ClipSlot:
             "/live/clip_slot/create_clip", track_index, scene_index, float(length)
         )
 
+    def create_clip_and_wait(
+        self,
+        track_index: int,
+        scene_index: int,
+        length: float = 4.0,
+        timeout: float = 5.0,
+    ) -> None:
+        """Create a new MIDI clip and wait until the slot holds it.
+
+        Args:
+            track_index: Track index (0-based)
+            scene_index: Scene index (0-based)
+            length: Clip length in beats (default: 4.0)
+            timeout: How long to wait for the clip in seconds
+
+        Raises:
+            TimeoutError: If the slot is still empty after timeout
+        """
+        self.create_clip(track_index, scene_index, length)
+        wait_until(
+            lambda: self.has_clip(track_index, scene_index),
+            bool,
+            timeout=timeout,
+            description=f"clip in slot {track_index}/{scene_index}",
+        )
+
     def delete_clip(self, track_index: int, scene_index: int) -> None:
         """Delete the clip in the slot.
 
@@ -0,0 +1,176 @@
+"""Coalescing of high-rate property writes.
+
+A CoalescingWriter sits in front of a client and holds back /set/ messages:
+for each property of each object it keeps only the latest value, and a
+background thread sends what changed at a fixed rate. Automation driven at
+any rate (an LFO at 1 kHz, a controller) then costs at most one message per
+property per flush, e.g.:
+
+    with CoalescingWriter(client, rate=100.0) as writer:
+        track = Track(writer)
+        for value in lfo():
+            track.set_volume(0, value)  # sent at most 100 times a second
+
+Other sends (fire, create_clip...) and queries first flush the held values,
+so everything reaches Live in the order it was issued.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from abletonosc_client.addresses import index_count, split_property
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import ListenerRouter
+
+
+def _write_key(address: str, args: Sequence[Any]) -> tuple | None:
+    """Return the (address, indices) a /set/ message overwrites, or None."""
+    parts = split_property(address)
+    if parts is None or parts[1] != "set":
+        return None
+    return (address, tuple(args[: index_count(parts[0], parts[2])]))
+
+
+class CoalescingWriter:
+    """Client wrapper that sends only the latest value of each property.
+
+    Attributes:
+        submitted: /set/ messages handed to the writer
+        sent: /set/ messages actually sent
+    """
+
+    def __init__(
+        self, client: AbletonOSCClient, rate: float = 100.0, bundle: bool = True
+    ):
+        """Start the writer.
+
+        Args:
+            client: Client (or ClientPool) to send through
+            rate: Flushes per second
+            bundle: Send each flush as OSC bundles rather than separate datagrams
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self._client = client
+        self.interval = 1.0 / rate
+        self.bundle_flushes = bundle
+
+        self.submitted = 0
+        self.sent = 0
+
+        # Latest args per (address, indices), in first-write order
+        self._pending: dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes so batches go out in order
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def coalesced(self) -> int:
+        """Writes superseded before they were sent."""
+        with self._lock:
+            return self.submitted - self.sent - len(self._pending)
+
+    @property
+    def router(self) -> ListenerRouter:
+        """Listener subscriptions of the underlying client."""
+        return self._client.router
+
+    @property
+    def max_datagram_size(self) -> int:
+        """Largest datagram the underlying client emits."""
+        return self._client.max_datagram_size
+
+    def __enter__(self) -> "CoalescingWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Send the held values now."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self.sent += len(pending)
+            if not pending:
+                return
+            if self.bundle_flushes:
+                with self._client.bundle():
+                    for (address, _), args in pending.items():
+                        self._client.send(address, *args)
+            else:
+                for (address, _), args in pending.items():
+                    self._client.send(address, *args)
+
+    def send(self, address: str, *args: Any) -> None:
+        """Hold a /set/ message until the next flush; send anything else now.
+
+        Args:
+            address: OSC address pattern (e.g., "/live/track/set/volume")
+            *args: Arguments to send with the message
+        """
+        key = _write_key(address, args)
+        if key is None:
+            self.flush()
+            self._client.send(address, *args)
+            return
+        with self._lock:
+            self._pending[key] = args
+            self.submitted += 1
+
+    def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
+        """Flush held values, then query (see AbletonOSCClient.query)."""
+        self.flush()
+        return self._client.query(address, *args, timeout=timeout)
+
+    def query_many(
+        self,
+        requests: Iterable[tuple[str, Sequence[Any]]],
+        timeout: float = 2.0,
+    ) -> list[tuple]:
+        """Flush held values, then query (see AbletonOSCClient.query_many)."""
+        self.flush()
+        return self._client.query_many(requests, timeout=timeout)
+
+    def barrier(self, timeout: float = 2.0) -> None:
+        """Flush held values, then wait until Live has processed them."""
+        self.flush()
+        self._client.barrier(timeout=timeout)
+
+    @contextmanager
+    def bundle(self) -> Iterator[None]:
+        """Bundle the underlying client's sends (see AbletonOSCClient.bundle).
+
+        Held /set/ values are not part of the bundle; they go out with the
+        next flush.
+        """
+        with self._client.bundle():
+            yield
+
+    def start_listener(self, address: str, callback: Callable) -> None:
+        """Register a callback on the underlying client."""
+        self._client.start_listener(address, callback)
+
+    def stop_listener(self, address: str) -> None:
+        """Unregister a callback on the underlying client."""
+        self._client.stop_listener(address)
+
+    def close(self) -> None:
+        """Stop the flush thread and send what is still held.
+
+        The underlying client stays open.
+        """
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.flush()
@@ -6,6 +6,7 @@ Covers /live/device/* endpoints for device and parameter control.
 from typing import Callable, NamedTuple
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
 
 
 class Parameter(NamedTuple):
@@ -26,14 +27,51 @@ class Parameter(NamedTuple):
     max: float
 
 
+PARAMETER_STRATEGIES = ("bulk", "per_parameter")
+
+# Queried together by get_parameters(strategy="bulk"); order matches Parameter
+_BULK_PARAMETER_ADDRESSES = (
+    "/live/device/get/parameters/name",
+    "/live/device/get/parameters/value",
+    "/live/device/get/parameters/min",
+    "/live/device/get/parameters/max",
+)
+
+
+def _bulk_parameter_requests(
+    track_index: int, device_index: int
+) -> list[tuple[str, tuple[int, int]]]:
+    """Return the query_many requests of get_parameters(strategy="bulk")."""
+    return [
+        (address, (track_index, device_index)) for address in _BULK_PARAMETER_ADDRESSES
+    ]
+
+
+def _parameters_from_bulk(results: list[tuple]) -> list[Parameter]:
+    """Build Parameters from the responses to _bulk_parameter_requests()."""
+    # Response format: (track_index, device_index, value1, value2, ...)
+    names, values, mins, maxs = (result[2:] for result in results)
+    return [
+        Parameter(
+            index=i,
+            name=str(name),
+            value=float(value),
+            min=float(min_val),
+            max=float(max_val),
+        )
+        for i, (name, value, min_val, max_val) in enumerate(
+            zip(names, values, mins, maxs)
+        )
+    ]
+
+
 class Device:
     """Device operations like getting/setting parameters."""
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
-        # Listener callbacks: {(track_idx, device_idx, param_idx): callback}
-        self._param_callbacks: dict[tuple[int, int, int], Callable] = {}
-        self._dispatcher_registered: bool = False
+        # Listener subscriptions: {(track_idx, device_idx, param_idx): subscription}
+        self._param_subscriptions: dict[tuple[int, int, int], Subscription] = {}
 
     def get_name(self, track_index: int, device_index: int) -> str:
         """Get the device name.
@@ -225,17 +263,35 @@ class Device:
         return float(result[3])
 
     def get_parameters(
-        self, track_index: int, device_index: int
+        self, track_index: int, device_index: int, strategy: str = "bulk"
     ) -> list[Parameter]:
         """Get all parameters for a device.
 
         Args:
             track_index: Track index (0-based)
             device_index: Device index on track (0-based)
+            strategy: "bulk" sends the four parameters/* queries at once (one
+                      round trip); "per_parameter" queries name, value, min
+                      and max of each parameter in turn (1 + 4n round trips)
 
         Returns:
             List of Parameter objects
+
+        Raises:
+            ValueError: If strategy is not one of PARAMETER_STRATEGIES
         """
+        if strategy == "bulk":
+            return _parameters_from_bulk(
+                self._client.query_many(
+                    _bulk_parameter_requests(track_index, device_index)
+                )
+            )
+
+        if strategy != "per_parameter":
+            raise ValueError(
+                f"Invalid strategy: {strategy}. Must be one of {PARAMETER_STRATEGIES}"
+            )
+
         num_params = self.get_num_parameters(track_index, device_index)
         parameters = []
 
@@ -389,16 +445,6 @@ class Device:
 
     # Parameter listener
 
-    def _param_dispatcher(self, addr, *args):
-        """Dispatch parameter value updates to registered callbacks."""
-        # Response format: (track_index, device_index, param_index, value)
-        if len(args) >= 4:
-            key = (int(args[0]), int(args[1]), int(args[2]))
-            value = float(args[3])
-            if key in self._param_callbacks:
-                callback = self._param_callbacks[key]
-                callback(key[0], key[1], key[2], value)
-
     def on_parameter_value_change(
         self,
         track_index: int,
@@ -414,23 +460,20 @@ class Device:
             parameter_index: Parameter index (0-based)
             callback: Function(track_index, device_index, param_index, value)
         """
+        router = self._client.router
         key = (track_index, device_index, parameter_index)
-        self._param_callbacks[key] = callback
-
-        # Register dispatcher if not already done
-        if not self._dispatcher_registered:
-            self._client.start_listener(
-                "/live/device/get/parameter/value", self._param_dispatcher
-            )
-            self._dispatcher_registered = True
-
-        # Tell AbletonOSC to start sending updates
-        self._client.send(
-            "/live/device/start_listen/parameter/value",
-            track_index,
-            device_index,
-            parameter_index,
+        # Response format: (track_index, device_index, param_index, value)
+        subscription = router.subscribe(
+            "/live/device/get/parameter/value",
+            key,
+            lambda t, d, p, value, *_: callback(int(t), int(d), int(p), float(value)),
         )
+        # Replace this wrapper's previous callback (after subscribing, so
+        # AbletonOSC isn't told to stop and restart)
+        previous = self._param_subscriptions.get(key)
+        self._param_subscriptions[key] = subscription
+        if previous is not None:
+            router.unsubscribe(previous)
 
     def stop_parameter_value_listener(
         self, track_index: int, device_index: int, parameter_index: int
@@ -442,19 +485,8 @@ class Device:
             device_index: Device index on track (0-based)
             parameter_index: Parameter index (0-based)
         """
-        # Tell AbletonOSC to stop sending updates
-        self._client.send(
-            "/live/device/stop_listen/parameter/value",
-            track_index,
-            device_index,
-            parameter_index,
-        )
-
-        # Remove callback
+        # AbletonOSC stops sending updates once no subscriber is left
         key = (track_index, device_index, parameter_index)
-        self._param_callbacks.pop(key, None)
-
-        # If no more callbacks, unregister dispatcher
-        if not self._param_callbacks and self._dispatcher_registered:
-            self._client.stop_listener("/live/device/get/parameter/value")
-            self._dispatcher_registered = False
+        subscription = self._param_subscriptions.pop(key, None)
+        if subscription is not None:
+            self._client.router.unsubscribe(subscription)
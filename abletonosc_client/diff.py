@@ -0,0 +1,307 @@
+"""Diffing session snapshots and applying minimal patches.
+
+diff_snapshots() compares the current state of a set (a SessionSnapshot)
+with a desired one and returns the changes needed to get from one to the
+other. apply_patch() sends them through the regular wrapper methods inside
+a single bundle() block, so unchanged objects cost nothing and changed ones
+are packed into as few datagrams as possible.
+
+Supported changes:
+    song: tempo, signature_numerator, signature_denominator
+    track: name, volume, panning, mute, solo, color
+    scene: name, color
+    clip: create/delete (by slot), name, color, notes (only differing notes
+        are removed/added)
+    device: parameter values (individually or as one vector, whichever
+        encodes smaller)
+
+Adding or removing tracks, scenes and devices is structural and not diffed;
+diff_snapshots raises ValueError if they don't line up.
+"""
+
+import math
+from typing import Any, NamedTuple, Sequence
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.clip import Clip
+from abletonosc_client.clip_slot import ClipSlot
+from abletonosc_client.device import Device
+from abletonosc_client.encoding import message_size
+from abletonosc_client.notes import Note
+from abletonosc_client.scene import Scene
+from abletonosc_client.snapshot import (
+    ClipSnapshot,
+    DeviceSnapshot,
+    SessionSnapshot,
+)
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+
+# Values are compared after an OSC round trip, which stores floats as float32
+FLOAT_TOLERANCE = 1e-5
+
+# Time span used to remove a single note at its start position
+_NOTE_SPAN = 1 / 1024
+
+_SONG_FIELDS = ("tempo", "signature_numerator", "signature_denominator")
+_TRACK_FIELDS = ("name", "volume", "panning", "mute", "solo", "color")
+_SCENE_FIELDS = ("name", "color")
+_CLIP_FIELDS = ("name", "color")
+
+
+class Change(NamedTuple):
+    """A single change in a patch.
+
+    Attributes:
+        target: Object to change: ("song",), ("track", t), ("scene", s),
+                ("clip", t, c) or ("device", t, d)
+        field: Property name, or one of "create", "delete",
+               "remove_notes", "add_notes", "parameter", "parameters"
+        value: New value (notes tuple for note changes, (index, value) for
+               "parameter", all values for "parameters", length for "create")
+    """
+
+    target: tuple
+    field: str
+    value: Any
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Compare two property values, allowing float32 rounding."""
+    if isinstance(a, float) or isinstance(b, float):
+        return math.isclose(a, b, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)
+    return a == b
+
+
+def _note_key(note: Note) -> tuple:
+    """Identify a note independently of float32 rounding."""
+    return (
+        int(note.pitch),
+        round(note.start_time, 4),
+        round(note.duration, 4),
+        int(note.velocity),
+        bool(note.mute),
+    )
+
+
+def _diff_fields(
+    changes: list[Change],
+    target: tuple,
+    current: Any,
+    desired: Any,
+    fields: Sequence[str],
+) -> None:
+    for name in fields:
+        value = getattr(desired, name)
+        if not _same(getattr(current, name), value):
+            changes.append(Change(target, name, value))
+
+
+def _diff_notes(
+    changes: list[Change],
+    target: tuple,
+    current: Sequence[Note],
+    desired: Sequence[Note],
+) -> None:
+    current_keys = {_note_key(n) for n in current}
+    desired_keys = {_note_key(n) for n in desired}
+    removed = [n for n in current if _note_key(n) not in desired_keys]
+    # Removal is by pitch and start; re-add wanted notes sharing both
+    cleared = {(int(n.pitch), round(n.start_time, 4)) for n in removed}
+    added = [
+        n
+        for n in desired
+        if _note_key(n) not in current_keys
+        or (int(n.pitch), round(n.start_time, 4)) in cleared
+    ]
+    if removed:
+        changes.append(Change(target, "remove_notes", tuple(removed)))
+    if added:
+        changes.append(Change(target, "add_notes", tuple(added)))
+
+
+def _diff_clip(
+    changes: list[Change],
+    target: tuple,
+    current: ClipSnapshot | None,
+    desired: ClipSnapshot | None,
+) -> None:
+    if desired is None:
+        if current is not None:
+            changes.append(Change(target, "delete", None))
+        return
+    if current is None:
+        changes.append(Change(target, "create", desired.length))
+        current = ClipSnapshot(desired.index, "", desired.length, 0, ())
+    _diff_fields(changes, target, current, desired, _CLIP_FIELDS)
+    # Notes are only compared when the desired state specifies them
+    if desired.notes is not None:
+        if current.notes is None:
+            raise ValueError(f"Current snapshot has no notes for clip {target[1:]}")
+        _diff_notes(changes, target, current.notes, desired.notes)
+
+
+def _diff_device(
+    changes: list[Change],
+    target: tuple,
+    current: DeviceSnapshot,
+    desired: DeviceSnapshot,
+) -> None:
+    if not desired.parameters:
+        return
+    if len(current.parameters) != len(desired.parameters):
+        raise ValueError(f"Parameter count differs for device {target[1:]}")
+    values = [p.value for p in desired.parameters]
+    changed = [
+        (i, value)
+        for i, (old, value) in enumerate(zip(current.parameters, values))
+        if not _same(old.value, value)
+    ]
+    if not changed:
+        return
+    # One message per parameter, or the whole vector if that is smaller
+    single = sum(
+        message_size("/live/device/set/parameter/value", (*target[1:], i, float(v)))
+        for i, v in changed
+    )
+    vector = message_size(
+        "/live/device/set/parameters/value", (*target[1:], *map(float, values))
+    )
+    if vector < single:
+        changes.append(Change(target, "parameters", tuple(values)))
+    else:
+        changes.extend(Change(target, "parameter", item) for item in changed)
+
+
+def diff_snapshots(
+    current: SessionSnapshot, desired: SessionSnapshot
+) -> list[Change]:
+    """Compute the changes that turn the current set into the desired one.
+
+    Args:
+        current: Snapshot of the set as it is (take notes=True to diff notes)
+        desired: Snapshot of the set as it should be; clips whose notes are
+                 None and devices without parameters are left as they are
+
+    Returns:
+        List of changes, in the order they should be applied
+
+    Raises:
+        ValueError: If tracks, scenes or devices don't line up
+    """
+    if len(current.tracks) != len(desired.tracks):
+        raise ValueError(
+            f"Track count differs: {len(current.tracks)} != {len(desired.tracks)}"
+        )
+    if len(current.scenes) != len(desired.scenes):
+        raise ValueError(
+            f"Scene count differs: {len(current.scenes)} != {len(desired.scenes)}"
+        )
+
+    changes: list[Change] = []
+    _diff_fields(changes, ("song",), current, desired, _SONG_FIELDS)
+
+    for now, want in zip(current.scenes, desired.scenes):
+        _diff_fields(changes, ("scene", want.index), now, want, _SCENE_FIELDS)
+
+    for now, want in zip(current.tracks, desired.tracks):
+        t = want.index
+        _diff_fields(changes, ("track", t), now, want, _TRACK_FIELDS)
+
+        current_clips = {clip.index: clip for clip in now.clips}
+        desired_clips = {clip.index: clip for clip in want.clips}
+        for c in sorted(current_clips.keys() | desired_clips.keys()):
+            _diff_clip(
+                changes, ("clip", t, c), current_clips.get(c), desired_clips.get(c)
+            )
+
+        if [d.class_name for d in now.devices] != [d.class_name for d in want.devices]:
+            raise ValueError(f"Devices differ on track {t}")
+        for device_now, device_want in zip(now.devices, want.devices):
+            _diff_device(
+                changes, ("device", t, device_want.index), device_now, device_want
+            )
+
+    return changes
+
+
+def apply_patch(client: AbletonOSCClient, changes: Sequence[Change]) -> int:
+    """Send a patch through the wrapper setters, bundled.
+
+    Args:
+        client: Connected client
+        changes: Changes from diff_snapshots()
+
+    Returns:
+        Number of changes applied
+    """
+    song = Song(client)
+    track = Track(client)
+    scene = Scene(client)
+    clip = Clip(client)
+    clip_slot = ClipSlot(client)
+    device = Device(client)
+
+    setters = {
+        ("song", "tempo"): song.set_tempo,
+        ("song", "signature_numerator"): song.set_signature_numerator,
+        ("song", "signature_denominator"): song.set_signature_denominator,
+        ("track", "name"): track.set_name,
+        ("track", "volume"): track.set_volume,
+        ("track", "panning"): track.set_panning,
+        ("track", "mute"): track.set_mute,
+        ("track", "solo"): track.set_solo,
+        ("track", "color"): track.set_color,
+        ("scene", "name"): scene.set_name,
+        ("scene", "color"): scene.set_color,
+        ("clip", "create"): clip_slot.create_clip,
+        ("clip", "delete"): lambda t, c, _: clip_slot.delete_clip(t, c),
+        ("clip", "name"): clip.set_name,
+        ("clip", "color"): clip.set_color,
+        ("clip", "add_notes"): clip.add_notes,
+        ("device", "parameter"): lambda t, d, item: device.set_parameter_value(
+            t, d, *item
+        ),
+        ("device", "parameters"): device.set_parameters_values,
+    }
+
+    with client.bundle():
+        for change in changes:
+            kind, *indices = change.target
+            if (kind, change.field) == ("clip", "remove_notes"):
+                for note in change.value:
+                    clip.remove_notes(
+                        *indices,
+                        start_time=note.start_time,
+                        end_time=note.start_time + _NOTE_SPAN,
+                        pitch_start=note.pitch,
+                        pitch_end=note.pitch,
+                    )
+                continue
+            setters[kind, change.field](*indices, change.value)
+    return len(changes)
+
+
+def push_snapshot(
+    client: AbletonOSCClient,
+    desired: SessionSnapshot,
+    current: SessionSnapshot | None = None,
+) -> list[Change]:
+    """Bring the set in line with a desired snapshot.
+
+    Args:
+        client: Connected client
+        desired: Snapshot of the set as it should be
+        current: Snapshot of the set as it is (taken if not given)
+
+    Returns:
+        The changes that were applied
+    """
+    if current is None:
+        current = Song(client).snapshot(
+            parameters=any(d.parameters for t in desired.tracks for d in t.devices),
+            notes=any(c.notes is not None for t in desired.tracks for c in t.clips),
+        )
+    changes = diff_snapshots(current, desired)
+    apply_patch(client, changes)
+    return changes
@@ -0,0 +1,253 @@
+"""OSC encoding helpers for the transport layer.
+
+Builds messages and bundles, and computes encoded message sizes without
+building them so callers can pack datagrams up to a size limit.
+
+Messages whose arguments are all ints and floats (every setter on the hot
+path: volumes, panning, device parameter values...) are encoded from a
+cached template: the padded address and type tags are encoded once per
+(address, argument types) and the arguments packed behind them with one
+precompiled struct call. Other messages go through python-osc's builder.
+"""
+
+import struct
+from typing import Any, Iterable, Sequence
+
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+# Largest datagram that fits a 1500-byte Ethernet MTU (minus IPv4/UDP headers)
+DEFAULT_MAX_DATAGRAM_SIZE = 1472
+
+# "#bundle\0" plus the 8-byte time tag
+BUNDLE_HEADER = b"#bundle\x00" + b"\x00\x00\x00\x00\x00\x00\x00\x01"  # immediately
+BUNDLE_HEADER_SIZE = len(BUNDLE_HEADER)
+
+# Each bundle element is prefixed with its 4-byte size
+BUNDLE_ELEMENT_OVERHEAD = 4
+
+# Type tag and struct code of argument types with a fixed-size encoding
+_TEMPLATE_TYPES = {int: ("i", "i"), float: ("f", "f")}
+
+# Templates kept before the cache is cleared (addresses are a small set, but
+# guard against callers generating unbounded ones)
+MAX_TEMPLATES = 4096
+
+# (address, *argument types) -> (Struct packing a whole message, encoded
+# address and type tags), or None when the types need the builder
+_templates: dict[tuple, tuple[struct.Struct, bytes] | None] = {}
+
+
+def padded_size(size: int) -> int:
+    """Return the size of a null-terminated OSC string of `size` bytes.
+
+    Args:
+        size: Length of the string in bytes (without terminator)
+
+    Returns:
+        Size including the terminator, padded to a multiple of 4
+    """
+    return (size + 4) & ~3
+
+
+def arg_size(arg: Any) -> int | None:
+    """Return the encoded payload size of a single OSC argument.
+
+    Args:
+        arg: Argument value
+
+    Returns:
+        Size in bytes, or None for types whose size isn't computed here
+    """
+    if isinstance(arg, bool) or arg is None:
+        return 0
+    if isinstance(arg, float):
+        return 4
+    if isinstance(arg, int):
+        return 4 if arg.bit_length() <= 31 else 8
+    if isinstance(arg, str):
+        return padded_size(len(arg.encode("utf-8")))
+    if isinstance(arg, bytes):
+        return 4 + ((len(arg) + 3) & ~3)
+    return None
+
+
+def message_size(address: str, args: Sequence[Any]) -> int:
+    """Return the encoded size of an OSC message without building it.
+
+    Args:
+        address: OSC address pattern
+        args: Message arguments
+
+    Returns:
+        Size of the encoded message in bytes
+    """
+    # Address, then "," followed by one type tag per argument
+    return (
+        padded_size(len(address.encode("utf-8")))
+        + padded_size(1 + len(args))
+        + payload_size(args)
+    )
+
+
+def payload_size(args: Sequence[Any]) -> int:
+    """Return the combined encoded payload size of several arguments.
+
+    Args:
+        args: Argument values
+
+    Returns:
+        Size in bytes, excluding type tags
+    """
+    size = 0
+    for arg in args:
+        payload = arg_size(arg)
+        if payload is None:
+            # Measure by encoding: total minus address "/" and type tags
+            return len(build_message("/", args)) - 4 - padded_size(1 + len(args))
+        size += payload
+    return size
+
+
+def chunk_arguments(
+    address: str,
+    prefix: Sequence[Any],
+    items: Sequence[Sequence[Any]],
+    max_size: int,
+) -> list[list[Sequence[Any]]]:
+    """Split items across messages so each encoded message fits max_size.
+
+    Each message carries `prefix` followed by the flattened arguments of its
+    items (e.g. track/clip indices followed by five values per note). An item
+    too large to fit with the prefix gets a message of its own.
+
+    Args:
+        address: OSC address the messages will be sent to
+        prefix: Arguments repeated at the start of every message
+        items: Groups of arguments that must not be split
+        max_size: Maximum encoded message size in bytes
+
+    Returns:
+        List of chunks, each a list of items
+    """
+    address_size = padded_size(len(address.encode("utf-8")))
+    prefix_payload = payload_size(prefix)
+
+    chunks: list[list[Sequence[Any]]] = []
+    current: list[Sequence[Any]] = []
+    tags = 1 + len(prefix)
+    payload = prefix_payload
+    for item in items:
+        item_payload = payload_size(item)
+        size = address_size + padded_size(tags + len(item)) + payload + item_payload
+        if current and size > max_size:
+            chunks.append(current)
+            current = []
+            tags = 1 + len(prefix)
+            payload = prefix_payload
+        current.append(item)
+        tags += len(item)
+        payload += item_payload
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _compile_template(
+    address: str, types: tuple[type, ...]
+) -> tuple[struct.Struct, bytes] | None:
+    """Return (Struct, head) encoding a whole message, or None if types don't fit."""
+    if not all(t in _TEMPLATE_TYPES for t in types):
+        return None
+    tags = "," + "".join(_TEMPLATE_TYPES[t][0] for t in types)
+    head = _osc_string(address) + _osc_string(tags)
+    codes = "".join(_TEMPLATE_TYPES[t][1] for t in types)
+    # The encoded head is a fixed-size leading field of the format
+    return struct.Struct(f">{len(head)}s{codes}"), head
+
+
+def _osc_string(value: str) -> bytes:
+    """Encode a null-terminated string padded to a multiple of 4 bytes."""
+    data = value.encode("utf-8")
+    return data + b"\x00" * (padded_size(len(data)) - len(data))
+
+
+def build_message(address: str, args: Iterable[Any]) -> bytes:
+    """Encode an OSC message.
+
+    Args:
+        address: OSC address pattern
+        args: Message arguments (types are inferred)
+
+    Returns:
+        Encoded message datagram
+    """
+    args = tuple(args)
+    key = (address, *map(type, args))
+    try:
+        template = _templates[key]
+    except KeyError:
+        if len(_templates) >= MAX_TEMPLATES:
+            _templates.clear()
+        template = _templates[key] = _compile_template(address, key[1:])
+    if template is not None:
+        packer, head = template
+        try:
+            return packer.pack(head, *args)
+        except struct.error:
+            # An int beyond 32 bits; the builder encodes it as int64
+            pass
+    return build_message_uncached(address, args)
+
+
+def build_message_uncached(address: str, args: Iterable[Any]) -> bytes:
+    """Encode an OSC message with python-osc's builder, bypassing templates.
+
+    Args:
+        address: OSC address pattern
+        args: Message arguments (types are inferred)
+
+    Returns:
+        Encoded message datagram
+    """
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def pack_bundles(messages: Sequence[bytes], max_size: int) -> list[bytes]:
+    """Pack encoded messages into as few datagrams as possible.
+
+    Messages keep their order. A datagram holding a single message is sent as
+    that plain message; a message too large for a bundle is sent on its own.
+
+    Args:
+        messages: Encoded OSC messages
+        max_size: Maximum datagram size in bytes
+
+    Returns:
+        List of datagrams (bundles or plain messages)
+    """
+    datagrams: list[bytes] = []
+    current: list[bytes] = []
+    size = BUNDLE_HEADER_SIZE
+
+    def flush() -> None:
+        if len(current) == 1:
+            datagrams.append(current[0])
+        elif current:
+            parts = [BUNDLE_HEADER]
+            for message in current:
+                parts.append(len(message).to_bytes(4, "big"))
+                parts.append(message)
+            datagrams.append(b"".join(parts))
+
+    for message in messages:
+        element = BUNDLE_ELEMENT_OVERHEAD + len(message)
+        if current and size + element > max_size:
+            flush()
+            current, size = [], BUNDLE_HEADER_SIZE
+        current.append(message)
+        size += element
+    flush()
+    return datagrams
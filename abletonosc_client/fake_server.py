@@ -0,0 +1,1184 @@
+"""In-process stand-in for AbletonOSC.
+
+FakeAbletonOSCServer answers the /live/* addresses used by this package from
+an in-memory Live set, so tests and benchmarks can run without Ableton. It
+listens on a UDP port and replies to the sender's host on reply_port, like
+AbletonOSC, and can simulate network latency, jitter, packet loss and Live's
+per-message processing time.
+
+Example:
+    with FakeAbletonOSCServer(port=11100, reply_port=11101) as server:
+        client = AbletonOSCClient(send_port=11100, receive_port=11101)
+        Song(client).get_tempo()  # 120.0
+"""
+
+import copy
+import heapq
+import itertools
+import random
+import socket
+import threading
+import time
+from typing import Any, Callable
+
+from pythonosc.osc_packet import OscPacket
+
+from abletonosc_client.addresses import INDEX_COUNTS, PROPERTY_VERBS, index_count
+from abletonosc_client.encoding import build_message
+
+# Devices insert_device and the browser can load: name -> (class_name, type,
+# number of parameters after "Device On"). Types: 0=audio_effect,
+# 1=instrument, 2=midi_effect
+DEVICE_CATALOG = {
+    "Analog": ("UltraAnalog", 1, 24),
+    "Drift": ("Drift", 1, 32),
+    "Operator": ("Operator", 1, 24),
+    "Simpler": ("OriginalSimpler", 1, 16),
+    "Wavetable": ("InstrumentVector", 1, 92),
+    "Auto Filter": ("AutoFilter", 0, 12),
+    "Compressor": ("Compressor2", 0, 12),
+    "Delay": ("Delay", 0, 12),
+    "EQ Eight": ("Eq8", 0, 40),
+    "Reverb": ("Reverb", 0, 16),
+    "Saturator": ("Saturator", 0, 8),
+    "Utility": ("StereoGain", 0, 8),
+    "Arpeggiator": ("MidiArpeggiator", 2, 8),
+    "Chord": ("MidiChord", 2, 12),
+    "Scale": ("MidiScale", 2, 4),
+}
+
+DRUM_KITS = ("505 Core Kit", "606 Core Kit", "808 Core Kit", "909 Core Kit")
+SOUNDS = ("Grand Piano", "Warm Pad", "Sub Bass")
+PACK = "Core Library"
+
+SONG_DEFAULTS = {
+    "tempo": 120.0,
+    "is_playing": False,
+    "signature_numerator": 4,
+    "signature_denominator": 4,
+    "current_song_time": 0.0,
+    "metronome": False,
+    "record_mode": False,
+    "groove_amount": 0.0,
+    "song_length": 0.0,
+    "loop": False,
+    "loop_start": 0.0,
+    "loop_length": 16.0,
+    "midi_recording_quantization": 0,
+    "clip_trigger_quantization": 4,
+    "session_record": False,
+    "arrangement_overdub": False,
+    "punch_in": False,
+    "punch_out": False,
+    "root_note": 0,
+    "scale_name": "Major",
+    "back_to_arranger": False,
+    "nudge_down": False,
+    "nudge_up": False,
+}
+
+TRACK_DEFAULTS = {
+    "name": "",
+    "volume": 0.85,
+    "panning": 0.0,
+    "mute": False,
+    "solo": False,
+    "arm": False,
+    "color": 0,
+    "color_index": 0,
+    "is_foldable": False,
+    "is_grouped": False,
+    "fold_state": False,
+    "is_visible": True,
+    "can_be_armed": True,
+    "has_midi_input": True,
+    "has_midi_output": False,
+    "has_audio_input": False,
+    "has_audio_output": True,
+    "current_monitoring_state": 1,
+    "input_routing_type": "All Ins",
+    "input_routing_channel": "All Channels",
+    "output_routing_type": "Main",
+    "output_routing_channel": "",
+    "available_input_routing_types": ("All Ins", "Computer Keyboard", "No Input"),
+    "available_output_routing_types": ("Main", "Sends Only"),
+    "available_input_routing_channels": ("All Channels",),
+    "available_output_routing_channels": ("",),
+}
+
+CLIP_DEFAULTS = {
+    "name": "",
+    "color": 0,
+    "color_index": 0,
+    "length": 4.0,
+    "loop_start": 0.0,
+    "loop_end": 4.0,
+    "looping": True,
+    "start_time": 0.0,
+    "end_time": 4.0,
+    "start_marker": 0.0,
+    "end_marker": 4.0,
+    "position": 0.0,
+    "is_midi_clip": True,
+    "is_audio_clip": False,
+    "is_playing": False,
+    "is_recording": False,
+    "is_overdubbing": False,
+    "will_record_on_start": False,
+    "playing_position": 0.0,
+    "pitch_coarse": 0,
+    "pitch_fine": 0.0,
+    "gain": 0.0,
+    "warping": False,
+    "warp_mode": 0,
+    "muted": False,
+    "launch_mode": 0,
+    "launch_quantization": 0,
+    "legato": False,
+    "velocity_amount": 0.0,
+    "ram_mode": False,
+    "has_groove": False,
+    "sample_length": 0,
+    "file_path": "",
+}
+
+SCENE_DEFAULTS = {
+    "name": "",
+    "color": 0,
+    "color_index": 0,
+    "is_triggered": False,
+    "tempo": 120.0,
+    "tempo_enabled": False,
+    "time_signature_numerator": 4,
+    "time_signature_denominator": 4,
+    "time_signature_enabled": False,
+}
+
+VIEW_DEFAULTS = {
+    "selected_track": 0,
+    "selected_scene": 0,
+    "selected_clip": (0, 0),
+    "selected_device": (0, 0),
+    "detail_clip": (0, 0),
+}
+
+API_DEFAULTS = {
+    "version": 1,
+    "log_level": "info",
+}
+
+
+class FakeError(Exception):
+    """An error AbletonOSC would report on /live/error."""
+
+
+class FakeClip:
+    """A clip: properties plus MIDI notes as (pitch, start, duration, velocity, mute)."""
+
+    def __init__(self, length: float = 4.0, **props):
+        self.props = dict(CLIP_DEFAULTS)
+        self.props.update(
+            length=length, loop_end=length, end_time=length, end_marker=length
+        )
+        self.props.update(props)
+        self.notes: list[tuple] = []
+
+
+class FakeDevice:
+    """A device with a "Device On" parameter followed by generic ones."""
+
+    def __init__(self, name: str):
+        class_name, device_type, count = DEVICE_CATALOG.get(name, (name, 0, 8))
+        self.props = {
+            "name": name,
+            "class_name": class_name,
+            "type": device_type,
+            "is_active": True,
+        }
+        self.parameters = [
+            {"name": "Device On", "value": 1.0, "min": 0.0, "max": 1.0, "is_quantized": True}
+        ] + [
+            {
+                "name": f"Parameter {i}",
+                "value": 0.5,
+                "min": 0.0,
+                "max": 1.0,
+                "is_quantized": False,
+            }
+            for i in range(1, count + 1)
+        ]
+
+
+class FakeTrack:
+    """A track with clip slots (None when empty), devices and send levels."""
+
+    def __init__(self, name: str, midi: bool, num_scenes: int, num_returns: int):
+        self.props = dict(TRACK_DEFAULTS)
+        self.props.update(
+            name=name,
+            has_midi_input=midi,
+            has_audio_input=not midi,
+        )
+        self.slots: list[FakeClip | None] = [None] * num_scenes
+        self.slot_props: list[dict] = [
+            {"has_stop_button": True} for _ in range(num_scenes)
+        ]
+        self.devices: list[FakeDevice] = []
+        self.sends: list[float] = [0.0] * num_returns
+
+
+class FakeScene:
+    """A scene row."""
+
+    def __init__(self, name: str = ""):
+        self.props = dict(SCENE_DEFAULTS)
+        self.props["name"] = name
+
+
+class FakeLiveSet:
+    """The in-memory Live set a FakeAbletonOSCServer serves.
+
+    Attributes:
+        song: Song properties
+        view: View (selection) properties
+        api: AbletonOSC API properties
+        tracks: Regular tracks
+        return_tracks: Return track names
+        scenes: Scenes
+        cue_points: [name, time] pairs, sorted by time
+    """
+
+    def __init__(
+        self,
+        num_midi_tracks: int = 2,
+        num_audio_tracks: int = 2,
+        num_scenes: int = 8,
+        num_return_tracks: int = 2,
+        devices: dict[int, list[str]] | None = None,
+    ):
+        """Create a set.
+
+        Args:
+            num_midi_tracks: MIDI tracks to create (first)
+            num_audio_tracks: Audio tracks to create (after the MIDI tracks)
+            num_scenes: Scenes to create
+            num_return_tracks: Return tracks to create
+            devices: {track_index: [device names]} (default: Drift on track 0)
+        """
+        self.song = dict(SONG_DEFAULTS)
+        self.view = dict(VIEW_DEFAULTS)
+        self.api = dict(API_DEFAULTS)
+        self.return_tracks = [chr(ord("A") + i) + "-Return" for i in range(num_return_tracks)]
+        self.scenes = [FakeScene() for _ in range(num_scenes)]
+        self.cue_points: list[list] = []
+        self.tracks = [
+            FakeTrack(f"{i + 1}-MIDI", True, num_scenes, num_return_tracks)
+            for i in range(num_midi_tracks)
+        ] + [
+            FakeTrack(f"{i + 1}-Audio", False, num_scenes, num_return_tracks)
+            for i in range(num_midi_tracks, num_midi_tracks + num_audio_tracks)
+        ]
+        if devices is None:
+            devices = {0: ["Drift"]} if self.tracks else {}
+        for track_index, names in devices.items():
+            for name in names:
+                self.tracks[track_index].devices.append(FakeDevice(name))
+
+
+def _coerce(old: Any, value: Any) -> Any:
+    """Convert an incoming value to the type of the value it replaces."""
+    if isinstance(old, bool):
+        return bool(value)
+    if isinstance(old, float):
+        return float(value)
+    if isinstance(old, int) and not isinstance(value, str):
+        return int(value)
+    if isinstance(old, str):
+        return str(value)
+    return value
+
+
+class FakeAbletonOSCServer:
+    """UDP server that behaves like AbletonOSC running in Live.
+
+    Requests are handled one at a time, in arrival order, as Live's main
+    thread does. Replies (and listener updates) go to the sender's host on
+    reply_port, or back to the sending port if reply_port is None.
+
+    Attributes:
+        live_set: The FakeLiveSet being served
+        messages_received: Messages handled (after simulated loss)
+        replies_sent: Replies and listener updates sent
+        dropped: Datagrams dropped by the simulated loss
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 11000,
+        reply_port: int | None = 11001,
+        live_set: FakeLiveSet | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        processing_time: float = 0.0,
+        seed: int | None = None,
+    ):
+        """Create a server (call start() or use it as a context manager).
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on (AbletonOSC uses 11000)
+            reply_port: Port to send replies to (AbletonOSC uses 11001)
+            live_set: Set to serve (default: FakeLiveSet())
+            latency: Seconds added before each reply is sent
+            jitter: Maximum random deviation from latency in seconds; replies
+                    can be reordered, as on a real network
+            loss: Probability of dropping each incoming and outgoing datagram
+            processing_time: Seconds spent handling each message
+            seed: Random seed for jitter and loss
+        """
+        self.host = host
+        self.port = port
+        self.reply_port = reply_port
+        self.live_set = live_set if live_set is not None else FakeLiveSet()
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.processing_time = processing_time
+
+        self.messages_received = 0
+        self.replies_sent = 0
+        self.dropped = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._socket: socket.socket | None = None
+        self._threads: list[threading.Thread] = []
+        self._running = False
+
+        # Delayed replies: heap of (due, seq, datagram, destination)
+        self._outbox: list[tuple[float, int, bytes, tuple]] = []
+        self._outbox_ready = threading.Condition()
+        self._seq = itertools.count()
+
+        # Active listeners: {(domain, prop, indices)}
+        self._listeners: set[tuple[str, str, tuple]] = set()
+        # Where listener updates go (the last client to send anything)
+        self._destination: tuple | None = None
+
+        # Undo/redo stacks of (undo, redo) callables
+        self._undo: list[tuple[Callable, Callable]] = []
+        self._redo: list[tuple[Callable, Callable]] = []
+        self._replaying = False
+
+        self._getters = self._make_getters()
+        self._setters = self._make_setters()
+        self._actions = self._make_actions()
+
+    # Lifecycle
+
+    def start(self) -> "FakeAbletonOSCServer":
+        """Bind the socket and start serving."""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((self.host, self.port))
+        self._socket.settimeout(0.05)
+        self._running = True
+        self._threads = [
+            threading.Thread(target=target, daemon=True)
+            for target in (self._serve, self._send_delayed, self._run_clock)
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving and release the socket."""
+        self._running = False
+        with self._outbox_ready:
+            self._outbox_ready.notify()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def __enter__(self) -> "FakeAbletonOSCServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Transport
+
+    def _drop(self) -> bool:
+        if self.loss and self._random.random() < self.loss:
+            self.dropped += 1
+            return True
+        return False
+
+    def _serve(self) -> None:
+        while self._running:
+            try:
+                data, sender = self._socket.recvfrom(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if self._drop():
+                continue
+            port = self.reply_port if self.reply_port is not None else sender[1]
+            destination = (sender[0], port)
+            try:
+                messages = OscPacket(data).messages
+            except Exception:
+                continue
+            for timed in messages:
+                message = timed.message
+                with self._lock:
+                    self._destination = destination
+                    self.messages_received += 1
+                    replies = self.handle(message.address, tuple(message.params))
+                for address, args in replies:
+                    self._send(address, args, destination)
+                if self.processing_time:
+                    time.sleep(self.processing_time)
+
+    def _send(self, address: str, args: tuple, destination: tuple) -> None:
+        if self._drop():
+            return
+        datagram = build_message(address, args)
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay <= 0:
+            self._sendto(datagram, destination)
+            return
+        with self._outbox_ready:
+            heapq.heappush(
+                self._outbox,
+                (time.monotonic() + delay, next(self._seq), datagram, destination),
+            )
+            self._outbox_ready.notify()
+
+    def _sendto(self, datagram: bytes, destination: tuple) -> None:
+        try:
+            self._socket.sendto(datagram, destination)
+            self.replies_sent += 1
+        except (OSError, AttributeError):
+            pass
+
+    def _send_delayed(self) -> None:
+        while True:
+            with self._outbox_ready:
+                while self._running and (
+                    not self._outbox or self._outbox[0][0] > time.monotonic()
+                ):
+                    timeout = (
+                        self._outbox[0][0] - time.monotonic() if self._outbox else None
+                    )
+                    self._outbox_ready.wait(timeout)
+                if not self._running:
+                    return
+                _, _, datagram, destination = heapq.heappop(self._outbox)
+            self._sendto(datagram, destination)
+
+    def _notify(self, domain: str, prop: str, indices: tuple) -> None:
+        """Send a listener update if anyone listens to this property."""
+        if (domain, prop, indices) not in self._listeners or self._destination is None:
+            return
+        values = self._get(domain, prop, indices, ())
+        self._send(f"/live/{domain}/get/{prop}", (*indices, *values), self._destination)
+
+    def _run_clock(self) -> None:
+        """Advance the song position while playing and emit time listeners."""
+        last = time.monotonic()
+        last_report = 0.0
+        while self._running:
+            time.sleep(0.01)
+            now = time.monotonic()
+            with self._lock:
+                song = self.live_set.song
+                if song["is_playing"]:
+                    before = int(song["current_song_time"])
+                    song["current_song_time"] += (now - last) * song["tempo"] / 60
+                    if int(song["current_song_time"]) != before:
+                        self._notify("song", "beat", ())
+                    if now - last_report >= 0.05:
+                        self._notify("song", "current_song_time", ())
+                        last_report = now
+            last = now
+
+    # Message handling
+
+    def handle(self, address: str, args: tuple) -> list[tuple[str, tuple]]:
+        """Handle one message and return the (address, args) replies.
+
+        Errors are reported on /live/error, as AbletonOSC does; the query
+        itself gets no reply.
+        """
+        with self._lock:
+            try:
+                return self._handle(address, args)
+            except (FakeError, IndexError, KeyError, TypeError, ValueError) as e:
+                return [("/live/error", (f"Error handling {address}: {e!r}",))]
+
+    def _handle(self, address: str, args: tuple) -> list[tuple[str, tuple]]:
+        if address == "/live/test":
+            return [(address, ("ok",))]
+        parts = address.split("/")
+        if len(parts) < 4 or parts[1] != "live":
+            raise FakeError("Unknown address")
+        domain, rest = parts[2], parts[3:]
+
+        if domain in INDEX_COUNTS and rest[0] in PROPERTY_VERBS and len(rest) > 1:
+            verb, prop = rest[0], "/".join(rest[1:])
+            count = index_count(domain, prop)
+            indices, values = tuple(args[:count]), tuple(args[count:])
+            if verb == "get":
+                return [(address, (*indices, *self._get(domain, prop, indices, values)))]
+            if verb == "set":
+                self._set(domain, prop, indices, values)
+                return []
+            key = (domain, prop, indices)
+            if verb == "start_listen":
+                self._get(domain, prop, indices, ())  # validate
+                self._listeners.add(key)
+                self._notify(domain, prop, indices)
+            else:
+                self._listeners.discard(key)
+            return []
+
+        action = self._actions.get((domain, "/".join(rest)))
+        if action is None:
+            raise FakeError("Unknown address")
+        result = action(*args)
+        return [] if result is None else [(address, result)]
+
+    def _target(self, domain: str, indices: tuple):
+        """Return the object or property dict a message refers to."""
+        live = self.live_set
+        if domain == "song":
+            return live.song
+        if domain == "view":
+            return live.view
+        if domain in ("api", "application"):
+            return live.api
+        if domain == "track":
+            return live.tracks[indices[0]]
+        if domain == "scene":
+            return live.scenes[indices[0]]
+        if domain == "clip_slot":
+            track = live.tracks[indices[0]]
+            return track.slot_props[indices[1]]
+        if domain == "clip":
+            clip = live.tracks[indices[0]].slots[indices[1]]
+            if clip is None:
+                raise FakeError("No clip in slot")
+            return clip
+        if domain == "device":
+            return live.tracks[indices[0]].devices[indices[1]]
+        raise FakeError(f"Unknown domain {domain}")
+
+    @staticmethod
+    def _props(target) -> dict:
+        return target if isinstance(target, dict) else target.props
+
+    def _get(self, domain: str, prop: str, indices: tuple, values: tuple) -> tuple:
+        target = self._target(domain, indices)
+        getter = self._getters.get((domain, prop))
+        if getter is not None:
+            return tuple(getter(target, indices, values))
+        value = self._props(target)[prop]
+        return value if isinstance(value, tuple) else (value,)
+
+    def _set(self, domain: str, prop: str, indices: tuple, values: tuple) -> None:
+        target = self._target(domain, indices)
+        setter = self._setters.get((domain, prop))
+        if setter is not None:
+            setter(target, indices, values)
+            return
+        props = self._props(target)
+        old = props[prop]
+        if isinstance(old, tuple):
+            new = tuple(values)
+        else:
+            new = _coerce(old, values[0])
+        self._assign(domain, prop, indices, props, new, undoable=domain != "view")
+
+    def _assign(
+        self,
+        domain: str,
+        prop: str,
+        indices: tuple,
+        props: dict,
+        value: Any,
+        undoable: bool = True,
+        key: str | None = None,
+    ) -> None:
+        """Change a property, recording undo and notifying listeners.
+
+        `key` is the entry of props to change when it differs from the
+        property name (e.g. "value" for device "parameter/value").
+        """
+        key = prop if key is None else key
+        old = props[key]
+        if old == value:
+            return
+
+        def apply(v):
+            props[key] = v
+            self._notify(domain, prop, indices)
+
+        apply(value)
+        if undoable:
+            self._record(lambda: apply(old), lambda: apply(value))
+
+    def _record(self, undo: Callable, redo: Callable) -> None:
+        if not self._replaying:
+            self._undo.append((undo, redo))
+            self._redo.clear()
+
+    def _edit(self, do: Callable, undo: Callable) -> None:
+        """Run a structural edit and record it for undo."""
+        do()
+        self._record(undo, do)
+
+    # Computed properties
+
+    def _make_getters(self) -> dict:
+        live = self.live_set
+
+        def slot_clip(indices):
+            return live.tracks[indices[0]].slots[indices[1]]
+
+        def clip_column(prop):
+            return lambda track, i, v: [
+                None if clip is None else clip.props[prop] for clip in track.slots
+            ]
+
+        def device_column(prop):
+            return lambda track, i, v: [d.props[prop] for d in track.devices]
+
+        def parameter(prop):
+            return lambda device, i, v: [device.parameters[i[2]][prop]]
+
+        def parameters(prop):
+            return lambda device, i, v: [p[prop] for p in device.parameters]
+
+        def playing_slot(track):
+            for index, clip in enumerate(track.slots):
+                if clip is not None and clip.props["is_playing"]:
+                    return index
+            return -1
+
+        def meter(track, i, v):
+            playing = live.song["is_playing"] and playing_slot(track) >= 0
+            return [0.7 if playing and not track.props["mute"] else 0.0]
+
+        return {
+            ("song", "num_tracks"): lambda s, i, v: [len(live.tracks)],
+            ("song", "num_scenes"): lambda s, i, v: [len(live.scenes)],
+            ("song", "track_names"): lambda s, i, v: [
+                t.props["name"] for t in live.tracks[slice(*v[:2]) if v else slice(None)]
+            ],
+            ("song", "can_undo"): lambda s, i, v: [bool(self._undo)],
+            ("song", "can_redo"): lambda s, i, v: [bool(self._redo)],
+            ("song", "cue_points"): lambda s, i, v: [
+                x for cue in live.cue_points for x in cue
+            ],
+            ("song", "beat"): lambda s, i, v: [int(s["current_song_time"])],
+            ("song", "session_record_status"): lambda s, i, v: [
+                int(s["session_record"])
+            ],
+            ("view", "is_view_visible"): lambda s, i, v: [True],
+            ("application", "version"): lambda s, i, v: [12, 1],
+            ("track", "num_devices"): lambda t, i, v: [len(t.devices)],
+            ("track", "send"): lambda t, i, v: [t.sends[i[1]]],
+            ("track", "clips/name"): clip_column("name"),
+            ("track", "clips/length"): clip_column("length"),
+            ("track", "clips/color"): clip_column("color"),
+            ("track", "devices/name"): device_column("name"),
+            ("track", "devices/type"): device_column("type"),
+            ("track", "devices/class_name"): device_column("class_name"),
+            ("track", "playing_slot_index"): lambda t, i, v: [playing_slot(t)],
+            ("track", "fired_slot_index"): lambda t, i, v: [-1],
+            ("track", "output_meter_level"): meter,
+            ("track", "output_meter_left"): meter,
+            ("track", "output_meter_right"): meter,
+            ("scene", "is_empty"): lambda s, i, v: [
+                all(t.slots[i[0]] is None for t in live.tracks)
+            ],
+            ("clip_slot", "has_clip"): lambda s, i, v: [slot_clip(i) is not None],
+            ("clip_slot", "is_playing"): lambda s, i, v: [
+                slot_clip(i) is not None and slot_clip(i).props["is_playing"]
+            ],
+            ("clip_slot", "is_triggered"): lambda s, i, v: [False],
+            ("clip_slot", "is_recording"): lambda s, i, v: [False],
+            ("clip", "notes"): lambda c, i, v: [x for note in c.notes for x in note],
+            ("device", "num_parameters"): lambda d, i, v: [len(d.parameters)],
+            ("device", "parameter/name"): parameter("name"),
+            ("device", "parameter/value"): parameter("value"),
+            ("device", "parameter/min"): parameter("min"),
+            ("device", "parameter/max"): parameter("max"),
+            ("device", "parameter/is_quantized"): parameter("is_quantized"),
+            ("device", "parameter/value_string"): lambda d, i, v: [
+                f"{d.parameters[i[2]]['value']:.2f}"
+            ],
+            ("device", "parameters/name"): parameters("name"),
+            ("device", "parameters/value"): parameters("value"),
+            ("device", "parameters/min"): parameters("min"),
+            ("device", "parameters/max"): parameters("max"),
+            ("device", "parameters/is_quantized"): parameters("is_quantized"),
+        }
+
+    def _make_setters(self) -> dict:
+        def set_send(track, indices, values):
+            sends = track.sends
+            s = indices[1]
+            old, new = sends[s], float(values[0])
+
+            def apply(v):
+                sends[s] = v
+                self._notify("track", "send", indices)
+
+            apply(new)
+            self._record(lambda: apply(old), lambda: apply(new))
+
+        def set_parameter(device, indices, values):
+            parameter = device.parameters[indices[2]]
+            value = min(max(float(values[0]), parameter["min"]), parameter["max"])
+            self._assign(
+                "device", "parameter/value", indices, parameter, value, key="value"
+            )
+
+        def set_parameters(device, indices, values):
+            for p, value in enumerate(values[: len(device.parameters)]):
+                set_parameter(device, (*indices, p), (value,))
+
+        def set_log_level(api, indices, values):
+            api["log_level"] = str(values[0])
+
+        return {
+            ("track", "send"): set_send,
+            ("device", "parameter/value"): set_parameter,
+            ("device", "parameters/value"): set_parameters,
+            ("api", "log_level"): set_log_level,
+        }
+
+    # Actions (addresses without get/set)
+
+    def _make_actions(self) -> dict:
+        live = self.live_set
+
+        def track_index(index: int) -> int:
+            return len(live.tracks) if index < 0 else index
+
+        def insert_track(index: int, track: FakeTrack) -> None:
+            self._edit(
+                lambda: live.tracks.insert(index, track),
+                lambda: live.tracks.remove(track),
+            )
+
+        def create_track(midi: bool):
+            def create(index: int = -1):
+                index = track_index(index)
+                name = f"{index + 1}-{'MIDI' if midi else 'Audio'}"
+                insert_track(
+                    index,
+                    FakeTrack(name, midi, len(live.scenes), len(live.return_tracks)),
+                )
+
+            return create
+
+        def delete_track(index: int):
+            track = live.tracks[index]
+            self._edit(
+                lambda: live.tracks.remove(track),
+                lambda: live.tracks.insert(index, track),
+            )
+
+        def duplicate_track(index: int):
+            insert_track(index + 1, copy.deepcopy(live.tracks[index]))
+
+        def create_return_track():
+            def do():
+                live.return_tracks.append(f"{chr(ord('A') + len(live.return_tracks))}-Return")
+                for track in live.tracks:
+                    track.sends.append(0.0)
+
+            def undo():
+                live.return_tracks.pop()
+                for track in live.tracks:
+                    track.sends.pop()
+
+            self._edit(do, undo)
+
+        def delete_return_track(index: int):
+            name = live.return_tracks[index]
+            levels = [track.sends[index] for track in live.tracks]
+
+            def do():
+                del live.return_tracks[index]
+                for track in live.tracks:
+                    del track.sends[index]
+
+            def undo():
+                live.return_tracks.insert(index, name)
+                for track, level in zip(live.tracks, levels):
+                    track.sends.insert(index, level)
+
+            self._edit(do, undo)
+
+        def insert_scene(index: int, scene: FakeScene, clips: list) -> None:
+            def do():
+                live.scenes.insert(index, scene)
+                for track, clip in zip(live.tracks, clips):
+                    track.slots.insert(index, clip)
+                    track.slot_props.insert(index, {"has_stop_button": True})
+
+            def undo():
+                del live.scenes[index]
+                for track in live.tracks:
+                    del track.slots[index]
+                    del track.slot_props[index]
+
+            self._edit(do, undo)
+
+        def create_scene(index: int = -1):
+            index = len(live.scenes) if index < 0 else index
+            insert_scene(index, FakeScene(), [None] * len(live.tracks))
+
+        def delete_scene(index: int):
+            scene = live.scenes[index]
+            clips = [track.slots[index] for track in live.tracks]
+            slot_props = [track.slot_props[index] for track in live.tracks]
+
+            def do():
+                del live.scenes[index]
+                for track in live.tracks:
+                    del track.slots[index]
+                    del track.slot_props[index]
+
+            def undo():
+                live.scenes.insert(index, scene)
+                for track, clip, props in zip(live.tracks, clips, slot_props):
+                    track.slots.insert(index, clip)
+                    track.slot_props.insert(index, props)
+
+            self._edit(do, undo)
+
+        def duplicate_scene(index: int):
+            insert_scene(
+                index + 1,
+                copy.deepcopy(live.scenes[index]),
+                [copy.deepcopy(track.slots[index]) for track in live.tracks],
+            )
+
+        def undo():
+            if self._undo:
+                undo_fn, redo_fn = self._undo.pop()
+                self._replaying = True
+                try:
+                    undo_fn()
+                finally:
+                    self._replaying = False
+                self._redo.append((undo_fn, redo_fn))
+
+        def redo():
+            if self._redo:
+                undo_fn, redo_fn = self._redo.pop()
+                self._replaying = True
+                try:
+                    redo_fn()
+                finally:
+                    self._replaying = False
+                self._undo.append((undo_fn, redo_fn))
+
+        def set_playing(playing: bool, reset: bool = False):
+            def action():
+                if reset:
+                    live.song["current_song_time"] = 0.0
+                self._assign("song", "is_playing", (), live.song, playing, undoable=False)
+
+            return action
+
+        def stop_playing():
+            set_playing(False)()
+            for track in live.tracks:
+                stop_track(track)
+
+        def stop_track(track: FakeTrack):
+            for clip in track.slots:
+                if clip is not None:
+                    clip.props["is_playing"] = False
+
+        def stop_all_clips():
+            for track in live.tracks:
+                stop_track(track)
+
+        def jump_by(beats: float):
+            song = live.song
+            song["current_song_time"] = max(song["current_song_time"] + beats, 0.0)
+
+        def cue_add_or_delete():
+            now = live.song["current_song_time"]
+            for cue in live.cue_points:
+                if abs(cue[1] - now) < 1e-6:
+                    live.cue_points.remove(cue)
+                    return
+            live.cue_points.append(["", now])
+            live.cue_points.sort(key=lambda cue: cue[1])
+
+        def cue_jump(direction: int):
+            def jump():
+                now = live.song["current_song_time"]
+                times = [cue[1] for cue in live.cue_points]
+                targets = [t for t in times if (t - now) * direction > 1e-6]
+                if targets:
+                    live.song["current_song_time"] = (
+                        min(targets) if direction > 0 else max(targets)
+                    )
+
+            return jump
+
+        def cue_jump_to(index: int):
+            live.song["current_song_time"] = live.cue_points[index][1]
+
+        def cue_set_name(index: int, name: str):
+            live.cue_points[index][0] = name
+
+        def trigger_session_record():
+            song = live.song
+            self._assign("song", "session_record", (), song, not song["session_record"])
+
+        def insert_device(t: int, name: str, index: int = -1):
+            track = live.tracks[t]
+            match = _find_device(name)
+            if match is None:
+                return (t, -1)
+            index = len(track.devices) if index < 0 else index
+            device = FakeDevice(match)
+            self._edit(
+                lambda: track.devices.insert(index, device),
+                lambda: track.devices.remove(device),
+            )
+            return (t, index)
+
+        def delete_device(t: int, d: int):
+            track = live.tracks[t]
+            device = track.devices[d]
+            self._edit(
+                lambda: track.devices.remove(device),
+                lambda: track.devices.insert(d, device),
+            )
+
+        def create_clip(t: int, s: int, length: float = 4.0):
+            track = live.tracks[t]
+            if track.slots[s] is not None:
+                raise FakeError("Clip slot already has a clip")
+            if not track.props["has_midi_input"]:
+                raise FakeError("Can only create clips on MIDI tracks")
+            set_slot(track, s, FakeClip(float(length)))
+
+        def set_slot(track: FakeTrack, s: int, clip: FakeClip | None):
+            old = track.slots[s]
+
+            def apply(value):
+                track.slots[s] = value
+
+            self._edit(lambda: apply(clip), lambda: apply(old))
+
+        def delete_clip(t: int, s: int):
+            set_slot(live.tracks[t], s, None)
+
+        def duplicate_clip_to(t: int, s: int, target_t: int, target_s: int):
+            clip = live.tracks[t].slots[s]
+            if clip is None:
+                raise FakeError("No clip in slot")
+            set_slot(live.tracks[target_t], target_s, copy.deepcopy(clip))
+
+        def fire_clip(t: int, s: int):
+            track = live.tracks[t]
+            clip = track.slots[s]
+            stop_track(track)
+            if clip is not None:
+                clip.props["is_playing"] = True
+                set_playing(True)()
+
+        def fire_scene(s: int):
+            for t, track in enumerate(live.tracks):
+                if track.slots[s] is not None:
+                    fire_clip(t, s)
+
+        def stop_clip(t: int, s: int):
+            clip = live.tracks[t].slots[s]
+            if clip is not None:
+                clip.props["is_playing"] = False
+
+        def set_notes(clip: FakeClip, notes: list[tuple]):
+            old = clip.notes
+
+            def apply(value):
+                clip.notes = value
+
+            self._edit(lambda: apply(notes), lambda: apply(old))
+
+        def add_notes(t: int, s: int, *values):
+            clip = self._target("clip", (t, s))
+            added = [
+                (
+                    int(values[i]),
+                    float(values[i + 1]),
+                    float(values[i + 2]),
+                    int(values[i + 3]),
+                    bool(values[i + 4]),
+                )
+                for i in range(0, len(values) - 4, 5)
+            ]
+            set_notes(clip, clip.notes + added)
+
+        def remove_notes(t: int, s: int, *ranges):
+            clip = self._target("clip", (t, s))
+            if len(ranges) >= 4:
+                pitch_start, pitch_span, time_start, time_span = ranges[:4]
+                kept = [
+                    n
+                    for n in clip.notes
+                    if not (
+                        pitch_start <= n[0] < pitch_start + pitch_span
+                        and time_start <= n[1] < time_start + time_span
+                    )
+                ]
+            else:
+                kept = []
+            set_notes(clip, kept)
+
+        def duplicate_loop(t: int, s: int):
+            clip = self._target("clip", (t, s))
+            start, end = clip.props["loop_start"], clip.props["loop_end"]
+            span = end - start
+            copies = [
+                (p, st + span, d, v, m) for p, st, d, v, m in clip.notes if start <= st < end
+            ]
+            set_notes(clip, clip.notes + copies)
+            for prop in ("loop_end", "length", "end_time", "end_marker"):
+                clip.props[prop] = clip.props[prop] + span
+
+        def select_device_track():
+            return live.tracks[live.view["selected_track"]]
+
+        def load(name: str):
+            match = _find_device(name)
+            if match is None:
+                return False
+            track = select_device_track()
+            device = FakeDevice(match)
+            self._edit(
+                lambda: track.devices.append(device),
+                lambda: track.devices.remove(device),
+            )
+            return True
+
+        def catalog(device_type: int):
+            return lambda: tuple(
+                name for name, (_, t, _) in DEVICE_CATALOG.items() if t == device_type
+            )
+
+        def browser_items():
+            folders = {0: "Audio Effects", 1: "Instruments", 2: "MIDI Effects"}
+            return [
+                (name, f"{PACK}/{folders[t]}/{name}")
+                for name, (_, t, _) in DEVICE_CATALOG.items()
+            ] + [(kit, f"{PACK}/Drums/{kit}") for kit in DRUM_KITS]
+
+        def search(query: str, max_results: int = 50, max_depth: int = 10):
+            query = query.lower()
+            return tuple(
+                f"{name}|{PACK}|{path}"
+                for name, path in browser_items()
+                if query in name.lower()
+            )[:max_results]
+
+        def search_and_load(query: str):
+            query = query.lower()
+            for name, _ in browser_items():
+                if query in name.lower() and load(name):
+                    return (name,)
+            return ("",)
+
+        def load_item(path: str):
+            return (int(load(path.rsplit("/", 1)[-1])),)
+
+        def pack_contents(pack: str, max_depth: int = 10):
+            if pack.lower() not in PACK.lower():
+                return ()
+            return tuple(path for _, path in browser_items())
+
+        def no_op(*args):
+            return None
+
+        return {
+            ("song", "start_playing"): set_playing(True, reset=True),
+            ("song", "continue_playing"): set_playing(True),
+            ("song", "stop_playing"): stop_playing,
+            ("song", "create_midi_track"): create_track(True),
+            ("song", "create_audio_track"): create_track(False),
+            ("song", "create_return_track"): create_return_track,
+            ("song", "delete_track"): delete_track,
+            ("song", "delete_return_track"): delete_return_track,
+            ("song", "duplicate_track"): duplicate_track,
+            ("song", "create_scene"): create_scene,
+            ("song", "delete_scene"): delete_scene,
+            ("song", "duplicate_scene"): duplicate_scene,
+            ("song", "undo"): undo,
+            ("song", "redo"): redo,
+            ("song", "stop_all_clips"): stop_all_clips,
+            ("song", "capture_midi"): no_op,
+            ("song", "tap_tempo"): no_op,
+            ("song", "jump_by"): jump_by,
+            ("song", "jump_to_next_cue"): cue_jump(1),
+            ("song", "jump_to_prev_cue"): cue_jump(-1),
+            ("song", "cue_point/add_or_delete"): cue_add_or_delete,
+            ("song", "cue_point/jump"): cue_jump_to,
+            ("song", "cue_point/set/name"): cue_set_name,
+            ("song", "trigger_session_record"): trigger_session_record,
+            ("track", "stop_all_clips"): lambda t: stop_track(live.tracks[t]),
+            ("track", "insert_device"): insert_device,
+            ("track", "delete_device"): delete_device,
+            ("clip_slot", "create_clip"): create_clip,
+            ("clip_slot", "delete_clip"): delete_clip,
+            ("clip_slot", "duplicate_clip_to"): duplicate_clip_to,
+            ("clip_slot", "fire"): fire_clip,
+            ("clip_slot", "stop"): stop_clip,
+            ("clip", "fire"): fire_clip,
+            ("clip", "stop"): stop_clip,
+            ("clip", "add/notes"): add_notes,
+            ("clip", "remove/notes"): remove_notes,
+            ("clip", "duplicate_loop"): duplicate_loop,
+            ("scene", "fire"): fire_scene,
+            ("scene", "fire_as_selected"): fire_scene,
+            ("scene", "fire_selected"): lambda: fire_scene(live.view["selected_scene"]),
+            ("view", "focus_view"): no_op,
+            ("api", "reload"): no_op,
+            ("api", "show_message"): no_op,
+            ("midimap", "map_cc"): no_op,
+            ("browser", "list_packs"): lambda: (PACK,),
+            ("browser", "list_pack_contents"): pack_contents,
+            ("browser", "list_instruments"): catalog(1),
+            ("browser", "list_audio_effects"): catalog(0),
+            ("browser", "list_midi_effects"): catalog(2),
+            ("browser", "list_drums"): lambda: DRUM_KITS,
+            ("browser", "list_sounds"): lambda: SOUNDS,
+            ("browser", "search"): search,
+            ("browser", "search_and_load"): search_and_load,
+            ("browser", "load_item"): load_item,
+        }
+
+
+def _find_device(name: str) -> str | None:
+    """Return the catalog name matching a device name (case-insensitive)."""
+    for candidate in DEVICE_CATALOG:
+        if candidate.lower() == name.lower():
+            return candidate
+    return None
@@ -0,0 +1,286 @@
+"""Frame-based output metering for many tracks.
+
+Polling Track.get_output_meter_* costs one round trip per meter per frame,
+so 32 stereo tracks at 30 fps is close to 2000 queries a second. A
+MeterStream gets the levels either from listeners (mode="listen", the
+default: AbletonOSC pushes meter changes and the stream keeps the latest
+value) or with one pipelined batch of queries per frame (mode="poll").
+
+The consumer calls frame() once per display frame. Each call samples every
+meter once, stores the sample in a fixed-size ring buffer and updates the
+peak-hold and RMS values incrementally, in O(meters):
+
+    with MeterStream(client, channels=("left", "right")) as meters:
+        while running:
+            frame = meters.frame()
+            draw(frame.levels, frame.peaks, frame.rms)
+            sleep_until_next_frame()
+
+Meters are ordered track-major: meter i is channel i % len(channels) of the
+track at position i // len(channels) in track_indices.
+"""
+
+import math
+from array import array
+from typing import Iterable, NamedTuple
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
+from abletonosc_client.track import Track
+
+# Meter channels and the track properties they read
+METER_CHANNELS = {
+    "level": "output_meter_level",
+    "left": "output_meter_left",
+    "right": "output_meter_right",
+}
+
+METER_MODES = ("listen", "poll")
+
+
+class MeterFrame(NamedTuple):
+    """One frame of meter values, as returned by MeterStream.frame().
+
+    Attributes:
+        index: Frame number (0 for the first frame)
+        levels: Level per meter in this frame (0.0-1.0)
+        peaks: Held peak per meter
+        rms: RMS per meter over the last `history` frames
+    """
+
+    index: int
+    levels: array
+    peaks: array
+    rms: array
+
+
+class MeterStream:
+    """Per-frame output meter levels with peak-hold and RMS for many tracks.
+
+    Attributes:
+        track_indices: Metered tracks, in meter order
+        channels: Metered channels per track ("level", "left", "right")
+        num_meters: len(track_indices) * len(channels)
+        frames: Frames taken so far
+        missed_frames: Poll-mode frames whose queries timed out (the
+                       previous levels were reused)
+    """
+
+    def __init__(
+        self,
+        client: AbletonOSCClient,
+        track_indices: Iterable[int] | None = None,
+        channels: Iterable[str] = ("level",),
+        mode: str = "listen",
+        history: int = 32,
+        hold_frames: int = 30,
+        fall: float = 0.02,
+        batch_size: int = 256,
+        timeout: float = 0.1,
+    ):
+        """Create a stream; start() resolves the tracks and starts metering.
+
+        Args:
+            client: Client (or client-like wrapper) to meter through
+            track_indices: Tracks to meter (default: every track, counted
+                           by start())
+            channels: Channels per track, from "level", "left" and "right"
+            mode: "listen" (meter listeners) or "poll" (queries per frame)
+            history: Frames kept per meter; also the RMS window
+            hold_frames: Frames a peak is held before it starts to fall
+            fall: Amount a released peak falls per frame
+            batch_size: Queries per query_many() call in poll mode
+            timeout: Deadline per query_many() call in poll mode, in seconds
+
+        Raises:
+            ValueError: If a channel or the mode is unknown, or history is
+                        less than 1
+        """
+        channels = tuple(channels)
+        for channel in channels:
+            if channel not in METER_CHANNELS:
+                raise ValueError(
+                    f"Invalid channel: {channel}. "
+                    f"Must be one of {tuple(METER_CHANNELS)}"
+                )
+        if mode not in METER_MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {METER_MODES}")
+        if history < 1:
+            raise ValueError(f"history must be at least 1, got {history}")
+        self._client = client
+        self.channels = channels
+        self.mode = mode
+        self.history = history
+        self.hold_frames = hold_frames
+        self.fall = fall
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.frames = 0
+        self.missed_frames = 0
+        self._requested_tracks = None if track_indices is None else tuple(track_indices)
+        self._channel_offsets = {
+            METER_CHANNELS[channel]: offset for offset, channel in enumerate(channels)
+        }
+        self._subscriptions: list[Subscription] = []
+        self._allocate(self._requested_tracks or ())
+
+    def __enter__(self) -> "MeterStream":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _allocate(self, track_indices: tuple[int, ...]) -> None:
+        """Size every buffer for track_indices and reset the history."""
+        self.track_indices = tuple(int(t) for t in track_indices)
+        self.num_meters = n = len(self.track_indices) * len(self.channels)
+        self._slots = {
+            t: i * len(self.channels) for i, t in enumerate(self.track_indices)
+        }
+        # Last value received, and the maximum since the last frame (-1.0 if
+        # nothing arrived; listen mode only)
+        self._latest = array("d", [0.0]) * n
+        self._frame_max = array("d", [-1.0]) * n
+        # history rows of num_meters samples; _position is the oldest row
+        self._ring = array("d", [0.0]) * (n * self.history)
+        self._position = 0
+        self._sum_squares = array("d", [0.0]) * n
+        self._held = array("i", [0]) * n
+        self.levels = array("d", [0.0]) * n
+        self.peaks = array("d", [0.0]) * n
+        self.rms = array("d", [0.0]) * n
+        self._requests = [
+            (f"/live/track/get/{METER_CHANNELS[channel]}", (t,))
+            for t in self.track_indices
+            for channel in self.channels
+        ]
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Resolve the metered tracks and, in listen mode, start listening."""
+        self.close()
+        track_indices = self._requested_tracks
+        if track_indices is None:
+            num_tracks = int(self._client.query("/live/song/get/num_tracks")[0])
+            track_indices = tuple(range(num_tracks))
+        self._allocate(track_indices)
+        self.frames = 0
+        if self.mode == "listen" and self.num_meters:
+            self._subscriptions = Track(self._client).subscribe_many(
+                list(self._channel_offsets), self.track_indices, self._on_update
+            )
+
+    def close(self) -> None:
+        """Stop listening; the last frame stays readable."""
+        subscriptions, self._subscriptions = self._subscriptions, []
+        if subscriptions:
+            self._client.router.unsubscribe_many(subscriptions)
+
+    def _on_update(self, track_index: int, prop: str, value: float) -> None:
+        slot = self._slots.get(track_index)
+        if slot is None:
+            return
+        i = slot + self._channel_offsets[prop]
+        self._latest[i] = value
+        # Keep short transients between two frames
+        if value > self._frame_max[i]:
+            self._frame_max[i] = value
+
+    def _poll(self) -> None:
+        """Query every meter in pipelined batches."""
+        requests = self._requests
+        values = self._latest
+        for start in range(0, len(requests), self.batch_size):
+            try:
+                results = self._client.query_many(
+                    requests[start : start + self.batch_size], timeout=self.timeout
+                )
+            except TimeoutError:
+                self.missed_frames += 1
+                return
+            # Response format: (track_index, level)
+            for i, result in enumerate(results, start):
+                values[i] = float(result[1])
+
+    # Frames
+
+    def frame(self) -> MeterFrame:
+        """Sample every meter once and update peaks and RMS.
+
+        In listen mode a meter's sample is the highest value received since
+        the previous frame, or the last value if none arrived.
+
+        Returns:
+            MeterFrame with copies of this frame's levels, peaks and RMS
+        """
+        if self.mode == "poll":
+            self._poll()
+        n = self.num_meters
+        latest, frame_max = self._latest, self._frame_max
+        ring, sum_squares = self._ring, self._sum_squares
+        levels, peaks, rms, held = self.levels, self.peaks, self.rms, self._held
+        row = self._position * n
+        for i in range(n):
+            value = frame_max[i]
+            if value < 0.0:
+                value = latest[i]
+            else:
+                frame_max[i] = -1.0
+            oldest = ring[row + i]
+            ring[row + i] = value
+            sum_squares[i] += value * value - oldest * oldest
+            levels[i] = value
+            if value >= peaks[i]:
+                peaks[i] = value
+                held[i] = self.hold_frames
+            elif held[i] > 0:
+                held[i] -= 1
+            else:
+                peaks[i] = max(value, peaks[i] - self.fall)
+
+        self._position = (self._position + 1) % self.history
+        if self._position == 0:
+            # Once per lap, recompute the sums to discard rounding drift
+            for i in range(n):
+                sum_squares[i] = math.fsum(
+                    ring[j] * ring[j] for j in range(i, len(ring), n)
+                )
+        for i in range(n):
+            rms[i] = math.sqrt(max(sum_squares[i], 0.0) / self.history)
+        index = self.frames
+        self.frames += 1
+        return MeterFrame(index, levels[:], peaks[:], rms[:])
+
+    # Local reads
+
+    def _meter(self, track_index: int, channel: str) -> int:
+        """Return the meter index of a track's channel.
+
+        Raises:
+            KeyError: If the track or channel is not metered
+        """
+        slot = self._slots.get(track_index)
+        if slot is None or channel not in self.channels:
+            raise KeyError(f"Track {track_index} {channel} is not metered")
+        return slot + self.channels.index(channel)
+
+    def get_level(self, track_index: int, channel: str = "level") -> float:
+        """Return a meter's level in the last frame."""
+        return self.levels[self._meter(track_index, channel)]
+
+    def get_peak(self, track_index: int, channel: str = "level") -> float:
+        """Return a meter's held peak."""
+        return self.peaks[self._meter(track_index, channel)]
+
+    def get_rms(self, track_index: int, channel: str = "level") -> float:
+        """Return a meter's RMS over the last `history` frames."""
+        return self.rms[self._meter(track_index, channel)]
+
+    def get_history(self, track_index: int, channel: str = "level") -> list[float]:
+        """Return a meter's last `history` samples, oldest first."""
+        i, n = self._meter(track_index, channel), self.num_meters
+        samples = self._ring[i::n]
+        return list(samples[self._position :] + samples[: self._position])
+
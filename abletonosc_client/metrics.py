@@ -0,0 +1,288 @@
+"""Per-address instrumentation for the OSC clients.
+
+An opt-in ClientMetrics passed as metrics= to AbletonOSCClient or
+AsyncAbletonOSCClient records, for every OSC address:
+
+    sent, sent_bytes          messages sent (including resends) and their size
+    received, received_bytes  messages received and their encoded size
+    timeouts                  queries that got no response in time
+    latency                   query round-trip times, in a LatencyHistogram
+
+Results are available as a dict (as_dict), in the Prometheus text exposition
+format (prometheus_text) or as a stream of MetricEvents passed to a
+callback. Without metrics the clients only pay for an `is None` check.
+"""
+
+import threading
+import time
+from array import array
+from typing import Any, Callable, NamedTuple, Sequence
+
+from abletonosc_client.encoding import message_size
+
+# Quantiles reported in as_dict() and prometheus_text()
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear histogram of durations (HDR-style).
+
+    Durations are recorded in whole microseconds. Values below 2**bits are
+    exact; larger ones fall into buckets whose width is a constant fraction
+    (2**-(bits - 1)) of their value, so relative error stays below ~3% with
+    the default 6 bits, whatever the magnitude. Values above max_seconds are
+    clamped. Memory is one counter per bucket, fixed at creation.
+    """
+
+    def __init__(self, bits: int = 6, max_seconds: float = 3600.0):
+        """Create an empty histogram.
+
+        Args:
+            bits: Precision; each power of two is split into 2**(bits-1) buckets
+            max_seconds: Largest duration tracked
+        """
+        self._bits = bits
+        self._sub = 1 << bits
+        self._half = self._sub >> 1
+        self._max = int(max_seconds * 1e6)
+        self._counts = array("Q", bytes(8 * (self._index(self._max) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def _index(self, micros: int) -> int:
+        if micros < self._sub:
+            return micros
+        shift = micros.bit_length() - self._bits
+        return self._sub + (shift - 1) * self._half + (micros >> shift) - self._half
+
+    def _value(self, index: int) -> float:
+        """Return the midpoint of a bucket, in microseconds."""
+        if index < self._sub:
+            return float(index)
+        shift, offset = divmod(index - self._sub, self._half)
+        shift += 1
+        low = (offset + self._half) << shift
+        return low + ((1 << shift) - 1) / 2
+
+    def record(self, seconds: float) -> None:
+        """Add a duration."""
+        micros = min(max(int(seconds * 1e6), 0), self._max)
+        self._counts[self._index(micros)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, quantile: float) -> float:
+        """Return the duration below which a fraction of samples fall.
+
+        Args:
+            quantile: Fraction between 0.0 and 1.0
+
+        Returns:
+            Duration in seconds (0.0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(quantile * self.count, 1)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                value = self._value(index) / 1e6
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds (0.0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Summarize as count, sum, mean, min, max and QUANTILES."""
+        summary = {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{quantile * 100:g}"] = self.percentile(quantile)
+        return summary
+
+
+class MetricEvent(NamedTuple):
+    """A single instrumented event, as passed to the metrics callback.
+
+    Attributes:
+        kind: "send", "receive", "response" or "timeout"
+        address: OSC address
+        size: Encoded message size in bytes (0 for "response"/"timeout")
+        latency: Round-trip time in seconds ("response" only, else 0.0)
+    """
+
+    kind: str
+    address: str
+    size: int
+    latency: float
+
+
+class _AddressStats:
+    __slots__ = ("sent", "sent_bytes", "received", "received_bytes", "timeouts", "latency")
+
+    def __init__(self):
+        self.sent = 0
+        self.sent_bytes = 0
+        self.received = 0
+        self.received_bytes = 0
+        self.timeouts = 0
+        self.latency = LatencyHistogram()
+
+
+class ClientMetrics:
+    """Counters and latency histograms per OSC address.
+
+    Example:
+        metrics = ClientMetrics()
+        client = AbletonOSCClient(metrics=metrics)
+        ...
+        for address, stats in metrics.top(5):
+            print(address, stats["latency"]["sum"])
+        print(metrics.prometheus_text())
+    """
+
+    def __init__(self, callback: Callable[[MetricEvent], None] | None = None):
+        """Create empty metrics.
+
+        Args:
+            callback: Called with a MetricEvent for every recorded event, on
+                      the thread that caused it
+        """
+        self.callback = callback
+        self._stats: dict[str, _AddressStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, address: str) -> _AddressStats:
+        stats = self._stats.get(address)
+        if stats is None:
+            stats = self._stats.setdefault(address, _AddressStats())
+        return stats
+
+    def on_send(self, address: str, size: int) -> None:
+        """Record an outgoing message of size bytes."""
+        with self._lock:
+            stats = self._get(address)
+            stats.sent += 1
+            stats.sent_bytes += size
+        if self.callback is not None:
+            self.callback(MetricEvent("send", address, size, 0.0))
+
+    def on_receive(self, address: str, args: Sequence[Any]) -> None:
+        """Record an incoming message."""
+        size = message_size(address, args)
+        with self._lock:
+            stats = self._get(address)
+            stats.received += 1
+            stats.received_bytes += size
+        if self.callback is not None:
+            self.callback(MetricEvent("receive", address, size, 0.0))
+
+    def on_response(self, address: str, sent: float) -> None:
+        """Record a query answered; sent is its time.perf_counter() send time."""
+        latency = time.perf_counter() - sent
+        with self._lock:
+            self._get(address).latency.record(latency)
+        if self.callback is not None:
+            self.callback(MetricEvent("response", address, 0, latency))
+
+    def on_timeout(self, address: str) -> None:
+        """Record a query that was not answered in time."""
+        with self._lock:
+            self._get(address).timeouts += 1
+        if self.callback is not None:
+            self.callback(MetricEvent("timeout", address, 0, 0.0))
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def as_dict(self) -> dict[str, dict]:
+        """Return {address: {counter: value, "latency": {...}}}."""
+        with self._lock:
+            return {
+                address: {
+                    "sent": stats.sent,
+                    "sent_bytes": stats.sent_bytes,
+                    "received": stats.received,
+                    "received_bytes": stats.received_bytes,
+                    "timeouts": stats.timeouts,
+                    "latency": stats.latency.as_dict(),
+                }
+                for address, stats in sorted(self._stats.items())
+            }
+
+    def top(self, n: int = 10, by: str = "sum") -> list[tuple[str, dict]]:
+        """Return the n addresses with the highest latency statistic.
+
+        Args:
+            n: Number of addresses
+            by: Latency statistic to rank by (e.g. "sum", "p99", "count")
+
+        Returns:
+            List of (address, stats) pairs, as in as_dict(), highest first
+        """
+        ranked = sorted(
+            self.as_dict().items(), key=lambda item: item[1]["latency"][by], reverse=True
+        )
+        return ranked[:n]
+
+    def prometheus_text(self, prefix: str = "abletonosc") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text with one counter family per counter and a summary of query
+            latency, labelled by address
+        """
+        data = self.as_dict()
+        lines = []
+        counters = (
+            ("sent", "messages_sent_total", "OSC messages sent"),
+            ("sent_bytes", "bytes_sent_total", "Bytes of OSC messages sent"),
+            ("received", "messages_received_total", "OSC messages received"),
+            ("received_bytes", "bytes_received_total", "Bytes of OSC messages received"),
+            ("timeouts", "query_timeouts_total", "Queries without a response in time"),
+        )
+        for key, name, help_text in counters:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for address, stats in data.items():
+                lines.append(f'{prefix}_{name}{{address="{_escape(address)}"}} {stats[key]}')
+
+        name = f"{prefix}_query_latency_seconds"
+        lines.append(f"# HELP {name} Query round-trip time")
+        lines.append(f"# TYPE {name} summary")
+        for address, stats in data.items():
+            latency = stats["latency"]
+            if not latency["count"]:
+                continue
+            label = f'address="{_escape(address)}"'
+            for quantile in QUANTILES:
+                value = latency[f"p{quantile * 100:g}"]
+                lines.append(f'{name}{{{label},quantile="{quantile:g}"}} {value:.9g}')
+            lines.append(f"{name}_sum{{{label}}} {latency['sum']:.9g}")
+            lines.append(f"{name}_count{{{label}}} {latency['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,210 @@
+"""A local mirror of the mixer, kept current by listeners.
+
+Console UIs read every track's volume, panning, mute, solo and sends many
+times a second. Polling costs one query per value per frame; a MixerMirror
+reads them all once with pipelined queries, then keeps the copy current
+through listeners, so reads are local array lookups:
+
+    with MixerMirror(client, num_sends=2) as mixer:
+        while running:
+            draw(mixer.volume, mixer.mute)  # no network traffic
+            level = mixer.get_send(3, 1)
+
+The values live in one array per property (array("d") for levels,
+array("b") for switches), indexed by track. After reconnecting to a
+restarted Live or AbletonOSC, call resync() to re-read everything and
+register the listeners again.
+"""
+
+from array import array
+from typing import Any
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
+from abletonosc_client.track import Track
+
+# Mirrored per-track properties and their array typecodes
+MIXER_PROPERTIES = {
+    "volume": "d",
+    "panning": "d",
+    "mute": "b",
+    "solo": "b",
+}
+
+
+class MixerMirror:
+    """Array-backed copy of every track's mixer state.
+
+    Attributes:
+        num_tracks: Tracks mirrored
+        num_sends: Sends mirrored per track
+        volume: Volume per track (0.0-1.0)
+        panning: Panning per track (-1.0 to 1.0)
+        mute: Mute per track (0 or 1)
+        solo: Solo per track (0 or 1)
+        sends: Send levels, num_sends per track, track-major
+        updates: Listener updates applied since start()
+    """
+
+    def __init__(
+        self,
+        client: AbletonOSCClient,
+        num_sends: int = 0,
+        batch_size: int = 256,
+        timeout: float = 2.0,
+    ):
+        """Create an empty mirror; start() fills it and starts listening.
+
+        Args:
+            client: Client (or client-like wrapper) to mirror through
+            num_sends: Sends per track to mirror (the number of return tracks)
+            batch_size: Queries per query_many() call when refreshing
+            timeout: Deadline per query_many() call in seconds
+        """
+        self._client = client
+        self._track = Track(client)
+        self.num_sends = num_sends
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.num_tracks = 0
+        self.updates = 0
+        self._subscriptions: list[Subscription] = []
+        for prop, typecode in MIXER_PROPERTIES.items():
+            setattr(self, prop, array(typecode))
+        self.sends = array("d")
+
+    def __enter__(self) -> "MixerMirror":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Synchronization
+
+    def start(self) -> None:
+        """Read the whole mixer, then listen for changes."""
+        self.refresh()
+        self._subscribe()
+
+    def refresh(self) -> None:
+        """Re-read every mirrored value with pipelined queries.
+
+        Resizes the arrays if the number of tracks changed; tracks beyond
+        the old count are only listened to after resync().
+        """
+        num_tracks = int(self._client.query("/live/song/get/num_tracks")[0])
+        requests = [
+            (f"/live/track/get/{prop}", (t,))
+            for t in range(num_tracks)
+            for prop in MIXER_PROPERTIES
+        ]
+        requests += [
+            ("/live/track/get/send", (t, s))
+            for t in range(num_tracks)
+            for s in range(self.num_sends)
+        ]
+        results: list[tuple] = []
+        for start in range(0, len(requests), self.batch_size):
+            results.extend(
+                self._client.query_many(
+                    requests[start : start + self.batch_size], timeout=self.timeout
+                )
+            )
+
+        columns = {
+            prop: array(typecode) for prop, typecode in MIXER_PROPERTIES.items()
+        }
+        props = list(MIXER_PROPERTIES)
+        # Response format: (track_index, value)
+        for i, result in enumerate(results[: num_tracks * len(props)]):
+            column = columns[props[i % len(props)]]
+            column.append(_coerce(column.typecode, result[1]))
+        # Response format: (track_index, send_index, level)
+        sends = array("d", (float(r[2]) for r in results[num_tracks * len(props) :]))
+        for prop, column in columns.items():
+            setattr(self, prop, column)
+        self.sends = sends
+        self.num_tracks = num_tracks
+
+    def resync(self) -> None:
+        """Re-read everything and register the listeners with Live again.
+
+        Use after reconnecting, or after tracks were added or removed.
+        """
+        self._unsubscribe()
+        self.start()
+
+    def _subscribe(self) -> None:
+        tracks = range(self.num_tracks)
+        self._subscriptions = self._track.subscribe_many(
+            MIXER_PROPERTIES, tracks, self._on_update
+        )
+        if self.num_sends:
+            self._subscriptions += self._client.router.subscribe_many(
+                ("/live/track/get/send", (t, s), self._on_send)
+                for t in tracks
+                for s in range(self.num_sends)
+            )
+
+    def _unsubscribe(self) -> None:
+        subscriptions, self._subscriptions = self._subscriptions, []
+        self._client.router.unsubscribe_many(subscriptions)
+
+    def _on_update(self, track_index: int, prop: str, value: Any) -> None:
+        column = getattr(self, prop)
+        if track_index < len(column):
+            column[track_index] = _coerce(column.typecode, value)
+            self.updates += 1
+
+    def _on_send(self, track_index: int, send_index: int, level: float, *_) -> None:
+        if track_index < self.num_tracks and send_index < self.num_sends:
+            self.sends[track_index * self.num_sends + send_index] = float(level)
+            self.updates += 1
+
+    def close(self) -> None:
+        """Stop listening; the last values stay readable."""
+        self._unsubscribe()
+
+    # Local reads
+
+    def get_volume(self, track_index: int) -> float:
+        """Return a track's volume (0.0-1.0)."""
+        return self.volume[track_index]
+
+    def get_panning(self, track_index: int) -> float:
+        """Return a track's panning (-1.0 to 1.0)."""
+        return self.panning[track_index]
+
+    def get_mute(self, track_index: int) -> bool:
+        """Return whether a track is muted."""
+        return bool(self.mute[track_index])
+
+    def get_solo(self, track_index: int) -> bool:
+        """Return whether a track is soloed."""
+        return bool(self.solo[track_index])
+
+    def get_send(self, track_index: int, send_index: int) -> float:
+        """Return a track's send level (0.0-1.0).
+
+        Raises:
+            IndexError: If send_index is not mirrored
+        """
+        if not 0 <= send_index < self.num_sends:
+            raise IndexError(f"Send {send_index} not mirrored ({self.num_sends} sends)")
+        return self.sends[track_index * self.num_sends + send_index]
+
+    def get_track(self, track_index: int) -> dict[str, Any]:
+        """Return all mirrored values of a track as a dict."""
+        return {
+            "volume": self.get_volume(track_index),
+            "panning": self.get_panning(track_index),
+            "mute": self.get_mute(track_index),
+            "solo": self.get_solo(track_index),
+            "sends": [self.get_send(track_index, s) for s in range(self.num_sends)],
+        }
+
+
+def _coerce(typecode: str, value: Any) -> float | int:
+    """Convert a received value for storage in an array of typecode."""
+    return float(value) if typecode == "d" else int(bool(value))
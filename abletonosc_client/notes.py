@@ -0,0 +1,341 @@
+"""MIDI note types.
+
+Note is a single note. NoteArray keeps pitch, start time, duration, velocity
+and mute in parallel `array` buffers instead of one Note object per note.
+Its transforms work on whole columns; when NumPy is installed they run
+vectorized on zero-copy views.
+"""
+
+import random
+from array import array
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional
+    _np = None
+
+# Column names and their array typecodes
+COLUMNS = (
+    ("pitch", "i"),
+    ("start_time", "d"),
+    ("duration", "d"),
+    ("velocity", "i"),
+    ("mute", "b"),
+)
+
+
+class Note(NamedTuple):
+    """Represents a MIDI note in a clip.
+
+    Attributes:
+        pitch: MIDI pitch (0-127)
+        start_time: Start position in beats
+        duration: Duration in beats
+        velocity: Velocity (0-127)
+        mute: Whether the note is muted
+    """
+
+    pitch: int
+    start_time: float
+    duration: float
+    velocity: int
+    mute: bool = False
+
+
+def _view(column: array):
+    """Return a zero-copy NumPy view of an array column."""
+    return _np.frombuffer(column, dtype=column.typecode)
+
+
+def _from_numpy(typecode: str, values) -> array:
+    """Copy a NumPy array into a new array column."""
+    column = array(typecode)
+    column.frombytes(_np.ascontiguousarray(values, dtype=typecode).tobytes())
+    return column
+
+
+class NoteArray:
+    """A sequence of MIDI notes stored column by column.
+
+    Attributes:
+        pitch: MIDI pitches (array of int)
+        start_time: Start positions in beats (array of float)
+        duration: Durations in beats (array of float)
+        velocity: Velocities (array of int)
+        mute: Mute flags (array of 0/1)
+    """
+
+    __slots__ = ("pitch", "start_time", "duration", "velocity", "mute")
+
+    def __init__(
+        self,
+        pitch: Iterable[int] = (),
+        start_time: Iterable[float] = (),
+        duration: Iterable[float] = (),
+        velocity: Iterable[int] = (),
+        mute: Iterable[int] | None = None,
+    ):
+        self.pitch = array("i", pitch)
+        self.start_time = array("d", start_time)
+        self.duration = array("d", duration)
+        self.velocity = array("i", velocity)
+        if mute is None:
+            mute = bytes(len(self.pitch))
+        self.mute = array("b", mute)
+        lengths = {len(getattr(self, name)) for name, _ in COLUMNS}
+        if len(lengths) != 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+
+    # Construction
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> "NoteArray":
+        """Build a NoteArray from Note objects.
+
+        Args:
+            notes: Notes to copy
+
+        Returns:
+            New NoteArray
+        """
+        notes = list(notes)
+        return cls(
+            [int(n.pitch) for n in notes],
+            [n.start_time for n in notes],
+            [n.duration for n in notes],
+            [int(n.velocity) for n in notes],
+            [int(n.mute) for n in notes],
+        )
+
+    @classmethod
+    def from_flat(cls, values: Sequence) -> "NoteArray":
+        """Build a NoteArray from flat OSC note values.
+
+        Args:
+            values: pitch, start_time, duration, velocity, mute repeated per
+                    note (the layout of /live/clip/get/notes after the indices)
+
+        Returns:
+            New NoteArray (a trailing partial note is ignored)
+        """
+        end = len(values) - len(values) % 5
+        values = values[:end]
+        return cls(
+            map(int, values[0::5]),
+            values[1::5],
+            values[2::5],
+            map(int, values[3::5]),
+            map(int, values[4::5]),
+        )
+
+    @classmethod
+    def from_numpy(cls, pitch, start_time, duration, velocity, mute=None) -> "NoteArray":
+        """Build a NoteArray from NumPy arrays (requires NumPy).
+
+        Args:
+            pitch: MIDI pitches
+            start_time: Start positions in beats
+            duration: Durations in beats
+            velocity: Velocities
+            mute: Mute flags (default: all unmuted)
+
+        Returns:
+            New NoteArray
+        """
+        if _np is None:
+            raise ImportError("NumPy is required for NoteArray.from_numpy")
+        notes = cls.__new__(cls)
+        notes.pitch = _from_numpy("i", pitch)
+        notes.start_time = _from_numpy("d", start_time)
+        notes.duration = _from_numpy("d", duration)
+        notes.velocity = _from_numpy("i", velocity)
+        if mute is None:
+            notes.mute = array("b", bytes(len(notes.pitch)))
+        else:
+            notes.mute = _from_numpy("b", mute)
+        return notes
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable["NoteArray"]) -> "NoteArray":
+        """Join several NoteArrays end to end.
+
+        Args:
+            arrays: NoteArrays to join
+
+        Returns:
+            New NoteArray
+        """
+        result = cls()
+        for notes in arrays:
+            for name, _ in COLUMNS:
+                getattr(result, name).extend(getattr(notes, name))
+        return result
+
+    def copy(self) -> "NoteArray":
+        """Return a copy with its own buffers."""
+        notes = NoteArray.__new__(NoteArray)
+        for name, _ in COLUMNS:
+            setattr(notes, name, getattr(self, name)[:])
+        return notes
+
+    # Conversion
+
+    def to_notes(self) -> list[Note]:
+        """Convert to a list of Note objects."""
+        return [
+            Note(p, s, d, v, bool(m))
+            for p, s, d, v, m in zip(
+                self.pitch, self.start_time, self.duration, self.velocity, self.mute
+            )
+        ]
+
+    def rows(self) -> list[tuple]:
+        """Return (pitch, start_time, duration, velocity, mute) per note."""
+        return list(
+            zip(self.pitch, self.start_time, self.duration, self.velocity, self.mute)
+        )
+
+    def to_numpy(self) -> dict:
+        """Return zero-copy NumPy views of the columns (requires NumPy).
+
+        Returns:
+            Dict of column name to NumPy array; writing to the views
+            modifies this NoteArray
+        """
+        if _np is None:
+            raise ImportError("NumPy is required for NoteArray.to_numpy")
+        return {name: _view(getattr(self, name)) for name, _ in COLUMNS}
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return len(self.pitch)
+
+    def __iter__(self) -> Iterator[Note]:
+        return iter(self.to_notes())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            notes = NoteArray.__new__(NoteArray)
+            for name, _ in COLUMNS:
+                setattr(notes, name, getattr(self, name)[index])
+            return notes
+        return Note(
+            self.pitch[index],
+            self.start_time[index],
+            self.duration[index],
+            self.velocity[index],
+            bool(self.mute[index]),
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NoteArray):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name, _ in COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"NoteArray({len(self)} notes)"
+
+    # Transforms (each returns a new NoteArray)
+
+    def _with(self, **columns) -> "NoteArray":
+        notes = self.copy()
+        for name, column in columns.items():
+            setattr(notes, name, column)
+        return notes
+
+    def transpose(self, semitones: int, low: int = 0, high: int = 127) -> "NoteArray":
+        """Shift every pitch by a number of semitones.
+
+        Args:
+            semitones: Semitones to shift (negative to go down)
+            low: Lowest allowed pitch; results are clamped
+            high: Highest allowed pitch; results are clamped
+
+        Returns:
+            Transposed NoteArray
+        """
+        if _np is not None:
+            pitch = _from_numpy("i", _np.clip(_view(self.pitch) + semitones, low, high))
+        else:
+            pitch = array("i", [min(max(p + semitones, low), high) for p in self.pitch])
+        return self._with(pitch=pitch)
+
+    def time_shift(self, beats: float) -> "NoteArray":
+        """Move every note in time.
+
+        Args:
+            beats: Beats to move by (negative to move earlier)
+
+        Returns:
+            Shifted NoteArray
+        """
+        if _np is not None:
+            start = _from_numpy("d", _view(self.start_time) + beats)
+        else:
+            start = array("d", [s + beats for s in self.start_time])
+        return self._with(start_time=start)
+
+    def quantize(self, grid: float, strength: float = 1.0) -> "NoteArray":
+        """Move note starts towards the nearest grid line.
+
+        Args:
+            grid: Grid size in beats (e.g., 0.25 for 1/16 notes in 4/4)
+            strength: 1.0 snaps fully, 0.5 moves halfway, 0.0 leaves as is
+
+        Returns:
+            Quantized NoteArray
+        """
+        if grid <= 0:
+            raise ValueError(f"Grid must be positive, got {grid}")
+        if _np is not None:
+            start = _view(self.start_time)
+            start = _from_numpy(
+                "d", start + (_np.round(start / grid) * grid - start) * strength
+            )
+        else:
+            start = array(
+                "d",
+                [s + (round(s / grid) * grid - s) * strength for s in self.start_time],
+            )
+        return self._with(start_time=start)
+
+    def humanize(
+        self, timing: float = 0.0, velocity: int = 0, seed: int | None = None
+    ) -> "NoteArray":
+        """Randomly offset note starts and velocities.
+
+        The random sequence differs between the NumPy and pure-Python paths,
+        so a seed is only reproducible within one environment.
+
+        Args:
+            timing: Maximum start offset in beats (either direction)
+            velocity: Maximum velocity offset (either direction)
+            seed: Random seed for reproducible results
+
+        Returns:
+            Humanized NoteArray (starts clamped to >= 0, velocities to 1-127)
+        """
+        n = len(self)
+        if _np is not None:
+            rng = _np.random.default_rng(seed)
+            start = _view(self.start_time) + rng.uniform(-timing, timing, n)
+            vel = _view(self.velocity) + rng.integers(-velocity, velocity, n, endpoint=True)
+            return self._with(
+                start_time=_from_numpy("d", _np.maximum(start, 0.0)),
+                velocity=_from_numpy("i", _np.clip(vel, 1, 127)),
+            )
+        rng = random.Random(seed)
+        return self._with(
+            start_time=array(
+                "d", [max(s + rng.uniform(-timing, timing), 0.0) for s in self.start_time]
+            ),
+            velocity=array(
+                "i",
+                [
+                    min(max(v + rng.randint(-velocity, velocity), 1), 127)
+                    for v in self.velocity
+                ],
+            ),
+        )
@@ -0,0 +1,286 @@
+"""A pool of clients for parallel querying.
+
+ClientPool owns several AbletonOSCClients, each with its own sockets and
+receive thread, and spreads queries across them. It has the client methods
+the wrappers use (query, query_many, send, bundle, flush, listeners), so it
+can be passed anywhere a client is expected:
+
+    with ClientPool(size=4) as pool:
+        names = Song(pool).get_track_names()
+
+Each pooled client receives on its own port (receive_port, receive_port + 1,
+...) and sends from it, so sharding needs a server that replies to the
+sender's port. Stock AbletonOSC replies to one fixed port, so the default
+size is 1. A larger pool health-checks its clients when it is created and
+only dispatches to those that answered; against a fixed-port server that
+leaves the first client only.
+
+Sends, bundles and listeners always use the first client, so writes keep
+their order and listener updates arrive in one place.
+"""
+
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from abletonosc_client.application import Application
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import ListenerRouter
+
+DISPATCH_STRATEGIES = ("round_robin", "least_outstanding")
+
+
+class ClientPool:
+    """Several AbletonOSCClients behind one client-like interface.
+
+    Attributes:
+        clients: The pooled clients (the first also handles sends/listeners)
+        healthy: Whether each client passed its last health check
+        dispatched: Queries sent through each client
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        host: str = "127.0.0.1",
+        send_port: int = 11000,
+        receive_port: int = 11001,
+        strategy: str = "least_outstanding",
+        health_interval: float | None = None,
+        **client_options,
+    ):
+        """Create the pool and its clients.
+
+        Args:
+            size: Number of clients (more than 1 needs a server replying to
+                  the sender's port; see the module docstring)
+            host: AbletonOSC host address
+            send_port: Port AbletonOSC listens on
+            receive_port: Receive port of the first client; the others use
+                          the following ports
+            strategy: "round_robin", or "least_outstanding" to pick the client
+                      with the fewest queries in flight
+            health_interval: Seconds between background health checks
+                             (None to only check on creation, for size > 1,
+                             and when check_health() is called)
+            **client_options: Other AbletonOSCClient arguments (listen_host,
+                              receive_mode, cache, retry, metrics...)
+
+        Raises:
+            ValueError: If size is less than 1 or strategy is unknown
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        if strategy not in DISPATCH_STRATEGIES:
+            raise ValueError(
+                f"Invalid strategy: {strategy}. Must be one of {DISPATCH_STRATEGIES}"
+            )
+        self.strategy = strategy
+        self.clients: list[AbletonOSCClient] = []
+        try:
+            for i in range(size):
+                self.clients.append(
+                    AbletonOSCClient(
+                        host=host,
+                        send_port=send_port,
+                        receive_port=receive_port + i,
+                        send_from_receive_port=size > 1,
+                        **client_options,
+                    )
+                )
+        except Exception:
+            for client in self.clients:
+                client.close()
+            raise
+        self.healthy = [True] * size
+        self.dispatched = [0] * size
+        self._outstanding = [0] * size
+        self._lock = threading.Lock()
+        self._round_robin = itertools.cycle(range(size))
+        self._executor = ThreadPoolExecutor(max_workers=size)
+        if size > 1:
+            # Only shard across clients whose replies actually arrive
+            self.check_health()
+
+        self._stop = threading.Event()
+        self._health_thread = None
+        if health_interval is not None:
+            self._health_thread = threading.Thread(
+                target=self._check_periodically, args=(health_interval,), daemon=True
+            )
+            self._health_thread.start()
+
+    @property
+    def primary(self) -> AbletonOSCClient:
+        """The client used for sends, bundles and listeners."""
+        return self.clients[0]
+
+    @property
+    def router(self) -> ListenerRouter:
+        """Listener subscriptions, on the first client."""
+        return self.primary.router
+
+    @property
+    def max_datagram_size(self) -> int:
+        """Largest datagram the clients emit when bundling or chunking."""
+        return self.primary.max_datagram_size
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Health
+
+    def check_health(self, timeout: float = 0.5) -> list[bool]:
+        """Test every client with Application.test, in parallel.
+
+        Clients that fail are skipped by dispatch until they pass again.
+
+        Args:
+            timeout: How long to wait for each client's answer
+
+        Returns:
+            Health of each client
+        """
+
+        def test(client: AbletonOSCClient) -> bool:
+            try:
+                return Application(client).test(timeout=timeout)
+            except TimeoutError:
+                return False
+
+        results = list(self._executor.map(test, self.clients))
+        with self._lock:
+            self.healthy = results
+        return results
+
+    def _check_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.check_health()
+
+    # Dispatch
+
+    def _acquire(self) -> int:
+        """Pick a healthy client and count a query in flight on it."""
+        with self._lock:
+            candidates = [i for i, ok in enumerate(self.healthy) if ok]
+            if not candidates:
+                raise RuntimeError("No healthy clients in pool")
+            if self.strategy == "round_robin":
+                while True:
+                    index = next(self._round_robin)
+                    if self.healthy[index]:
+                        break
+            else:
+                index = min(candidates, key=self._outstanding.__getitem__)
+            self._outstanding[index] += 1
+            self.dispatched[index] += 1
+            return index
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._outstanding[index] -= 1
+
+    def query(self, address: str, *args: Any, timeout: float = 2.0) -> tuple:
+        """Send a query through one of the clients and wait for the response.
+
+        Args:
+            address: OSC address pattern (e.g., "/live/song/get/tempo")
+            *args: Arguments to send with the message
+            timeout: How long to wait for response in seconds
+
+        Returns:
+            Tuple of response arguments
+
+        Raises:
+            TimeoutError: If no response received within timeout
+            RuntimeError: If no client is healthy
+        """
+        # Earlier bundled sends must reach Live before this query
+        self.primary.flush()
+        index = self._acquire()
+        try:
+            return self.clients[index].query(address, *args, timeout=timeout)
+        finally:
+            self._release(index)
+
+    def query_many(
+        self,
+        requests: Iterable[tuple[str, Sequence[Any]]],
+        timeout: float = 2.0,
+    ) -> list[tuple]:
+        """Shard queries across the healthy clients and wait for all responses.
+
+        Args:
+            requests: (address, args) pairs, e.g. [("/live/track/get/name", (0,))]
+            timeout: Overall deadline for all responses in seconds
+
+        Returns:
+            List of response tuples, in the same order as requests
+
+        Raises:
+            TimeoutError: If any response is not received within timeout
+            RuntimeError: If no client is healthy
+        """
+        batch = list(requests)
+        if not batch:
+            return []
+        self.primary.flush()
+        with self._lock:
+            shards = sum(self.healthy)
+        shards = max(min(shards, len(batch)), 1)
+        size = -(-len(batch) // shards)
+        chunks = [batch[i : i + size] for i in range(0, len(batch), size)]
+
+        def run(chunk: list) -> list[tuple]:
+            index = self._acquire()
+            try:
+                return self.clients[index].query_many(chunk, timeout=timeout)
+            finally:
+                self._release(index)
+
+        if len(chunks) <= 1:
+            return run(batch)
+        results: list[tuple] = []
+        for part in self._executor.map(run, chunks):
+            results.extend(part)
+        return results
+
+    def send(self, address: str, *args: Any) -> None:
+        """Send an OSC message (fire-and-forget) through the first client."""
+        self.primary.send(address, *args)
+
+    @contextmanager
+    def bundle(self) -> Iterator[None]:
+        """Group sends into OSC bundles (see AbletonOSCClient.bundle)."""
+        with self.primary.bundle():
+            yield
+
+    def flush(self) -> None:
+        """Send messages accumulated by the current thread's bundle() block."""
+        self.primary.flush()
+
+    def barrier(self, timeout: float = 2.0) -> None:
+        """Wait until Live has processed the sends made through the pool."""
+        self.primary.barrier(timeout=timeout)
+
+    def start_listener(self, address: str, callback: Callable) -> None:
+        """Register a callback for messages at an address, on the first client."""
+        self.primary.start_listener(address, callback)
+
+    def stop_listener(self, address: str) -> None:
+        """Unregister a callback for an address."""
+        self.primary.stop_listener(address)
+
+    def close(self) -> None:
+        """Stop health checks and close every client."""
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=1.0)
+        self._executor.shutdown(wait=True)
+        for client in self.clients:
+            client.close()
@@ -0,0 +1,150 @@
+"""Rate limiting of outbound OSC traffic.
+
+Live applies OSC messages on its main thread, between audio and UI work; a
+script sending faster than that backs up Live's receive buffer until
+messages are dropped. A RateLimiter passed as rate_limit= to a client gives
+each class of message a token-bucket budget and holds messages back when a
+budget is spent, so bulk builders run as fast as Live can absorb, not
+faster:
+
+    structural  create/delete/duplicate/insert/load, undo/redo (slow in Live)
+    write       /set/ and other commands (fire, stop, add notes...)
+    read        /get/, start_listen/stop_listen and /live/test
+
+AbletonOSCClient blocks the sending thread while a budget refills;
+AsyncAbletonOSCClient makes queries await and queues plain sends in order.
+"""
+
+import threading
+import time
+from typing import Callable
+
+ADDRESS_CLASSES = ("structural", "write", "read")
+
+# Messages per second and burst size per class (None rate: unlimited)
+DEFAULT_BUDGETS: dict[str, tuple[float | None, int]] = {
+    "structural": (20.0, 5),
+    "write": (1000.0, 200),
+    "read": (None, 0),
+}
+
+# Address segments that mark a structural edit
+_STRUCTURAL_WORDS = ("create", "delete", "duplicate", "insert", "load", "undo", "redo")
+
+_READ_SEGMENTS = ("/get/", "/start_listen/", "/stop_listen/")
+
+
+def classify_address(address: str) -> str:
+    """Return the budget class of an address ("structural", "write" or "read")."""
+    if address == "/live/test" or any(s in address for s in _READ_SEGMENTS):
+        return "read"
+    if "/set/" in address:
+        return "write"
+    action = address.rsplit("/", 1)[-1]
+    # Browser listings and searches only read
+    if action.startswith("list_") or action == "search":
+        return "read"
+    if any(word in action for word in _STRUCTURAL_WORDS):
+        return "structural"
+    return "write"
+
+
+class TokenBucket:
+    """A token bucket that hands out reservations.
+
+    Tokens accrue at `rate` per second up to `burst`. reserve() always
+    succeeds and returns how long the caller must wait before using its
+    token; the bucket goes into debt meanwhile, so concurrent callers are
+    served in reservation order without busy-waiting.
+    """
+
+    def __init__(self, rate: float | None, burst: int = 1):
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens per second (None for unlimited)
+            burst: Bucket capacity (at least 1 when limited)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens, returning the seconds to wait before using them."""
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._tokens + (now - self._updated) * self.rate, self.burst
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Token-bucket budgets per address class.
+
+    Attributes:
+        throttled: Messages that had to wait, per class
+        waited: Seconds spent waiting, per class
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, tuple[float | None, int]] | None = None,
+        classify: Callable[[str], str] = classify_address,
+    ):
+        """Create a limiter.
+
+        Args:
+            budgets: {class: (messages per second or None, burst)}; classes
+                     not given keep their DEFAULT_BUDGETS entry
+            classify: Function mapping an address to its class
+
+        Raises:
+            ValueError: If a budget's class is unknown or its rate not positive
+        """
+        merged = dict(DEFAULT_BUDGETS)
+        for name, budget in (budgets or {}).items():
+            if name not in ADDRESS_CLASSES:
+                raise ValueError(
+                    f"Unknown address class: {name}. Must be one of {ADDRESS_CLASSES}"
+                )
+            merged[name] = budget
+        self.buckets = {name: TokenBucket(*budget) for name, budget in merged.items()}
+        self.classify = classify
+        self.throttled = {name: 0 for name in ADDRESS_CLASSES}
+        self.waited = {name: 0.0 for name in ADDRESS_CLASSES}
+        self._lock = threading.Lock()
+
+    def reserve(self, address: str) -> float:
+        """Take a token for a message, returning the seconds to wait first."""
+        name = self.classify(address)
+        delay = self.buckets[name].reserve()
+        if delay > 0:
+            with self._lock:
+                self.throttled[name] += 1
+                self.waited[name] += delay
+        return delay
+
+    def acquire(self, address: str) -> None:
+        """Block until a message to address may be sent."""
+        delay = self.reserve(address)
+        if delay > 0:
+            time.sleep(delay)
+
+    def stats(self) -> dict[str, dict]:
+        """Return {"throttled": {...}, "waited": {...}} per class."""
+        with self._lock:
+            return {"throttled": dict(self.throttled), "waited": dict(self.waited)}
@@ -0,0 +1,132 @@
+"""Retries for queries lost in transit.
+
+AbletonOSC speaks UDP, so a request or its response is occasionally dropped,
+especially when Live is busy. A RetryPolicy makes the client resend a query
+that has not been answered after a short, exponentially growing wait (with
+random jitter so many clients don't resend in lockstep), until the query's
+overall deadline.
+
+Only idempotent queries are resent: /get/ addresses and /live/test. Resending
+anything else (create_clip, insert_device, fire...) could apply it twice, so
+those still get a single attempt.
+
+The original request stays registered while it is resent, so a late response
+to any attempt answers the query. Once the query is done, the client drops
+up to one further response per unanswered send (for max_timeout seconds), so
+duplicates don't reach listeners or the cache as if they were updates.
+"""
+
+import random
+import threading
+from typing import Iterator
+
+# Queries without "/get/" that are safe to resend
+IDEMPOTENT_ADDRESSES = ("/live/test",)
+
+
+class RetryPolicy:
+    """When and how often to resend unanswered queries.
+
+    Attempt n (counting from 0) waits initial_timeout * multiplier**n
+    seconds, capped at max_timeout and scaled by a random factor in
+    [1 - jitter, 1 + jitter], before the query is resent. After the last
+    attempt the client waits for the rest of the deadline.
+
+    Example:
+        client = AbletonOSCClient(retry=RetryPolicy(attempts=5, deadline=10.0))
+        client.query("/live/song/get/tempo")  # resent up to 4 times
+        client.retry.stats()  # {"retries": ..., "recovered": ..., ...}
+
+    Attributes:
+        retries: Number of resends
+        recovered: Queries answered after at least one resend
+        failures: Resendable queries that timed out anyway
+    """
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        initial_timeout: float = 0.25,
+        multiplier: float = 2.0,
+        max_timeout: float = 2.0,
+        jitter: float = 0.1,
+        deadline: float | None = None,
+        idempotent: tuple[str, ...] = IDEMPOTENT_ADDRESSES,
+        seed: int | None = None,
+    ):
+        """Create a policy.
+
+        Args:
+            attempts: Maximum sends per query, including the first
+            initial_timeout: Seconds to wait for the first attempt
+            multiplier: Growth factor of the wait between attempts
+            max_timeout: Longest wait for any single attempt
+            jitter: Relative random deviation of each wait (0.0-1.0)
+            deadline: Upper bound in seconds for any query or query_many
+                      call, whatever timeout it is given (None for no bound)
+            idempotent: Addresses without "/get/" that may be resent
+            seed: Random seed for the jitter
+
+        Raises:
+            ValueError: If attempts is less than 1 or jitter is outside 0-1
+        """
+        if attempts < 1:
+            raise ValueError(f"attempts must be at least 1, got {attempts}")
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError(f"jitter must be between 0 and 1, got {jitter}")
+        self.attempts = attempts
+        self.initial_timeout = initial_timeout
+        self.multiplier = multiplier
+        self.max_timeout = max_timeout
+        self.jitter = jitter
+        self.deadline = deadline
+        self.idempotent = frozenset(idempotent)
+
+        self.retries = 0
+        self.recovered = 0
+        self.failures = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def should_retry(self, address: str) -> bool:
+        """Check whether a query may be resent."""
+        return "/get/" in address or address in self.idempotent
+
+    def limit(self, timeout: float) -> float:
+        """Apply the per-client deadline to a call's timeout."""
+        if self.deadline is None:
+            return timeout
+        return min(timeout, self.deadline)
+
+    def waits(self) -> Iterator[float]:
+        """Yield the wait before each resend (attempts - 1 values)."""
+        for attempt in range(self.attempts - 1):
+            wait = min(self.initial_timeout * self.multiplier**attempt, self.max_timeout)
+            if self.jitter:
+                with self._lock:
+                    wait *= 1.0 + self._random.uniform(-self.jitter, self.jitter)
+            yield wait
+
+    def record(self, resends: int, answered: bool) -> None:
+        """Count the outcome of one resendable query."""
+        with self._lock:
+            self.retries += resends
+            if not answered:
+                self.failures += 1
+            elif resends:
+                self.recovered += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters as a dict."""
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "recovered": self.recovered,
+                "failures": self.failures,
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the counters."""
+        with self._lock:
+            self.retries = self.recovered = self.failures = 0
@@ -0,0 +1,213 @@
+"""Routing of listener updates to subscribers.
+
+AbletonOSCClient.start_listener takes one callback per address, so two
+wrappers listening to the same property would replace each other's
+callback. The wrappers' on_* methods go through the client's ListenerRouter
+(client.router) instead. It registers one handler per address and routes
+each update by its leading index arguments (track, clip, device...) to any
+number of subscribers, with a single dictionary lookup:
+
+    sub = client.router.subscribe("/live/track/get/volume", (0,), callback)
+    ...
+    client.router.unsubscribe(sub)
+
+Subscriptions are reference-counted per (address, indices). AbletonOSC gets
+start_listen when the first subscriber arrives and stop_listen when the last
+one leaves.
+
+stream() subscribes a bounded EventQueue instead of a callback, for
+consumers that process updates at their own pace.
+
+Calling client.start_listener directly on an address the router handles
+replaces the router's handler for that address.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+
+from abletonosc_client.addresses import index_count, split_property
+from abletonosc_client.streams import EventQueue
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription(NamedTuple):
+    """Handle for a subscription, returned by ListenerRouter.subscribe."""
+
+    address: str
+    index: tuple
+    callback: Callable
+
+
+class ListenerRouter:
+    """Fans listener updates out to subscribers keyed by (address, indices)."""
+
+    def __init__(self, client):
+        """Create a router sending start/stop_listen through client.
+
+        Args:
+            client: Client (or client-like wrapper) to listen on
+        """
+        self._client = client
+        self._lock = threading.Lock()
+        # address -> {indices: subscribers' callbacks}; the tuples are replaced,
+        # never mutated, so dispatch reads them without the lock
+        self._routes: dict[str, dict[tuple, tuple[Callable, ...]]] = {}
+        # address -> number of leading index arguments
+        self._index_counts: dict[str, int] = {}
+
+    @staticmethod
+    def _listen_address(address: str, verb: str) -> str:
+        domain, _, prop = split_property(address)
+        return f"/live/{domain}/{verb}/{prop}"
+
+    def subscribe(
+        self, address: str, index: Sequence[int], callback: Callable
+    ) -> Subscription:
+        """Call callback with every update of a property of one object.
+
+        Args:
+            address: Address updates arrive at (e.g., "/live/track/get/volume")
+            index: Indices of the object (e.g., (track_index,); () for song
+                   and view properties)
+            callback: Function(*args) called with the update's arguments,
+                      indices included
+
+        Returns:
+            Subscription handle for unsubscribe()
+
+        Raises:
+            ValueError: If address is not a /get/ property address or index
+                        has the wrong length
+        """
+        return self.subscribe_many([(address, index, callback)])[0]
+
+    def subscribe_many(
+        self, requests: Iterable[tuple[str, Sequence[int], Callable]]
+    ) -> list[Subscription]:
+        """Subscribe several callbacks, sending the start_listens as a bundle.
+
+        Args:
+            requests: (address, index, callback) triples, as for subscribe()
+
+        Returns:
+            Subscription handles, in the same order as requests
+
+        Raises:
+            ValueError: If any address or index is invalid (nothing is
+                        subscribed then)
+        """
+        subscriptions = []
+        for address, index, callback in requests:
+            parts = split_property(address)
+            if parts is None or parts[1] != "get":
+                raise ValueError(f"Not a property address: {address}")
+            count = index_count(parts[0], parts[2])
+            if len(index) != count:
+                raise ValueError(
+                    f"{address} takes {count} indices, got {len(index)}: "
+                    f"{tuple(index)}"
+                )
+            subscriptions.append(
+                Subscription(address, tuple(int(i) for i in index), callback)
+            )
+        with self._lock, self._client.bundle():
+            for address, index, callback in subscriptions:
+                routes = self._routes.get(address)
+                if routes is None:
+                    routes = self._routes[address] = {}
+                    self._index_counts[address] = len(index)
+                    self._client.start_listener(address, self._dispatch)
+                callbacks = routes.get(index, ())
+                routes[index] = callbacks + (callback,)
+                if not callbacks:
+                    self._client.send(
+                        self._listen_address(address, "start_listen"), *index
+                    )
+        return subscriptions
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription; unknown or removed ones are ignored.
+
+        Args:
+            subscription: Handle returned by subscribe()
+        """
+        self.unsubscribe_many([subscription])
+
+    def unsubscribe_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """Remove several subscriptions, sending the stop_listens as a bundle.
+
+        Args:
+            subscriptions: Handles returned by subscribe()
+        """
+        with self._lock, self._client.bundle():
+            for address, index, callback in subscriptions:
+                routes = self._routes.get(address)
+                callbacks = routes.get(index) if routes is not None else None
+                if not callbacks or callback not in callbacks:
+                    continue
+                remaining = list(callbacks)
+                remaining.remove(callback)
+                if remaining:
+                    routes[index] = tuple(remaining)
+                    continue
+                del routes[index]
+                self._client.send(self._listen_address(address, "stop_listen"), *index)
+                if not routes:
+                    del self._routes[address]
+                    del self._index_counts[address]
+                    self._client.stop_listener(address)
+
+    def stream(
+        self,
+        address: str,
+        index: Sequence[int] = (),
+        maxsize: int = 256,
+        overflow: str = "drop_oldest",
+    ) -> EventQueue:
+        """Subscribe a bounded queue to a property (see abletonosc_client.streams).
+
+        Args:
+            address: Address updates arrive at (e.g., "/live/song/get/beat")
+            index: Indices of the object (() for song and view properties)
+            maxsize: Updates held before the overflow policy applies
+            overflow: "drop_oldest", "coalesce" or "block"
+
+        Returns:
+            EventQueue of the updates' arguments (indices included); closing
+            it unsubscribes
+
+        Raises:
+            ValueError: If the address, indices or queue options are invalid
+        """
+        subscriptions: list[Subscription] = []
+        queue = EventQueue(
+            maxsize, overflow, on_close=lambda: self.unsubscribe_many(subscriptions)
+        )
+        subscriptions.append(self.subscribe(address, index, queue))
+        return queue
+
+    def subscriber_count(self, address: str, index: Sequence[int] = ()) -> int:
+        """Return how many subscribers an (address, indices) pair has."""
+        routes = self._routes.get(address)
+        if routes is None:
+            return 0
+        return len(routes.get(tuple(index), ()))
+
+    def _dispatch(self, address: str, *args: Any) -> None:
+        """Call the subscribers of an update (registered with the client).
+
+        A subscriber that raises is logged (logger "abletonosc_client.router")
+        and doesn't keep the update from the others.
+        """
+        routes = self._routes.get(address)
+        if not routes:
+            return
+        callbacks = routes.get(args[: self._index_counts.get(address, 0)])
+        if callbacks:
+            for callback in callbacks:
+                try:
+                    callback(*args)
+                except Exception:
+                    logger.exception("Listener callback for %s failed", address)
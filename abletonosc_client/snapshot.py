@@ -0,0 +1,433 @@
+"""Whole-session snapshots.
+
+take_snapshot() walks the song, tracks, scenes, clips, devices and
+(optionally) parameters and notes, using bulk endpoints where AbletonOSC has
+them and pipelined queries (query_many) everywhere else, so the cost grows
+with the number of stages rather than the number of objects.
+take_snapshot_async() does the same through an AsyncAbletonOSCClient.
+
+The result is an immutable tree of slotted dataclasses:
+
+    SessionSnapshot
+        tracks: TrackSnapshot
+            clips: ClipSnapshot (occupied slots only)
+            devices: DeviceSnapshot
+                parameters: Parameter
+        scenes: SceneSnapshot
+"""
+
+import dataclasses
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Generator, Mapping, Sequence
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.device import Parameter
+from abletonosc_client.notes import Note, NoteArray
+
+# Queries per request window; keeps bursts within Live's receive buffer
+DEFAULT_BATCH_SIZE = 256
+
+# Per-track queries; results are looked up by the part after "get/"
+_TRACK_ADDRESSES = (
+    "/live/track/get/name",
+    "/live/track/get/volume",
+    "/live/track/get/panning",
+    "/live/track/get/mute",
+    "/live/track/get/solo",
+    "/live/track/get/color",
+    "/live/track/get/has_midi_input",
+    "/live/track/get/clips/name",
+    "/live/track/get/clips/length",
+    "/live/track/get/clips/color",
+    "/live/track/get/devices/name",
+    "/live/track/get/devices/class_name",
+    "/live/track/get/devices/type",
+)
+
+_SCENE_ADDRESSES = (
+    "/live/scene/get/name",
+    "/live/scene/get/color",
+)
+
+_PARAMETER_ADDRESSES = (
+    "/live/device/get/parameters/name",
+    "/live/device/get/parameters/value",
+    "/live/device/get/parameters/min",
+    "/live/device/get/parameters/max",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ClipSnapshot:
+    """State of a clip in a clip slot.
+
+    Attributes:
+        index: Clip slot (scene) index
+        name: Clip name
+        length: Length in beats
+        color: Color as integer
+        notes: Notes of a MIDI clip (None if not captured)
+    """
+
+    index: int
+    name: str
+    length: float
+    color: int
+    notes: tuple[Note, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceSnapshot:
+    """State of a device on a track.
+
+    Attributes:
+        index: Device index on the track
+        name: Device name
+        class_name: Device class name (e.g., "Compressor")
+        type: Device type (0=audio_effect, 1=instrument, 2=midi_effect)
+        parameters: Parameters (empty if not captured)
+    """
+
+    index: int
+    name: str
+    class_name: str
+    type: int
+    parameters: tuple[Parameter, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TrackSnapshot:
+    """State of a track.
+
+    Attributes:
+        index: Track index
+        name: Track name
+        volume: Volume (0.0-1.0)
+        panning: Panning (-1.0 to 1.0)
+        mute: Whether the track is muted
+        solo: Whether the track is soloed
+        color: Color as integer
+        is_midi: Whether the track takes MIDI input
+        clips: Clips in occupied slots
+        devices: Devices in chain order
+    """
+
+    index: int
+    name: str
+    volume: float
+    panning: float
+    mute: bool
+    solo: bool
+    color: int
+    is_midi: bool
+    clips: tuple[ClipSnapshot, ...]
+    devices: tuple[DeviceSnapshot, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SceneSnapshot:
+    """State of a scene.
+
+    Attributes:
+        index: Scene index
+        name: Scene name
+        color: Color as integer
+    """
+
+    index: int
+    name: str
+    color: int
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """State of a whole Live set.
+
+    Attributes:
+        tempo: Tempo in BPM
+        signature_numerator: Time signature numerator
+        signature_denominator: Time signature denominator
+        tracks: Track snapshots
+        scenes: Scene snapshots
+        timings: Read-only seconds spent per stage, plus "total" (not
+                 compared)
+        num_queries: Number of queries the snapshot took (not compared)
+    """
+
+    tempo: float
+    signature_numerator: int
+    signature_denominator: int
+    tracks: tuple[TrackSnapshot, ...]
+    scenes: tuple[SceneSnapshot, ...]
+    timings: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType({}), compare=False
+    )
+    num_queries: int = field(default=0, compare=False)
+
+
+def _query_all(
+    client: AbletonOSCClient,
+    requests: Sequence[tuple[str, tuple]],
+    batch_size: int,
+    timeout: float,
+) -> list[tuple]:
+    """Run query_many over windows of at most batch_size requests."""
+    results: list[tuple] = []
+    for start in range(0, len(requests), batch_size):
+        results.extend(
+            client.query_many(requests[start : start + batch_size], timeout=timeout)
+        )
+    return results
+
+
+async def _query_all_async(
+    client,
+    requests: Sequence[tuple[str, tuple]],
+    batch_size: int,
+    timeout: float,
+) -> list[tuple]:
+    """Await query_many over windows of at most batch_size requests."""
+    results: list[tuple] = []
+    for start in range(0, len(requests), batch_size):
+        results.extend(
+            await client.query_many(
+                requests[start : start + batch_size], timeout=timeout
+            )
+        )
+    return results
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def take_snapshot(
+    client: AbletonOSCClient,
+    parameters: bool = True,
+    notes: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    timeout: float = 5.0,
+) -> SessionSnapshot:
+    """Capture the state of the current Live set.
+
+    Args:
+        client: Connected client
+        parameters: Capture device parameters (4 queries per device)
+        notes: Capture notes of MIDI clips (1 query per clip)
+        batch_size: Maximum queries in flight at once
+        timeout: Deadline in seconds for each window of queries
+
+    Returns:
+        SessionSnapshot, with per-stage timings in seconds
+
+    Raises:
+        TimeoutError: If Live does not answer a window of queries in time
+    """
+    run = _SnapshotRun(parameters, notes)
+    for requests in run:
+        run.send(_query_all(client, requests, batch_size, timeout))
+    return run.snapshot
+
+
+async def take_snapshot_async(
+    client,
+    parameters: bool = True,
+    notes: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    timeout: float = 5.0,
+) -> SessionSnapshot:
+    """Capture the state of the current Live set through an async client.
+
+    Args:
+        client: Started AsyncAbletonOSCClient
+        parameters: Capture device parameters (4 queries per device)
+        notes: Capture notes of MIDI clips (1 query per clip)
+        batch_size: Maximum queries in flight at once
+        timeout: Deadline in seconds for each window of queries
+
+    Returns:
+        SessionSnapshot, with per-stage timings in seconds
+
+    Raises:
+        TimeoutError: If Live does not answer a window of queries in time
+    """
+    run = _SnapshotRun(parameters, notes)
+    for requests in run:
+        run.send(await _query_all_async(client, requests, batch_size, timeout))
+    return run.snapshot
+
+
+class _SnapshotRun:
+    """Drives _snapshot_stages for either transport, timing each stage.
+
+    Iterating yields each stage's requests; send() the stage's responses
+    before asking for the next one. Once iteration stops, snapshot holds
+    the result with its timings and query count.
+    """
+
+    def __init__(self, parameters: bool, notes: bool):
+        self._stages = _snapshot_stages(parameters, notes)
+        self._results: list[tuple] | None = None
+        self._stage = ""
+        self._started = 0.0
+        self._timings: dict[str, float] = {}
+        self._num_queries = 0
+        self.snapshot: SessionSnapshot | None = None
+
+    def __iter__(self) -> "_SnapshotRun":
+        return self
+
+    def __next__(self) -> list[tuple[str, tuple]]:
+        try:
+            self._stage, requests = self._stages.send(self._results)
+        except StopIteration as done:
+            self._timings["total"] = sum(self._timings.values())
+            self.snapshot = dataclasses.replace(
+                done.value,
+                timings=MappingProxyType(self._timings),
+                num_queries=self._num_queries,
+            )
+            raise
+        self._num_queries += len(requests)
+        self._started = time.perf_counter()
+        return requests
+
+    def send(self, results: list[tuple]) -> None:
+        """Hand over the responses to the current stage's requests."""
+        self._timings[self._stage] = time.perf_counter() - self._started
+        self._results = results
+
+
+def _snapshot_stages(
+    parameters: bool, notes: bool
+) -> Generator[tuple[str, list[tuple[str, tuple]]], list[tuple], SessionSnapshot]:
+    """Build a snapshot stage by stage, independently of the transport.
+
+    Yields (stage name, requests) and receives the stage's responses, in
+    request order; returns the snapshot (without timings) when done.
+    """
+    # Song
+    tempo, numerator, denominator, num_tracks, num_scenes = yield (
+        "song",
+        [
+            ("/live/song/get/tempo", ()),
+            ("/live/song/get/signature_numerator", ()),
+            ("/live/song/get/signature_denominator", ()),
+            ("/live/song/get/num_tracks", ()),
+            ("/live/song/get/num_scenes", ()),
+        ],
+    )
+    num_tracks = int(num_tracks[0])
+    num_scenes = int(num_scenes[0])
+
+    # Tracks
+    results = yield (
+        "tracks",
+        [(address, (t,)) for t in range(num_tracks) for address in _TRACK_ADDRESSES],
+    )
+    width = len(_TRACK_ADDRESSES)
+    fields = [address.split("/get/", 1)[1] for address in _TRACK_ADDRESSES]
+    # One {field: response args after the track index} per track
+    track_rows = [
+        dict(zip(fields, (r[1:] for r in results[t * width : (t + 1) * width])))
+        for t in range(num_tracks)
+    ]
+
+    # Scenes
+    results = yield (
+        "scenes",
+        [(address, (s,)) for s in range(num_scenes) for address in _SCENE_ADDRESSES],
+    )
+    scenes = tuple(
+        SceneSnapshot(index=s, name=_text(name[1]), color=int(color[1]))
+        for s, (name, color) in enumerate(zip(results[0::2], results[1::2]))
+    )
+
+    # Device parameters
+    device_parameters: dict[tuple[int, int], tuple[Parameter, ...]] = {}
+    if parameters:
+        keys = [
+            (t, d)
+            for t, row in enumerate(track_rows)
+            for d in range(len(row["devices/name"]))
+        ]
+        results = yield (
+            "parameters",
+            [(address, key) for key in keys for address in _PARAMETER_ADDRESSES],
+        )
+        for i, key in enumerate(keys):
+            names, values, mins, maxs = (r[2:] for r in results[i * 4 : i * 4 + 4])
+            device_parameters[key] = tuple(
+                Parameter(p, _text(n), float(v), float(lo), float(hi))
+                for p, (n, v, lo, hi) in enumerate(zip(names, values, mins, maxs))
+            )
+
+    # Notes of MIDI clips
+    clip_notes: dict[tuple[int, int], tuple[Note, ...]] = {}
+    if notes:
+        keys = [
+            (t, c)
+            for t, row in enumerate(track_rows)
+            if row["has_midi_input"][0]
+            for c, length in enumerate(row["clips/length"])
+            if length
+        ]
+        results = yield "notes", [("/live/clip/get/notes", key) for key in keys]
+        for key, result in zip(keys, results):
+            clip_notes[key] = tuple(NoteArray.from_flat(result[2:]))
+
+    tracks = []
+    for t, row in enumerate(track_rows):
+        clips = tuple(
+            ClipSnapshot(
+                index=c,
+                name=_text(clip_name),
+                length=float(length),
+                color=int(clip_color or 0),
+                notes=clip_notes.get((t, c)),
+            )
+            for c, (clip_name, length, clip_color) in enumerate(
+                zip(row["clips/name"], row["clips/length"], row["clips/color"])
+            )
+            if length
+        )
+        devices = tuple(
+            DeviceSnapshot(
+                index=d,
+                name=_text(device_name),
+                class_name=_text(class_name),
+                type=int(device_type),
+                parameters=device_parameters.get((t, d), ()),
+            )
+            for d, (device_name, class_name, device_type) in enumerate(
+                zip(
+                    row["devices/name"],
+                    row["devices/class_name"],
+                    row["devices/type"],
+                )
+            )
+        )
+        tracks.append(
+            TrackSnapshot(
+                index=t,
+                name=_text(row["name"][0]),
+                volume=float(row["volume"][0]),
+                panning=float(row["panning"][0]),
+                mute=bool(row["mute"][0]),
+                solo=bool(row["solo"][0]),
+                color=int(row["color"][0]),
+                is_midi=bool(row["has_midi_input"][0]),
+                clips=clips,
+                devices=devices,
+            )
+        )
+
+    return SessionSnapshot(
+        tempo=float(tempo[0]),
+        signature_numerator=int(numerator[0]),
+        signature_denominator=int(denominator[0]),
+        tracks=tuple(tracks),
+        scenes=scenes,
+    )
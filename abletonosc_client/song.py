@@ -6,6 +6,9 @@ Covers /live/song/* endpoints for global song properties and transport.
 from typing import Callable
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
+from abletonosc_client.snapshot import SessionSnapshot, take_snapshot
+from abletonosc_client.waiting import wait_until
 
 
 class Song:
@@ -13,6 +16,8 @@ class Song:
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
+        # Listener subscriptions: {"property": subscription}
+        self._subscriptions: dict[str, Subscription] = {}
 
     # Tempo
 
@@ -171,21 +176,36 @@ class Song:
 
     # Listeners
 
+    def _start_listener(self, prop: str, callback: Callable) -> None:
+        """Subscribe callback(*args) to song property updates.
+
+        Replaces this wrapper's previous callback for the property; other
+        wrappers' subscriptions are unaffected.
+        """
+        router = self._client.router
+        subscription = router.subscribe(f"/live/song/get/{prop}", (), callback)
+        previous = self._subscriptions.get(prop)
+        self._subscriptions[prop] = subscription
+        if previous is not None:
+            router.unsubscribe(previous)
+
+    def _stop_listener(self, prop: str) -> None:
+        """Remove this wrapper's callback for a song property."""
+        subscription = self._subscriptions.pop(prop, None)
+        if subscription is not None:
+            self._client.router.unsubscribe(subscription)
+
     def on_tempo_change(self, callback: Callable[[float], None]) -> None:
         """Register a callback for tempo changes.
 
         Args:
             callback: Function(tempo) called when tempo changes
         """
-        self._client.send("/live/song/start_listen/tempo")
-        self._client.start_listener(
-            "/live/song/get/tempo", lambda addr, *args: callback(float(args[0]))
-        )
+        self._start_listener("tempo", lambda value, *_: callback(float(value)))
 
     def stop_tempo_listener(self) -> None:
         """Stop listening for tempo changes."""
-        self._client.send("/live/song/stop_listen/tempo")
-        self._client.stop_listener("/live/song/get/tempo")
+        self._stop_listener("tempo")
 
     def on_is_playing_change(self, callback: Callable[[bool], None]) -> None:
         """Register a callback for play state changes.
@@ -193,15 +213,11 @@ class Song:
         Args:
             callback: Function(is_playing) called when play state changes
         """
-        self._client.send("/live/song/start_listen/is_playing")
-        self._client.start_listener(
-            "/live/song/get/is_playing", lambda addr, *args: callback(bool(args[0]))
-        )
+        self._start_listener("is_playing", lambda value, *_: callback(bool(value)))
 
     def stop_is_playing_listener(self) -> None:
         """Stop listening for play state changes."""
-        self._client.send("/live/song/stop_listen/is_playing")
-        self._client.stop_listener("/live/song/get/is_playing")
+        self._stop_listener("is_playing")
 
     # Track management
 
@@ -221,6 +237,61 @@ class Song:
         """
         self._client.send("/live/song/create_audio_track", index)
 
+    def create_midi_track_and_wait(self, index: int = -1, timeout: float = 5.0) -> int:
+        """Create a new MIDI track and wait until Live has added it.
+
+        Args:
+            index: Position to insert track (-1 appends to end)
+            timeout: How long to wait for the track in seconds
+
+        Returns:
+            Index of the new track
+
+        Raises:
+            TimeoutError: If the track count does not grow within timeout
+        """
+        return self._create_and_wait(
+            self.create_midi_track, self.get_num_tracks, index, timeout, "track"
+        )
+
+    def create_audio_track_and_wait(
+        self, index: int = -1, timeout: float = 5.0
+    ) -> int:
+        """Create a new audio track and wait until Live has added it.
+
+        Args:
+            index: Position to insert track (-1 appends to end)
+            timeout: How long to wait for the track in seconds
+
+        Returns:
+            Index of the new track
+
+        Raises:
+            TimeoutError: If the track count does not grow within timeout
+        """
+        return self._create_and_wait(
+            self.create_audio_track, self.get_num_tracks, index, timeout, "track"
+        )
+
+    def _create_and_wait(
+        self,
+        create: Callable[[int], None],
+        count: Callable[[], int],
+        index: int,
+        timeout: float,
+        kind: str,
+    ) -> int:
+        """Run a create_* command and poll a count until it grows."""
+        before = count()
+        create(index)
+        after = wait_until(
+            count,
+            lambda n: n > before,
+            timeout=timeout,
+            description=f"new {kind}",
+        )
+        return after - 1 if index < 0 else index
+
     def create_return_track(self) -> None:
         """Create a new return track."""
         self._client.send("/live/song/create_return_track")
@@ -322,6 +393,23 @@ class Song:
         """
         self._client.send("/live/song/create_scene", index)
 
+    def create_scene_and_wait(self, index: int = -1, timeout: float = 5.0) -> int:
+        """Create a new scene and wait until Live has added it.
+
+        Args:
+            index: Position to insert scene (-1 appends to end)
+            timeout: How long to wait for the scene in seconds
+
+        Returns:
+            Index of the new scene
+
+        Raises:
+            TimeoutError: If the scene count does not grow within timeout
+        """
+        return self._create_and_wait(
+            self.create_scene, self.get_num_scenes, index, timeout, "scene"
+        )
+
     def delete_scene(self, index: int) -> None:
         """Delete scene at index.
 
@@ -671,15 +759,11 @@ class Song:
         Args:
             callback: Function(beat) called on each beat
         """
-        self._client.send("/live/song/start_listen/beat")
-        self._client.start_listener(
-            "/live/song/get/beat", lambda addr, *args: callback(int(args[0]))
-        )
+        self._start_listener("beat", lambda value, *_: callback(int(value)))
 
     def stop_beat_listener(self) -> None:
         """Stop listening for beat notifications."""
-        self._client.send("/live/song/stop_listen/beat")
-        self._client.stop_listener("/live/song/get/beat")
+        self._stop_listener("beat")
 
     def on_loop_change(self, callback: Callable[[bool], None]) -> None:
         """Register a callback for loop state changes.
@@ -687,15 +771,11 @@ class Song:
         Args:
             callback: Function(enabled) called when loop state changes
         """
-        self._client.send("/live/song/start_listen/loop")
-        self._client.start_listener(
-            "/live/song/get/loop", lambda addr, *args: callback(bool(args[0]))
-        )
+        self._start_listener("loop", lambda value, *_: callback(bool(value)))
 
     def stop_loop_listener(self) -> None:
         """Stop listening for loop state changes."""
-        self._client.send("/live/song/stop_listen/loop")
-        self._client.stop_listener("/live/song/get/loop")
+        self._stop_listener("loop")
 
     def on_record_mode_change(self, callback: Callable[[bool], None]) -> None:
         """Register a callback for record mode changes.
@@ -703,15 +783,11 @@ class Song:
         Args:
             callback: Function(enabled) called when record mode changes
         """
-        self._client.send("/live/song/start_listen/record_mode")
-        self._client.start_listener(
-            "/live/song/get/record_mode", lambda addr, *args: callback(bool(args[0]))
-        )
+        self._start_listener("record_mode", lambda value, *_: callback(bool(value)))
 
     def stop_record_mode_listener(self) -> None:
         """Stop listening for record mode changes."""
-        self._client.send("/live/song/stop_listen/record_mode")
-        self._client.stop_listener("/live/song/get/record_mode")
+        self._stop_listener("record_mode")
 
     def on_current_song_time_change(self, callback: Callable[[float], None]) -> None:
         """Register a callback for playhead position changes.
@@ -719,16 +795,13 @@ class Song:
         Args:
             callback: Function(beats) called when playhead moves
         """
-        self._client.send("/live/song/start_listen/current_song_time")
-        self._client.start_listener(
-            "/live/song/get/current_song_time",
-            lambda addr, *args: callback(float(args[0])),
+        self._start_listener(
+            "current_song_time", lambda value, *_: callback(float(value))
         )
 
     def stop_current_song_time_listener(self) -> None:
         """Stop listening for playhead position changes."""
-        self._client.send("/live/song/stop_listen/current_song_time")
-        self._client.stop_listener("/live/song/get/current_song_time")
+        self._stop_listener("current_song_time")
 
     # Session record status
 
@@ -751,3 +824,19 @@ class Song:
         """
         result = self._client.query("/live/song/get/beat")
         return float(result[0]) if result else 0.0
+
+    # Snapshot
+
+    def snapshot(
+        self, parameters: bool = True, notes: bool = False
+    ) -> SessionSnapshot:
+        """Capture the state of the whole set with pipelined bulk queries.
+
+        Args:
+            parameters: Include device parameters
+            notes: Include notes of MIDI clips
+
+        Returns:
+            Immutable SessionSnapshot (see abletonosc_client.snapshot)
+        """
+        return take_snapshot(self._client, parameters=parameters, notes=notes)
@@ -0,0 +1,239 @@
+"""Bounded queues between listener callbacks and their consumers.
+
+Listener callbacks run on the client's receive thread (or the event loop
+for the async client), so a slow callback delays every message behind it,
+query responses included. An EventQueue is a callback that only stores the
+update; the consumer takes updates at its own pace from another thread or
+task:
+
+    with EventQueue(maxsize=64, overflow="coalesce") as volumes:
+        track.on_volume_change(0, volumes)
+        for track_index, volume in volumes:  # blocks between updates
+            slow_write(track_index, volume)
+
+    async for track_index, volume in volumes:  # or, in a coroutine
+        ...
+
+When the queue is full, the overflow policy decides:
+
+    drop_oldest  discard the oldest update (the default)
+    coalesce     keep only the latest update per key; updates to a key
+                 already queued replace it in place, so a fast property
+                 never pushes out a slow one
+    block        make the callback wait for room (this stalls the
+                 receive thread, so only use it when losing updates is
+                 worse than delaying responses; never with the async
+                 client, whose callbacks run on the consumer's loop)
+
+ListenerRouter.stream() subscribes a queue to a property directly.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Callable, Iterator
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "block")
+
+
+class EventQueueClosed(Exception):
+    """Raised by EventQueue.get() once the queue is closed and empty."""
+
+
+def _default_key(args: tuple) -> tuple:
+    """Coalescing key of an update: everything but the trailing value."""
+    return args[:-1]
+
+
+class EventQueue:
+    """A bounded queue of listener updates, usable as a listener callback.
+
+    Calling the queue with a callback's arguments enqueues them as a tuple.
+
+    Attributes:
+        dropped: Updates discarded because the queue was full
+        coalesced: Updates replaced by a later one for the same key
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        overflow: str = "drop_oldest",
+        key: Callable[[tuple], Any] = _default_key,
+        on_close: Callable[[], None] | None = None,
+    ):
+        """Create an empty queue.
+
+        Args:
+            maxsize: Updates held before the overflow policy applies
+            overflow: "drop_oldest", "coalesce" or "block"
+            key: Function mapping an update's arguments to its coalescing key
+                 (default: all but the last argument, i.e. the object's
+                 indices for the wrappers' callbacks)
+            on_close: Function called once by close() (e.g. to unsubscribe)
+
+        Raises:
+            ValueError: If maxsize is less than 1 or overflow is unknown
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow: {overflow}. Must be one of {OVERFLOW_POLICIES}"
+            )
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._key = key
+        self._on_close = on_close
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        # Updates in arrival order: keyed when coalescing
+        self._items: deque | OrderedDict = (
+            OrderedDict() if overflow == "coalesce" else deque()
+        )
+        self._condition = threading.Condition()
+        # Futures of coroutines waiting in get_async(), with their loops
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __enter__(self) -> "EventQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __call__(self, *args: Any) -> None:
+        """Enqueue an update (the listener callback entry point)."""
+        self.put(args)
+
+    def put(self, item: tuple) -> None:
+        """Enqueue an update, applying the overflow policy when full.
+
+        Updates put after close() are ignored.
+
+        Args:
+            item: The update's arguments
+        """
+        with self._condition:
+            if self.closed:
+                return
+            items = self._items
+            if self.overflow == "coalesce":
+                key = self._key(item)
+                if key in items:
+                    items[key] = item
+                    self.coalesced += 1
+                    return
+                if len(items) >= self.maxsize:
+                    items.popitem(last=False)
+                    self.dropped += 1
+                items[key] = item
+            else:
+                if len(items) >= self.maxsize:
+                    if self.overflow == "block":
+                        self._condition.wait_for(
+                            lambda: len(items) < self.maxsize or self.closed
+                        )
+                        if self.closed:
+                            return
+                    else:
+                        items.popleft()
+                        self.dropped += 1
+                items.append(item)
+            self._condition.notify_all()
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Wake coroutines blocked in get_async() (condition held)."""
+        waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def _pop(self) -> tuple:
+        """Take the oldest update (condition held, queue not empty)."""
+        if self.overflow == "coalesce":
+            item = self._items.popitem(last=False)[1]
+        else:
+            item = self._items.popleft()
+        # Room for a blocked put()
+        self._condition.notify_all()
+        return item
+
+    def get(self, timeout: float | None = None) -> tuple:
+        """Take the oldest update, waiting for one if the queue is empty.
+
+        Args:
+            timeout: Seconds to wait (None waits until an update or close())
+
+        Returns:
+            The update's arguments
+
+        Raises:
+            TimeoutError: If no update arrives within timeout
+            EventQueueClosed: If the queue is closed and empty
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._items or self.closed, timeout
+            ):
+                raise TimeoutError(f"No update within {timeout}s")
+            if not self._items:
+                raise EventQueueClosed()
+            return self._pop()
+
+    async def get_async(self) -> tuple:
+        """Take the oldest update, awaiting one if the queue is empty.
+
+        Cancelling the wait loses no update.
+
+        Returns:
+            The update's arguments
+
+        Raises:
+            EventQueueClosed: If the queue is closed and empty
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._items:
+                    return self._pop()
+                if self.closed:
+                    raise EventQueueClosed()
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            await future
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Yield updates as they arrive, until the queue is closed."""
+        while True:
+            try:
+                yield self.get()
+            except EventQueueClosed:
+                return
+
+    async def __aiter__(self) -> AsyncIterator[tuple]:
+        """Yield updates as they arrive, until the queue is closed."""
+        while True:
+            try:
+                yield await self.get_async()
+            except EventQueueClosed:
+                return
+
+    def close(self) -> None:
+        """Stop accepting updates and end iteration once the queue is drained."""
+        with self._condition:
+            if self.closed:
+                return
+            self.closed = True
+            self._condition.notify_all()
+            self._wake_waiters()
+        if self._on_close is not None:
+            self._on_close()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -1,14 +1,25 @@
 """Pytest configuration and fixtures for OSC client tests.
 
-These are integration tests that require a running Ableton Live instance
-with AbletonOSC enabled.
+The integration tests talk to a running Ableton Live instance with
+AbletonOSC enabled, or to the in-process FakeAbletonOSCServer when Live is
+not available. ABLETONOSC_TEST_SERVER selects the backend:
+
+    auto  Use Live if it answers /live/test, otherwise the fake (default)
+    live  Use Live; skip the integration tests if it is not running
+    fake  Always use the fake server
 """
 
+import os
 import time
 
 import pytest
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+
+# Ports the fake server listens and replies on (kept clear of Live's)
+FAKE_SEND_PORT = 11100
+FAKE_RECEIVE_PORT = 11101
 
 
 # Global to track if we've already checked for Ableton
@@ -40,24 +51,48 @@ def _detect_wsl2_host() -> tuple[str, str | None]:
 def client():
     """Provide a connected AbletonOSC client.
 
-    Skips the test if Ableton is not running or AbletonOSC is not responding.
+    Connects to Live, or to a FakeAbletonOSCServer depending on
+    ABLETONOSC_TEST_SERVER (see module docstring). Skips the test if Live is
+    required but not responding.
     Session-scoped to avoid port binding issues.
     Auto-detects WSL2 and configures host accordingly.
     """
     global _ableton_available
 
-    host, listen_host = _detect_wsl2_host()
-    c = AbletonOSCClient(host=host, listen_host=listen_host)
-    try:
-        c.query("/live/test", timeout=1.0)
-        _ableton_available = True
-    except TimeoutError:
+    mode = os.environ.get("ABLETONOSC_TEST_SERVER", "auto")
+    if mode != "fake":
+        host, listen_host = _detect_wsl2_host()
+        c = AbletonOSCClient(host=host, listen_host=listen_host)
+        try:
+            c.query("/live/test", timeout=1.0)
+            _ableton_available = True
+        except TimeoutError:
+            c.close()
+            _ableton_available = False
+            if mode == "live":
+                pytest.skip("Ableton not running or AbletonOSC not enabled")
+        else:
+            yield c
+            c.close()
+            return
+
+    with FakeAbletonOSCServer(port=FAKE_SEND_PORT, reply_port=FAKE_RECEIVE_PORT):
+        c = AbletonOSCClient(send_port=FAKE_SEND_PORT, receive_port=FAKE_RECEIVE_PORT)
+        yield c
         c.close()
-        _ableton_available = False
-        pytest.skip("Ableton not running or AbletonOSC not enabled")
 
-    yield c
-    c.close()
+
+@pytest.fixture
+def fake_server():
+    """Provide a fresh FakeAbletonOSCServer and a client connected to it.
+
+    Yields (server, client); the server's live_set can be inspected and
+    modified directly.
+    """
+    with FakeAbletonOSCServer(port=19989, reply_port=19988) as server:
+        c = AbletonOSCClient(send_port=19989, receive_port=19988)
+        yield server, c
+        c.close()
 
 
 @pytest.fixture(scope="session")
@@ -171,3 +206,53 @@ def test_clip_with_notes(client, song, clip_slot, clip):
     time.sleep(0.1)
     song.delete_track(track_idx)
     time.sleep(0.1)
+
+
+class OSCCapture:
+    """Offline client whose outgoing datagrams are captured by a local socket."""
+
+    def __init__(self, send_port: int = 19979, receive_port: int = 19978):
+        import socket
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", send_port))
+        self.client = AbletonOSCClient(send_port=send_port, receive_port=receive_port)
+
+    def datagrams(self, timeout: float = 0.1) -> list[bytes]:
+        """Read datagrams until the socket has been idle for `timeout`."""
+        import socket
+
+        self.socket.settimeout(timeout)
+        datagrams = []
+        while True:
+            try:
+                datagrams.append(self.socket.recv(65536))
+            except socket.timeout:
+                return datagrams
+
+    def messages(self, timeout: float = 0.1) -> list[tuple[str, tuple]]:
+        """Read and decode captured messages as (address, args) pairs."""
+        return self.messages_from(self.datagrams(timeout))
+
+    @staticmethod
+    def messages_from(datagrams: list[bytes]) -> list[tuple[str, tuple]]:
+        """Decode datagrams (messages or bundles) as (address, args) pairs."""
+        from pythonosc.osc_packet import OscPacket
+
+        return [
+            (t.message.address, tuple(t.message.params))
+            for d in datagrams
+            for t in OscPacket(d).messages
+        ]
+
+    def close(self) -> None:
+        self.client.close()
+        self.socket.close()
+
+
+@pytest.fixture
+def capture():
+    """Provide an OSCCapture (no Ableton required)."""
+    c = OSCCapture()
+    yield c
+    c.close()
@@ -0,0 +1,283 @@
+"""Tests for the asyncio AbletonOSC client.
+
+Runs against a tiny in-test responder, so no Ableton connection is required.
+"""
+
+import asyncio
+import inspect
+
+import pytest
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_packet import OscPacket
+
+from abletonosc_client.async_client import (
+    AsyncAbletonOSCClient,
+    AsyncClip,
+    AsyncDevice,
+    AsyncSong,
+    AsyncTrack,
+    _AsyncWrapper,
+    _querying_methods,
+)
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+from abletonosc_client.notes import Note
+from abletonosc_client.song import Song
+
+SEND_PORT = 19989
+RECEIVE_PORT = 19988
+
+# Canned replies: address -> function(args) -> response args
+REPLIES = {
+    "/live/song/get/tempo": lambda args: (120.0,),
+    "/live/song/get/num_tracks": lambda args: (3,),
+    "/live/song/get/track_names": lambda args: ("Drums", "Bass", "Lead"),
+    "/live/track/get/name": lambda args: (args[0], f"Track {args[0]}"),
+    "/live/device/get/num_parameters": lambda args: (args[0], args[1], 2),
+    "/live/device/get/parameter/name": lambda args: (*args, f"P{args[2]}"),
+    "/live/device/get/parameter/value": lambda args: (*args, 0.5),
+    "/live/device/get/parameter/min": lambda args: (*args, 0.0),
+    "/live/device/get/parameter/max": lambda args: (*args, 1.0),
+    "/live/device/get/parameters/name": lambda args: (*args, "P0", "P1"),
+    "/live/device/get/parameters/value": lambda args: (*args, 0.5, 0.5),
+    "/live/device/get/parameters/min": lambda args: (*args, 0.0, 0.0),
+    "/live/device/get/parameters/max": lambda args: (*args, 1.0, 1.0),
+}
+
+
+class _Responder(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.received = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        for timed in OscPacket(data).messages:
+            message = timed.message
+            self.received.append((message.address, tuple(message.params)))
+            reply = REPLIES.get(message.address)
+            if reply is None:
+                continue
+            builder = OscMessageBuilder(address=message.address)
+            for arg in reply(tuple(message.params)):
+                builder.add_arg(arg)
+            self.transport.sendto(builder.build().dgram, addr)
+
+
+def _run(test):
+    """Run a coroutine test against a responder and a started client."""
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        transport, responder = await loop.create_datagram_endpoint(
+            _Responder, local_addr=("127.0.0.1", SEND_PORT)
+        )
+        try:
+            async with AsyncAbletonOSCClient(
+                send_port=SEND_PORT, receive_port=RECEIVE_PORT
+            ) as client:
+                await test(client, responder)
+        finally:
+            transport.close()
+
+    asyncio.run(main())
+
+
+def test_query():
+    """Test that an awaited query returns the response."""
+
+    async def test(client, responder):
+        assert await client.query("/live/song/get/tempo") == (120.0,)
+
+    _run(test)
+
+
+def test_concurrent_queries():
+    """Test that many concurrent queries on one address are correlated."""
+
+    async def test(client, responder):
+        results = await asyncio.gather(
+            *(client.query("/live/track/get/name", i) for i in range(50))
+        )
+        assert results == [(i, f"Track {i}") for i in range(50)]
+
+    _run(test)
+
+
+def test_query_many():
+    """Test that query_many returns responses in request order."""
+
+    async def test(client, responder):
+        results = await client.query_many(
+            [("/live/track/get/name", (2,)), ("/live/song/get/tempo", ())]
+        )
+        assert results == [(2, "Track 2"), (120.0,)]
+
+    _run(test)
+
+
+def test_query_timeout():
+    """Test that queries without a reply raise TimeoutError."""
+
+    async def test(client, responder):
+        with pytest.raises(TimeoutError):
+            await client.query("/live/song/get/unknown", timeout=0.2)
+
+    _run(test)
+
+
+def test_send():
+    """Test fire-and-forget send."""
+
+    async def test(client, responder):
+        client.send("/live/song/set/tempo", 128.0)
+        await asyncio.sleep(0.05)
+        assert responder.received == [("/live/song/set/tempo", (128.0,))]
+
+    _run(test)
+
+
+def test_listen():
+    """Test the async listener iterator."""
+
+    async def test(client, responder):
+        updates = []
+
+        async def consume():
+            async for args in client.listen("/live/song/get/beat"):
+                updates.append(args)
+                if len(updates) == 2:
+                    break
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        client._handle_response("/live/song/get/beat", 1)
+        client._handle_response("/live/song/get/beat", 2)
+        await asyncio.wait_for(task, 1.0)
+        assert updates == [(1,), (2,)]
+        assert "/live/song/get/beat" not in client._streams
+
+    _run(test)
+
+
+def test_async_wrappers():
+    """Test that async wrappers reuse the sync wrappers' parsing."""
+
+    async def test(client, responder):
+        assert await AsyncSong(client).get_tempo() == 120.0
+        assert await AsyncTrack(client).get_name(1) == "Track 1"
+        # Native coroutines run their queries in sequence
+        assert await AsyncSong(client).get_track_names() == ("Drums", "Bass", "Lead")
+
+        parameters = await AsyncDevice(client).get_parameters(0, 0)
+        assert [p.name for p in parameters] == ["P0", "P1"]
+        assert parameters[1].max == 1.0
+        assert await AsyncDevice(client).get_parameters(
+            0, 0, strategy="per_parameter"
+        ) == parameters
+
+    _run(test)
+
+
+def test_async_wrapper_sends_once():
+    """Test that wrapped send-only methods send their message once."""
+
+    async def test(client, responder):
+        song = AsyncSong(client)
+        await song.set_tempo(90)
+        await asyncio.sleep(0.05)
+        assert responder.received == [("/live/song/set/tempo", (90.0,))]
+
+    _run(test)
+
+
+class _TwoQueries:
+    """A sync wrapper with a method that queries through a helper."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def _get_tempo(self):
+        return self._client.query("/live/song/get/tempo")
+
+    def get_both(self):
+        return self._get_tempo() + self._client.query("/live/song/get/num_tracks")
+
+    def start(self):
+        self._client.send("/live/song/start_playing")
+
+
+def test_querying_methods_need_native_coroutines():
+    """Test that a wrapper missing a querying coroutine fails when defined."""
+    with pytest.raises(TypeError, match="get_both"):
+
+        class AsyncTwoQueries(_AsyncWrapper):
+            _wrapped = _TwoQueries
+
+    with pytest.raises(TypeError, match="coroutine"):
+
+        class AsyncSyncOverride(_AsyncWrapper):
+            _wrapped = _TwoQueries
+
+            def get_both(self):
+                return ()
+
+    class AsyncComplete(_AsyncWrapper):
+        _wrapped = _TwoQueries
+
+        async def get_both(self):
+            return ()
+
+    assert _querying_methods(_TwoQueries) == {"_get_tempo", "get_both"}
+    assert "start" in vars(AsyncComplete)
+
+
+@pytest.mark.parametrize(
+    "wrapper", [AsyncSong, AsyncTrack, AsyncClip, AsyncDevice], ids=lambda w: w.__name__
+)
+def test_every_wrapped_method_is_a_coroutine(wrapper):
+    """Test that each public sync method has a coroutine counterpart."""
+    querying = _querying_methods(wrapper._wrapped)
+    for name, func in inspect.getmembers(wrapper._wrapped, inspect.isfunction):
+        if name.startswith("_") or name.endswith("_and_wait"):
+            continue
+        method = getattr(wrapper, name)
+        assert inspect.iscoroutinefunction(method), name
+        # Querying methods are written out, not run through the sync code
+        assert (getattr(method, "__wrapped__", None) is func) != (name in querying)
+
+
+def test_native_snapshot_and_notes():
+    """Test the native coroutines against the fake server."""
+    notes = [Note(60, 0.0, 1.0, 100), Note(64, 1.0, 0.5, 90)]
+
+    async def main():
+        async with AsyncAbletonOSCClient(
+            send_port=19957, receive_port=19956
+        ) as client:
+            clip = AsyncClip(client)
+            client.send("/live/clip_slot/create_clip", 0, 0, 4.0)
+            await clip.add_notes(0, 0, notes)
+            await client.barrier()
+            assert await clip.get_notes(0, 0) == notes
+            assert list(await clip.get_notes(0, 0, as_array=True)) == notes
+            return await AsyncSong(client).snapshot(notes=True)
+
+    with FakeAbletonOSCServer(port=19957, reply_port=None) as server:
+        server.processing_time = 0.002
+        snapshot = asyncio.run(main())
+        sync_client = AbletonOSCClient(
+            send_port=19957, receive_port=19955, send_from_receive_port=True
+        )
+        try:
+            assert snapshot == Song(sync_client).snapshot(notes=True)
+        finally:
+            sync_client.close()
+    assert snapshot.tracks[0].clips[0].notes == tuple(notes)
+    # Stages are timed around their awaited round trips
+    assert set(snapshot.timings) == {
+        "song", "tracks", "scenes", "parameters", "notes", "total",
+    }
+    assert min(snapshot.timings.values()) >= 0.002
+
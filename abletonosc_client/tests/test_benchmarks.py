@@ -0,0 +1,39 @@
+"""Smoke tests for the benchmark suite (no Ableton required)."""
+
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.harness import BENCHMARKS, Context, run, summarize, to_json
+
+
+def test_summarize_percentiles():
+    """Test percentile and mean computation."""
+    result = summarize("x", [float(i) for i in range(1, 101)], answer=42)
+    assert result.samples == 100
+    assert result.min == 1.0 and result.max == 100.0
+    assert result.p50 == 50.5
+    assert result.mean == 50.5
+    assert result.extra == {"answer": 42}
+
+
+def test_all_benchmarks_run(capsys):
+    """Test that every registered benchmark runs and serializes to JSON."""
+    assert main(["--list"]) == 0
+    names = capsys.readouterr().out.split()
+    assert names == list(BENCHMARKS)
+
+    results = run([], Context(repeat=2, warmup=0, quick=True))
+    assert {r.name.split("[")[0] for r in results} >= {
+        "transport.query",
+        "transport.send",
+        "encoding.set_volume",
+        "notes.add_notes",
+        "notes.get_notes",
+        "device.get_parameters",
+        "listeners.dispatch",
+        "theory.scales.get_scale",
+    }
+    data = json.loads(to_json(results))
+    assert data["metadata"]["schema"] == 1
+    assert len(data["results"]) == len(results)
+    assert all(r["p50"] > 0 for r in data["results"])
@@ -0,0 +1,156 @@
+"""Tests for the client-side query cache (no Ableton required)."""
+
+import threading
+import time
+
+from abletonosc_client.cache import QueryCache
+
+
+def test_get_put():
+    """Test that stored responses are returned until they expire."""
+    cache = QueryCache(default_ttl=0.05)
+    assert cache.get("/live/track/get/volume", (0,)) is None
+    cache.put("/live/track/get/volume", (0,), (0, 0.85))
+    assert cache.get("/live/track/get/volume", (0,)) == (0, 0.85)
+    assert cache.get("/live/track/get/volume", (1,)) is None
+    time.sleep(0.06)
+    assert cache.get("/live/track/get/volume", (0,)) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_only_get_addresses_are_cached():
+    """Test that non-getter and volatile addresses are never stored."""
+    cache = QueryCache()
+    cache.put("/live/test", (), ("ok",))
+    cache.put("/live/song/get/current_song_time", (), (12.5,))
+    cache.put("/live/song/get/tempo", (), (120.0,), generation=None)
+    assert len(cache) == 1
+    assert cache.ttl_for("/live/track/get/output_meter_level") == 0
+
+
+def test_per_address_ttl():
+    """Test that TTL overrides apply per address."""
+    cache = QueryCache(default_ttl=0, ttls={"/live/song/get/tempo": 10})
+    cache.put("/live/song/get/tempo", (), (120.0,))
+    cache.put("/live/song/get/metronome", (), (1,))
+    assert cache.get("/live/song/get/tempo", ()) == (120.0,)
+    assert cache.get("/live/song/get/metronome", ()) is None
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = QueryCache(max_entries=2)
+    cache.put("/live/track/get/name", (0,), (0, "A"))
+    cache.put("/live/track/get/name", (1,), (1, "B"))
+    cache.get("/live/track/get/name", (0,))
+    cache.put("/live/track/get/name", (2,), (2, "C"))
+    assert cache.get("/live/track/get/name", (1,)) is None
+    assert cache.get("/live/track/get/name", (0,)) == (0, "A")
+    assert cache.get("/live/track/get/name", (2,)) == (2, "C")
+
+
+def test_setter_invalidates_matching_object():
+    """Test that a /set/ send drops the getter entry for that object only."""
+    cache = QueryCache()
+    cache.put("/live/track/get/mute", (0,), (0, 0))
+    cache.put("/live/track/get/mute", (1,), (1, 0))
+    # Integer value arguments must not stop the prefix match
+    cache.on_send("/live/track/set/mute", (0, 1))
+    assert cache.get("/live/track/get/mute", (0,)) is None
+    assert cache.get("/live/track/get/mute", (1,)) == (1, 0)
+
+
+def test_setter_invalidates_related_bulk_getters():
+    """Test that renaming a track drops the cached track name list."""
+    cache = QueryCache()
+    cache.put("/live/song/get/track_names", (), ("Drums", "Bass"))
+    cache.on_send("/live/track/set/name", (1, "Keys"))
+    assert cache.get("/live/song/get/track_names", ()) is None
+
+
+def test_structural_send_clears_cache():
+    """Test that sends other than setters and listeners clear everything."""
+    cache = QueryCache()
+    cache.put("/live/track/get/name", (0,), (0, "A"))
+    cache.on_send("/live/song/start_listen/tempo", ())
+    assert len(cache) == 1
+    cache.on_send("/live/song/delete_track", (0,))
+    assert len(cache) == 0
+
+
+def test_read_only_sends_keep_cache():
+    """Test that pings, status messages and browser listings clear nothing."""
+    cache = QueryCache()
+    cache.put("/live/track/get/name", (0,), (0, "A"))
+    cache.on_send("/live/test", ())
+    cache.on_send("/live/api/show_message", ("Hello",))
+    cache.on_send("/live/browser/list_instruments", ())
+    cache.on_send("/live/browser/search", ("Drift",))
+    assert len(cache) == 1
+    cache.on_send("/live/browser/load_item", ("Drift",))
+    assert len(cache) == 0
+
+
+def test_update_invalidates_object():
+    """Test that an incoming update drops the entry it refers to."""
+    cache = QueryCache()
+    cache.put("/live/track/get/volume", (0,), (0, 0.5))
+    cache.put("/live/track/get/volume", (1,), (1, 0.5))
+    cache.on_message("/live/track/get/volume", (1, 0.7))
+    assert cache.get("/live/track/get/volume", (0,)) == (0, 0.5)
+    assert cache.get("/live/track/get/volume", (1,)) is None
+
+
+def test_stale_generation_is_not_stored():
+    """Test that a response invalidated while in flight is dropped."""
+    cache = QueryCache()
+    generation = cache.begin("/live/song/get/tempo", ())
+    cache.on_send("/live/song/set/tempo", (128.0,))
+    cache.put("/live/song/get/tempo", (), (120.0,), generation)
+    cache.end("/live/song/get/tempo", ())
+    assert cache.get("/live/song/get/tempo", ()) is None
+
+
+def test_unrelated_invalidation_keeps_in_flight_response():
+    """Test that only invalidations matching an in-flight query drop it."""
+    cache = QueryCache()
+    volume = cache.begin("/live/track/get/volume", (0,))
+    tempo = cache.begin("/live/song/get/tempo", ())
+    cache.on_send("/live/track/set/volume", (1, 0.5))
+    cache.on_send("/live/song/set/metronome", (1,))
+    cache.on_message("/live/track/get/volume", (0, 0.7))
+    cache.put("/live/track/get/volume", (0,), (0, 0.7), volume)
+    cache.put("/live/song/get/tempo", (), (120.0,), tempo)
+    cache.end("/live/track/get/volume", (0,))
+    cache.end("/live/song/get/tempo", ())
+    assert cache.get("/live/track/get/volume", (0,)) is None
+    assert cache.get("/live/song/get/tempo", ()) == (120.0,)
+    assert not cache._in_flight
+
+
+def test_client_query_uses_cache():
+    """Test that the client answers repeat queries from its cache."""
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998, cache=QueryCache())
+    try:
+        def respond():
+            deadline = time.monotonic() + 1.0
+            while not len(c._pending) and time.monotonic() < deadline:
+                time.sleep(0.001)
+            c._handle_response("/live/song/get/tempo", 120.0)
+
+        responder = threading.Thread(target=respond)
+        responder.start()
+        assert c.query("/live/song/get/tempo", timeout=1.0) == (120.0,)
+        responder.join()
+
+        # Answered without a round trip
+        assert c.query("/live/song/get/tempo", timeout=0.1) == (120.0,)
+        assert c.query_many([("/live/song/get/tempo", ())], timeout=0.1) == [(120.0,)]
+
+        # A listener update makes the next query go to Live again
+        c._handle_response("/live/song/get/tempo", 128.0)
+        assert c.cache.get("/live/song/get/tempo", ()) is None
+    finally:
+        c.close()
@@ -32,3 +32,314 @@ def test_application_get_version(application):
     version = application.get_version()
     assert version  # Non-empty string
     assert isinstance(version, str)
+
+
+def _wait_for_pending(c, count, timeout=1.0):
+    """Wait until `count` queries are registered on the client."""
+    import time
+
+    deadline = time.monotonic() + timeout
+    while len(c._pending) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert len(c._pending) == count
+
+
+def test_concurrent_queries_are_correlated_by_index():
+    """Test that concurrent queries on one address get their own responses."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(c.query, "/live/clip/get/name", 0, clip_index)
+                for clip_index in range(3)
+            ]
+            _wait_for_pending(c, 3)
+            # Answer out of order
+            for clip_index in (2, 0, 1):
+                c._handle_response(
+                    "/live/clip/get/name", 0, clip_index, f"Clip {clip_index}"
+                )
+            results = [f.result(timeout=1.0) for f in futures]
+        assert results == [(0, i, f"Clip {i}") for i in range(3)]
+    finally:
+        c.close()
+
+
+def test_identical_queries_are_answered_in_order():
+    """Test that identical in-flight queries share a FIFO."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(c.query, "/live/track/get/volume", 1)
+            _wait_for_pending(c, 1)
+            second = pool.submit(c.query, "/live/track/get/volume", 1)
+            _wait_for_pending(c, 2)
+            c._handle_response("/live/track/get/volume", 1, 0.25)
+            c._handle_response("/live/track/get/volume", 1, 0.5)
+            assert first.result(timeout=1.0) == (1, 0.25)
+            assert second.result(timeout=1.0) == (1, 0.5)
+    finally:
+        c.close()
+
+
+def test_listener_update_for_other_index_does_not_answer_query():
+    """Test that an update for another track doesn't resolve a pending query."""
+    import pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        updates = []
+        c.start_listener("/live/track/get/volume", lambda addr, *a: updates.append(a))
+        import threading
+
+        timer = threading.Timer(
+            0.05, c._handle_response, ("/live/track/get/volume", 5, 0.8)
+        )
+        timer.start()
+        with pytest.raises(TimeoutError):
+            c.query("/live/track/get/volume", 2, timeout=0.3)
+        timer.join()
+        assert updates == [(5, 0.8)]
+    finally:
+        c.close()
+
+
+def test_response_without_echoed_indices_falls_back_to_oldest():
+    """Test that responses which don't echo indices still reach the query."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        timer = threading.Timer(
+            0.05, c._handle_response, ("/live/song/get/track_names", "Drums", "Bass")
+        )
+        timer.start()
+        result = c.query("/live/song/get/track_names", 0, 2, timeout=1.0)
+        timer.join()
+        assert result == ("Drums", "Bass")
+    finally:
+        c.close()
+
+
+def test_fallback_prefers_oldest_compatible_query():
+    """Test that an unechoed response goes to the oldest query, not the newest."""
+    from abletonosc_client.client import _PendingQuery, _PendingTable
+
+    table = _PendingTable()
+    indexed = _PendingQuery("/live/song/get/track_names", (0, 2))
+    unindexed = _PendingQuery("/live/song/get/track_names", ())
+    table.add(indexed)
+    table.add(unindexed)
+    assert table.pop_match("/live/song/get/track_names", ("Drums", "Bass")) is indexed
+    assert table.pop_match("/live/song/get/track_names", ("A", "B", "C")) is unindexed
+
+    # Echoed indices still pick their own query
+    first = _PendingQuery("/live/track/get/volume", (1,))
+    second = _PendingQuery("/live/track/get/volume", (0,))
+    table.add(first)
+    table.add(second)
+    assert table.pop_match("/live/track/get/volume", (0, 0.5)) is second
+
+
+def test_query_many_returns_results_in_request_order():
+    """Test that query_many pipelines requests and preserves order."""
+    import threading
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        def respond():
+            _wait_for_pending(c, 3)
+            c._handle_response("/live/song/get/tempo", 120.0)
+            c._handle_response("/live/track/get/name", 1, "Bass")
+            c._handle_response("/live/track/get/name", 0, "Drums")
+
+        responder = threading.Thread(target=respond)
+        responder.start()
+        results = c.query_many(
+            [
+                ("/live/track/get/name", (0,)),
+                ("/live/track/get/name", (1,)),
+                ("/live/song/get/tempo", ()),
+            ],
+            timeout=1.0,
+        )
+        responder.join()
+        assert results == [(0, "Drums"), (1, "Bass"), (120.0,)]
+        assert len(c._pending) == 0
+    finally:
+        c.close()
+
+
+def test_query_many_timeout_without_ableton():
+    """Test that query_many raises once the overall deadline passes."""
+    import pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998)
+    try:
+        with pytest.raises(TimeoutError):
+            c.query_many([("/live/test", ()), ("/live/test", ())], timeout=0.3)
+        assert len(c._pending) == 0
+    finally:
+        c.close()
+
+
+def test_query_many_track_names(client, song):
+    """Test that query_many matches individual queries against Live."""
+    num_tracks = song.get_num_tracks()
+    results = client.query_many(
+        [("/live/track/get/name", (i,)) for i in range(num_tracks)]
+    )
+    assert [r[0] for r in results] == list(range(num_tracks))
+
+
+def test_single_receive_mode_dispatches_in_order():
+    """Test that the single-threaded receive loop preserves arrival order."""
+    import threading
+
+    from pythonosc.udp_client import SimpleUDPClient
+
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.waiting import wait_until
+
+    c = AbletonOSCClient(send_port=19999, receive_port=19998, receive_mode="single")
+    sender = SimpleUDPClient("127.0.0.1", 19998)
+    try:
+        received = []
+        threads = set()
+
+        def on_time(addr, *args):
+            received.append(args[0])
+            threads.add(threading.get_ident())
+
+        c.start_listener("/live/song/get/current_song_time", on_time)
+        for i in range(200):
+            sender.send_message("/live/song/get/current_song_time", float(i))
+        wait_until(lambda: len(received), lambda n: n == 200)
+        assert received == [float(i) for i in range(200)]
+        assert len(threads) == 1
+    finally:
+        sender._sock.close()
+        c.close()
+
+
+def test_callback_workers_allow_queries_from_callbacks():
+    """Test that callbacks on worker threads can issue queries."""
+    from pythonosc.udp_client import SimpleUDPClient
+
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.waiting import wait_until
+
+    c = AbletonOSCClient(
+        send_port=19999, receive_port=19998, receive_mode="single", callback_workers=2
+    )
+    sender = SimpleUDPClient("127.0.0.1", 19998)
+    try:
+        tempos = []
+        c.start_listener(
+            "/live/song/get/beat",
+            lambda addr, *args: tempos.append(c.query("/live/song/get/tempo")),
+        )
+        sender.send_message("/live/song/get/beat", 1)
+        _wait_for_pending(c, 1)
+        sender.send_message("/live/song/get/tempo", 120.0)
+        wait_until(lambda: tempos, lambda t: t == [(120.0,)])
+    finally:
+        sender._sock.close()
+        c.close()
+
+
+def test_raising_worker_callback_is_logged(caplog):
+    """Test that a failing callback on a worker thread is logged, not printed."""
+    import logging
+
+    from pythonosc.udp_client import SimpleUDPClient
+
+    from abletonosc_client.client import AbletonOSCClient
+    from abletonosc_client.waiting import wait_until
+
+    c = AbletonOSCClient(
+        send_port=19999, receive_port=19998, receive_mode="single", callback_workers=1
+    )
+    sender = SimpleUDPClient("127.0.0.1", 19998)
+    received = []
+
+    def fail(address, *args):
+        raise RuntimeError("boom")
+
+    try:
+        c.start_listener("/live/song/get/beat", fail)
+        c.start_listener(
+            "/live/song/get/tempo", lambda addr, *args: received.append(args)
+        )
+        with caplog.at_level(logging.ERROR, logger="abletonosc_client.client"):
+            sender.send_message("/live/song/get/beat", 1)
+            sender.send_message("/live/song/get/tempo", 120.0)
+            wait_until(lambda: received, lambda r: r == [(120.0,)])
+        records = [r for r in caplog.records if r.name == "abletonosc_client.client"]
+        assert len(records) == 1
+        assert records[0].exc_info[0] is RuntimeError
+    finally:
+        sender._sock.close()
+        c.close()
+
+
+def test_invalid_receive_mode():
+    """Test that unknown receive modes are rejected."""
+    import pytest
+
+    from abletonosc_client.client import AbletonOSCClient
+
+    with pytest.raises(ValueError):
+        AbletonOSCClient(send_port=19999, receive_port=19998, receive_mode="forking")
+
+
+def test_bundle_groups_sends_into_few_datagrams(capture):
+    """Test that sends inside bundle() go out as size-bounded bundles."""
+    c = capture.client
+    c.max_datagram_size = 512
+    with c.bundle():
+        for i in range(100):
+            c.send("/live/track/set/volume", i, 0.5)
+        assert capture.datagrams(timeout=0.05) == []
+    datagrams = capture.datagrams(timeout=0.2)
+    assert 1 < len(datagrams) < 100
+    assert all(len(d) <= 512 for d in datagrams)
+    assert capture.messages_from(datagrams) == [
+        ("/live/track/set/volume", (i, 0.5)) for i in range(100)
+    ]
+
+
+def test_bundle_flushes_before_query(capture):
+    """Test that queries inside bundle() are sent after earlier sends."""
+    import pytest
+
+    c = capture.client
+    with c.bundle():
+        c.send("/live/song/set/tempo", 100.0)
+        with pytest.raises(TimeoutError):
+            c.query("/live/song/get/tempo", timeout=0.05)
+        c.send("/live/song/set/tempo", 110.0)
+        c.flush()
+        c.send("/live/song/set/tempo", 120.0)
+    assert capture.messages(timeout=0.2) == [
+        ("/live/song/set/tempo", (100.0,)),
+        ("/live/song/get/tempo", ()),
+        ("/live/song/set/tempo", (110.0,)),
+        ("/live/song/set/tempo", (120.0,)),
+    ]
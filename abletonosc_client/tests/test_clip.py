@@ -89,6 +89,15 @@ def test_get_notes(clip, test_clip_with_notes):
     assert 67 in pitches  # G4
 
 
+def test_get_notes_as_array(clip, test_clip_with_notes):
+    """Test getting notes as a columnar NoteArray."""
+    t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
+    notes = clip.get_notes(t, s, as_array=True)
+    assert len(notes) == 3
+    assert sorted(notes.pitch) == [60, 64, 67]
+    assert notes.to_notes() == clip.get_notes(t, s)
+
+
 def test_is_midi_clip(clip, test_clip_with_notes):
     """Test checking if clip is a MIDI clip."""
     t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
@@ -263,3 +272,41 @@ def test_get_has_groove(clip, test_clip_with_notes):
     t, s = test_clip_with_notes["track"], test_clip_with_notes["scene"]
     has_groove = clip.get_has_groove(t, s)
     assert isinstance(has_groove, bool)
+
+
+def test_add_notes_chunks_large_note_lists(capture):
+    """Test that large note lists are split into datagram-sized messages."""
+    from abletonosc_client.clip import Clip
+
+    notes = [
+        Note(pitch=36 + i % 48, start_time=i * 0.25, duration=0.25, velocity=100)
+        for i in range(2000)
+    ]
+    sent = Clip(capture.client).add_notes(1, 2, notes)
+    assert sent == 2000
+
+    datagrams = capture.datagrams()
+    assert len(datagrams) > 1
+    assert all(len(d) <= capture.client.max_datagram_size for d in datagrams)
+
+    received = []
+    for address, args in capture.messages_from(datagrams):
+        assert address == "/live/clip/add/notes"
+        assert args[:2] == (1, 2)
+        values = args[2:]
+        received.extend(
+            Note(*values[i : i + 4], mute=bool(values[i + 4]))
+            for i in range(0, len(values), 5)
+        )
+    assert received == notes
+
+
+def test_add_notes_small_list_is_one_message(capture):
+    """Test that a small note list is still sent as a single message."""
+    from abletonosc_client.clip import Clip
+
+    notes = [Note(60, 0.0, 1.0, 100), Note(64, 0.0, 1.0, 100, mute=True)]
+    assert Clip(capture.client).add_notes(0, 0, notes) == 2
+    assert capture.messages() == [
+        ("/live/clip/add/notes", (0, 0, 60, 0.0, 1.0, 100, 0, 64, 0.0, 1.0, 100, 1))
+    ]
@@ -0,0 +1,85 @@
+"""Tests for the coalescing write queue (no Ableton required)."""
+
+import time
+
+import pytest
+
+from abletonosc_client.coalesce import CoalescingWriter
+from abletonosc_client.device import Device
+from abletonosc_client.track import Track
+
+
+def test_keeps_latest_value_per_property(capture):
+    """Test that a burst of writes becomes one message per property."""
+    writer = CoalescingWriter(capture.client, rate=0.01)
+    track = Track(writer)
+    device = Device(writer)
+    for i in range(1000):
+        track.set_volume(0, i / 1000)
+        track.set_volume(1, 0.5)
+        device.set_parameter_value(0, 0, 3, i / 1000)
+    track.set_mute(0, True)
+    track.set_mute(0, False)
+    writer.flush()
+
+    assert capture.messages() == [
+        ("/live/track/set/volume", (0, pytest.approx(0.999))),
+        ("/live/track/set/volume", (1, 0.5)),
+        ("/live/device/set/parameter/value", (0, 0, 3, pytest.approx(0.999))),
+        ("/live/track/set/mute", (0, 0)),
+    ]
+    assert writer.submitted == 3002
+    assert writer.sent == 4
+    assert writer.coalesced == 2998
+    writer.close()
+
+
+def test_flushes_are_bundled(capture):
+    """Test that a flush goes out as a single datagram when bundling."""
+    with CoalescingWriter(capture.client, rate=0.01) as writer:
+        for t in range(8):
+            Track(writer).set_panning(t, 0.25)
+    assert len(capture.datagrams()) == 1
+
+
+def test_other_sends_keep_their_order(capture):
+    """Test that non-set messages flush held values first."""
+    with CoalescingWriter(capture.client, rate=0.01, bundle=False) as writer:
+        Track(writer).set_volume(0, 0.1)
+        writer.send("/live/clip_slot/fire", 0, 0)
+        Track(writer).set_volume(0, 0.2)
+    assert [m[0] for m in capture.messages()] == [
+        "/live/track/set/volume",
+        "/live/clip_slot/fire",
+        "/live/track/set/volume",
+    ]
+
+
+def test_background_flush_rate(capture):
+    """Test that held values are sent by the flush thread at the given rate."""
+    with CoalescingWriter(capture.client, rate=50.0) as writer:
+        track = Track(writer)
+        end = time.monotonic() + 0.2
+        while time.monotonic() < end:
+            track.set_volume(0, 0.5)
+            time.sleep(0.0005)
+        time.sleep(0.05)
+        sent = writer.sent
+    # ~10 flushes in 0.2 s at 50 Hz, far fewer than the writes
+    assert 3 <= sent <= 15
+    assert writer.submitted > 5 * sent
+
+
+def test_reads_see_held_writes(fake_server):
+    """Test that queries flush held writes first."""
+    _, client = fake_server
+    with CoalescingWriter(client, rate=0.01) as writer:
+        track = Track(writer)
+        track.set_volume(0, 0.25)
+        assert track.get_volume(0) == 0.25
+
+
+def test_invalid_rate(capture):
+    """Test that a non-positive rate is rejected."""
+    with pytest.raises(ValueError):
+        CoalescingWriter(capture.client, rate=0)
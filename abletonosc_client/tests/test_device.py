@@ -136,3 +136,16 @@ def test_get_parameter_value_string(device, device_exists):
 
     value_string = device.get_parameter_value_string(0, 0, 0)
     assert isinstance(value_string, str)
+
+
+def test_get_parameters_strategies_agree(device, device_exists):
+    """Test that bulk and per-parameter get_parameters return the same data."""
+    bulk = device.get_parameters(0, 0)
+    assert len(bulk) == device.get_num_parameters(0, 0)
+    assert bulk == device.get_parameters(0, 0, strategy="per_parameter")
+
+
+def test_get_parameters_invalid_strategy(device, device_exists):
+    """Test that an unknown strategy is rejected."""
+    with pytest.raises(ValueError):
+        device.get_parameters(0, 0, strategy="parallel")
@@ -0,0 +1,160 @@
+"""Tests for snapshot diffing and patch application (no Ableton required)."""
+
+import dataclasses
+
+import pytest
+
+from abletonosc_client.device import Parameter
+from abletonosc_client.diff import Change, apply_patch, diff_snapshots
+from abletonosc_client.notes import Note
+from abletonosc_client.snapshot import (
+    ClipSnapshot,
+    DeviceSnapshot,
+    SceneSnapshot,
+    SessionSnapshot,
+    TrackSnapshot,
+)
+
+
+def _parameters(values):
+    return tuple(Parameter(i, f"P{i}", v, 0.0, 1.0) for i, v in enumerate(values))
+
+
+def _session(tracks=None, tempo=120.0):
+    if tracks is None:
+        tracks = (_track(0), _track(1))
+    return SessionSnapshot(
+        tempo=tempo,
+        signature_numerator=4,
+        signature_denominator=4,
+        tracks=tracks,
+        scenes=(SceneSnapshot(0, "Intro", 0), SceneSnapshot(1, "Verse", 0)),
+    )
+
+
+def _track(index, clips=(), devices=(), **fields):
+    values = dict(
+        name=f"Track {index}",
+        volume=0.85,
+        panning=0.0,
+        mute=False,
+        solo=False,
+        color=0,
+        is_midi=True,
+    )
+    values.update(fields)
+    return TrackSnapshot(index=index, clips=clips, devices=devices, **values)
+
+
+def test_identical_snapshots_have_no_changes():
+    """Test that nothing is sent when the set already matches."""
+    assert diff_snapshots(_session(), _session()) == []
+
+
+def test_float32_rounding_is_not_a_change():
+    """Test that values read back from Live compare equal to the source."""
+    current = _session(tracks=(_track(0, volume=0.699999988079071), _track(1)))
+    desired = _session(tracks=(_track(0, volume=0.7), _track(1)))
+    assert diff_snapshots(current, desired) == []
+
+
+def test_property_changes():
+    """Test song, track and scene property changes."""
+    current = _session()
+    desired = dataclasses.replace(
+        _session(tracks=(_track(0), _track(1, name="Bass", mute=True)), tempo=128.0),
+        scenes=(SceneSnapshot(0, "Intro", 0), SceneSnapshot(1, "Chorus", 0)),
+    )
+    assert diff_snapshots(current, desired) == [
+        Change(("song",), "tempo", 128.0),
+        Change(("scene", 1), "name", "Chorus"),
+        Change(("track", 1), "name", "Bass"),
+        Change(("track", 1), "mute", True),
+    ]
+
+
+def test_clip_create_delete_and_notes():
+    """Test that only differing notes are removed and added."""
+    kick = Note(36, 0.0, 0.25, 100)
+    snare = Note(38, 1.0, 0.25, 100)
+    loud_snare = Note(38, 1.0, 0.25, 127)
+    current = _session(
+        tracks=(
+            _track(0, clips=(ClipSnapshot(0, "Beat", 4.0, 0, (kick, snare)),)),
+            _track(1, clips=(ClipSnapshot(0, "Old", 4.0, 0, ()),)),
+        )
+    )
+    desired = _session(
+        tracks=(
+            _track(0, clips=(ClipSnapshot(0, "Beat", 4.0, 0, (kick, loud_snare)),)),
+            _track(1, clips=(ClipSnapshot(1, "New", 8.0, 0, (kick,)),)),
+        )
+    )
+    assert diff_snapshots(current, desired) == [
+        Change(("clip", 0, 0), "remove_notes", (snare,)),
+        Change(("clip", 0, 0), "add_notes", (loud_snare,)),
+        Change(("clip", 1, 0), "delete", None),
+        Change(("clip", 1, 1), "create", 8.0),
+        Change(("clip", 1, 1), "name", "New"),
+        Change(("clip", 1, 1), "add_notes", (kick,)),
+    ]
+
+
+def test_parameter_changes_pick_smaller_encoding():
+    """Test single-parameter sets for few changes, the vector for many."""
+    current = _session(
+        tracks=(
+            _track(0, devices=(DeviceSnapshot(0, "D", "D", 1, _parameters([0.0] * 8)),)),
+            _track(1),
+        )
+    )
+    one = _session(
+        tracks=(
+            _track(
+                0,
+                devices=(
+                    DeviceSnapshot(0, "D", "D", 1, _parameters([0.5] + [0.0] * 7)),
+                ),
+            ),
+            _track(1),
+        )
+    )
+    assert diff_snapshots(current, one) == [Change(("device", 0, 0), "parameter", (0, 0.5))]
+
+    many = _session(
+        tracks=(
+            _track(0, devices=(DeviceSnapshot(0, "D", "D", 1, _parameters([0.5] * 8)),)),
+            _track(1),
+        )
+    )
+    assert diff_snapshots(current, many) == [
+        Change(("device", 0, 0), "parameters", (0.5,) * 8)
+    ]
+
+
+def test_structural_differences_are_rejected():
+    """Test that differing track counts raise ValueError."""
+    with pytest.raises(ValueError):
+        diff_snapshots(_session(), _session(tracks=(_track(0),)))
+
+
+def test_apply_patch_sends_bundled_setters(capture):
+    """Test that a patch is sent through the setters in one datagram."""
+    changes = [
+        Change(("song",), "tempo", 128.0),
+        Change(("track", 1), "volume", 0.5),
+        Change(("clip", 0, 2), "create", 8.0),
+        Change(("clip", 0, 2), "add_notes", (Note(60, 0.0, 1.0, 100),)),
+        Change(("device", 0, 1), "parameter", (3, 0.25)),
+    ]
+    assert apply_patch(capture.client, changes) == 5
+
+    datagrams = capture.datagrams()
+    assert len(datagrams) == 1
+    assert capture.messages_from(datagrams) == [
+        ("/live/song/set/tempo", (128.0,)),
+        ("/live/track/set/volume", (1, 0.5)),
+        ("/live/clip_slot/create_clip", (0, 2, 8.0)),
+        ("/live/clip/add/notes", (0, 2, 60, 0.0, 1.0, 100, 0)),
+        ("/live/device/set/parameter/value", (0, 1, 3, 0.25)),
+    ]
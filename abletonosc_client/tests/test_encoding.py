@@ -0,0 +1,116 @@
+"""Tests for OSC encoding helpers - no Ableton connection required."""
+
+import pytest
+from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_message import OscMessage
+
+from abletonosc_client.encoding import (
+    BUNDLE_HEADER_SIZE,
+    build_message,
+    build_message_uncached,
+    message_size,
+    pack_bundles,
+)
+
+
+@pytest.mark.parametrize(
+    "address,args",
+    [
+        ("/live/test", ()),
+        ("/live/song/set/tempo", (120.0,)),
+        ("/live/track/set/name", (0, "Drums")),
+        ("/live/track/set/name", (3, "Bass")),
+        ("/live/clip/add/notes", (0, 0, 60, 0.0, 1.0, 100, 0)),
+        ("/live/song/set/metronome", (True, False, None)),
+        ("/live/device/set/parameter/value", (2**31, -(2**31), 2**31 - 1)),
+        ("/x", (b"\x00\x01\x02",)),
+        ("/live/track/set/name", (0, "Ünïcödé")),
+    ],
+)
+def test_message_size_matches_encoded_size(address, args):
+    """Test that computed sizes match real encoded messages."""
+    assert message_size(address, args) == len(build_message(address, args))
+
+
+def test_build_message_roundtrip():
+    """Test that built messages decode to the same address and arguments."""
+    message = OscMessage(build_message("/live/track/set/name", (1, "Lead")))
+    assert message.address == "/live/track/set/name"
+    assert message.params == [1, "Lead"]
+
+
+def test_pack_bundles_respects_max_size():
+    """Test that messages are packed into bundles no larger than the limit."""
+    messages = [build_message("/live/track/set/volume", (i, 0.5)) for i in range(100)]
+    datagrams = pack_bundles(messages, 512)
+
+    assert all(len(d) <= 512 for d in datagrams)
+    decoded = []
+    for datagram in datagrams:
+        assert OscBundle.dgram_is_bundle(datagram)
+        decoded.extend(OscBundle(datagram))
+    assert [m.params[0] for m in decoded] == list(range(100))
+
+
+def test_pack_bundles_single_message_is_plain():
+    """Test that a lone message is not wrapped in a bundle."""
+    message = build_message("/live/song/set/tempo", (120.0,))
+    assert pack_bundles([message], 1472) == [message]
+    assert pack_bundles([], 1472) == []
+
+
+def test_pack_bundles_oversized_message_sent_alone():
+    """Test that a message larger than the limit gets its own datagram."""
+    small = build_message("/live/test", ())
+    large = build_message("/live/clip/add/notes", (0, 0) + (60, 0.0, 1.0, 100, 0) * 50)
+    datagrams = pack_bundles([small, large, small], 128)
+    assert datagrams == [small, large, small]
+
+
+def test_bundle_header_size():
+    """Test the bundle header matches what pythonosc produces."""
+    from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+
+    assert len(OscBundleBuilder(IMMEDIATELY).build().dgram) == BUNDLE_HEADER_SIZE
+
+
+def test_chunk_arguments_fits_every_chunk():
+    """Test that every chunk encodes within the size limit."""
+    from abletonosc_client.encoding import chunk_arguments
+
+    items = [(60 + i % 12, i * 0.5, 0.5, 100, 0) for i in range(500)]
+    chunks = chunk_arguments("/live/clip/add/notes", (0, 0), items, 1472)
+    assert [item for chunk in chunks for item in chunk] == items
+    for chunk in chunks:
+        args = [0, 0] + [v for item in chunk for v in item]
+        assert message_size("/live/clip/add/notes", args) <= 1472
+    # Chunks are filled: adding the next item would overflow
+    first = [0, 0] + [v for item in chunks[0] + [items[len(chunks[0])]] for v in item]
+    assert message_size("/live/clip/add/notes", first) > 1472
+
+
+@pytest.mark.parametrize(
+    "address,args",
+    [
+        ("/live/test", ()),
+        ("/live/track/set/volume", (3, 0.85)),
+        ("/live/device/set/parameter/value", (0, 1, 7, -0.5)),
+        ("/live/song/set/tempo", (float("inf"),)),
+        ("/live/clip/set/name", (0, 0, "Bass")),
+        ("/live/track/set/mute", (0, True)),
+        ("/live/song/set/current_song_time", (2**40,)),
+    ],
+)
+def test_build_message_matches_builder(address, args):
+    """Test that templated encoding is byte-identical to python-osc's builder."""
+    expected = build_message_uncached(address, args)
+    # Twice: compiling the template, then using it
+    assert build_message(address, args) == expected
+    assert build_message(address, args) == expected
+
+
+def test_build_message_templates_keep_types_apart():
+    """Test that the same address with other argument types is not mixed up."""
+    assert OscMessage(build_message("/live/x", (1,))).params == [1]
+    assert OscMessage(build_message("/live/x", (1.5,))).params == [1.5]
+    assert OscMessage(build_message("/live/x", (1, 2))).params == [1, 2]
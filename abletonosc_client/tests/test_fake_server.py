@@ -0,0 +1,146 @@
+"""Tests for the in-process fake AbletonOSC server (no Ableton required)."""
+
+import time
+
+import pytest
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.clip import Clip
+from abletonosc_client.device import Device
+from abletonosc_client.fake_server import FakeAbletonOSCServer, FakeLiveSet
+from abletonosc_client.notes import Note
+from abletonosc_client.song import Song
+
+
+def test_default_set(fake_server):
+    """Test the shape of the default set."""
+    server, client = fake_server
+    song = Song(client)
+    assert song.get_num_tracks() == 4
+    assert song.get_num_scenes() == 8
+    assert song.get_track_names() == ("1-MIDI", "2-MIDI", "3-Audio", "4-Audio")
+    assert Device(client).get_name(0, 0) == "Drift"
+
+
+def test_custom_set():
+    """Test serving a caller-provided set."""
+    live_set = FakeLiveSet(num_midi_tracks=1, num_audio_tracks=0, num_scenes=2)
+    live_set.song["tempo"] = 95.0
+    with FakeAbletonOSCServer(port=19987, reply_port=19986, live_set=live_set):
+        client = AbletonOSCClient(send_port=19987, receive_port=19986)
+        try:
+            song = Song(client)
+            assert song.get_tempo() == 95.0
+            assert song.get_num_tracks() == 1
+        finally:
+            client.close()
+
+
+def test_set_and_undo(fake_server):
+    """Test that property changes are undoable."""
+    server, client = fake_server
+    song = Song(client)
+    song.set_tempo(140.0)
+    assert song.get_tempo() == 140.0
+    assert song.can_undo()
+    song.undo()
+    assert song.get_tempo() == 120.0
+    song.redo()
+    assert song.get_tempo() == 140.0
+
+
+def test_structural_changes(fake_server):
+    """Test creating tracks and inserting devices."""
+    server, client = fake_server
+    song = Song(client)
+    song.create_midi_track(-1)
+    assert song.get_num_tracks() == 5
+    assert client.query("/live/track/insert_device", 4, "Reverb") == (4, 0)
+    assert client.query("/live/track/insert_device", 4, "No Such Device") == (4, -1)
+    assert server.live_set.tracks[4].devices[0].props["class_name"] == "Reverb"
+
+
+def test_device_parameter_round_trip(fake_server):
+    """Test setting device parameters and reading them back."""
+    server, client = fake_server
+    device = Device(client)
+    device.set_parameter_value(0, 0, 1, 0.25)
+    assert device.get_parameter_value(0, 0, 1) == 0.25
+    assert server.live_set.tracks[0].devices[0].parameters[1]["value"] == 0.25
+    # Values are clamped to the parameter's range
+    device.set_parameter_value(0, 0, 1, 7.0)
+    assert device.get_parameter_value(0, 0, 1) == 1.0
+    Song(client).undo()
+    assert device.get_parameter_value(0, 0, 1) == 0.25
+
+
+def test_notes_round_trip(fake_server):
+    """Test adding, reading and removing notes by pitch and time range."""
+    server, client = fake_server
+    client.send("/live/clip_slot/create_clip", 0, 0, 4.0)
+    clip = Clip(client)
+    clip.add_notes(0, 0, [Note(60, 0.0, 1.0, 100), Note(64, 1.0, 1.0, 100)])
+    clip.remove_notes(0, 0, start_time=1.0, end_time=2.0, pitch_start=64, pitch_end=64)
+    assert list(clip.get_notes(0, 0)) == [Note(60, 0.0, 1.0, 100, False)]
+
+
+def test_stop_all_clips(fake_server):
+    """Test that stopping all clips stops a clip on every track."""
+    server, client = fake_server
+    clip = Clip(client)
+    for track_index in (0, 1):
+        client.send("/live/clip_slot/create_clip", track_index, 0, 4.0)
+    client.send("/live/scene/fire", 0)
+    assert clip.get_is_playing(0, 0) and clip.get_is_playing(1, 0)
+    Song(client).stop_all_clips()
+    assert not clip.get_is_playing(0, 0)
+    assert not clip.get_is_playing(1, 0)
+
+
+def test_listener_updates(fake_server):
+    """Test that listeners get the current value and later changes."""
+    server, client = fake_server
+    values = []
+    client.start_listener(
+        "/live/song/get/tempo", lambda address, *args: values.append(args)
+    )
+    client.send("/live/song/start_listen/tempo")
+    Song(client).set_tempo(128.0)
+    deadline = time.monotonic() + 1.0
+    while len(values) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert values == [(120.0,), (128.0,)]
+
+
+def test_errors_are_reported(fake_server):
+    """Test that bad requests produce /live/error and no reply."""
+    server, client = fake_server
+    with pytest.raises(TimeoutError):
+        client.query("/live/track/get/name", 99, timeout=0.2)
+
+
+def test_latency():
+    """Test that replies are delayed by the configured latency."""
+    with FakeAbletonOSCServer(port=19985, reply_port=19984, latency=0.05):
+        client = AbletonOSCClient(send_port=19985, receive_port=19984)
+        try:
+            start = time.perf_counter()
+            client.query("/live/test")
+            assert time.perf_counter() - start >= 0.05
+        finally:
+            client.close()
+
+
+def test_loss():
+    """Test that a lossy server drops datagrams."""
+    with FakeAbletonOSCServer(
+        port=19983, reply_port=19982, loss=1.0, seed=1
+    ) as server:
+        client = AbletonOSCClient(send_port=19983, receive_port=19982)
+        try:
+            with pytest.raises(TimeoutError):
+                client.query("/live/test", timeout=0.2)
+            assert server.dropped >= 1
+            assert server.messages_received == 0
+        finally:
+            client.close()
@@ -0,0 +1,90 @@
+"""Tests for output meter streaming (no Ableton required)."""
+
+import pytest
+
+from abletonosc_client.fake_server import FakeClip
+from abletonosc_client.meters import MeterStream
+from abletonosc_client.metrics import ClientMetrics
+
+LEVEL = "/live/track/get/output_meter_level"
+
+
+def test_listen_mode_samples_per_frame(capture):
+    """Test frames taking the highest update since the previous frame."""
+    client = capture.client
+    with MeterStream(client, track_indices=(0, 2)) as meters:
+        assert capture.messages() == [
+            ("/live/track/start_listen/output_meter_level", (0,)),
+            ("/live/track/start_listen/output_meter_level", (2,)),
+        ]
+        client._handle_response(LEVEL, 2, 0.9)
+        client._handle_response(LEVEL, 2, 0.1)
+        client._handle_response(LEVEL, 1, 0.5)
+        frame = meters.frame()
+        assert frame.index == 0
+        assert list(frame.levels) == [0.0, pytest.approx(0.9)]
+        # No update since: the last value holds
+        assert meters.frame().levels[1] == pytest.approx(0.1)
+        assert meters.get_level(2) == pytest.approx(0.1)
+        with pytest.raises(KeyError):
+            meters.get_level(1)
+    assert [m[0] for m in capture.messages()] == [
+        "/live/track/stop_listen/output_meter_level"
+    ] * 2
+
+
+def test_peak_hold_and_fall(capture):
+    """Test that a peak is held for hold_frames, then falls by fall a frame."""
+    client = capture.client
+    meters = MeterStream(client, track_indices=(0,), hold_frames=2, fall=0.25)
+    meters.start()
+    client._handle_response(LEVEL, 0, 1.0)
+    meters.frame()
+    client._handle_response(LEVEL, 0, 0.0)
+    peaks = [meters.frame().peaks[0] for _ in range(6)]
+    assert peaks == [1.0, 1.0, 0.75, 0.5, 0.25, 0.0]
+    meters.close()
+
+
+def test_rms_over_ring_buffer(capture):
+    """Test the windowed RMS and history as the ring buffer wraps."""
+    client = capture.client
+    meters = MeterStream(client, track_indices=(0,), history=4)
+    meters.start()
+    client._handle_response(LEVEL, 0, 0.5)
+    rms = [meters.frame().rms[0] for _ in range(6)]
+    assert rms[0] == pytest.approx(0.25)
+    assert rms[3:] == [pytest.approx(0.5)] * 3
+    client._handle_response(LEVEL, 0, 0.0)
+    meters.frame()
+    meters.frame()
+    assert meters.get_history(0) == [0.5, 0.5, 0.0, 0.0]
+    assert meters.get_rms(0) == pytest.approx(0.5 / 2**0.5)
+    meters.close()
+
+
+def test_poll_mode_one_batch_per_frame(fake_server):
+    """Test that poll mode queries every meter of every track each frame."""
+    server, client = fake_server
+    server.live_set.song["is_playing"] = True
+    server.live_set.tracks[1].slots[0] = FakeClip(is_playing=True)
+    client.metrics = ClientMetrics()
+    with MeterStream(client, channels=("left", "right"), mode="poll") as meters:
+        assert meters.num_meters == 8
+        frame = meters.frame()
+        assert list(frame.levels) == pytest.approx([0, 0, 0.7, 0.7, 0, 0, 0, 0])
+        assert meters.get_peak(1, "right") == pytest.approx(0.7)
+    stats = client.metrics.as_dict()
+    assert stats["/live/track/get/output_meter_left"]["sent"] == 4
+    assert stats["/live/track/get/output_meter_right"]["sent"] == 4
+    client.metrics = None
+
+
+def test_invalid_options(capture):
+    """Test that unknown channels and modes are rejected."""
+    with pytest.raises(ValueError):
+        MeterStream(capture.client, channels=("center",))
+    with pytest.raises(ValueError):
+        MeterStream(capture.client, mode="push")
+    with pytest.raises(ValueError):
+        MeterStream(capture.client, history=0)
@@ -0,0 +1,123 @@
+"""Tests for client instrumentation (no Ableton required)."""
+
+import asyncio
+import random
+
+import pytest
+
+from abletonosc_client.async_client import AsyncAbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.encoding import message_size
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+from abletonosc_client.metrics import ClientMetrics, LatencyHistogram
+
+SEND_PORT = 19977
+RECEIVE_PORT = 19976
+
+
+def test_histogram_percentiles_are_accurate():
+    """Test that percentiles stay within the histogram's relative error."""
+    rng = random.Random(0)
+    samples = [rng.lognormvariate(-7, 1.5) for _ in range(10000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+    ordered = sorted(samples)
+    for quantile in (0.5, 0.9, 0.99):
+        exact = ordered[int(quantile * len(ordered)) - 1]
+        assert histogram.percentile(quantile) == pytest.approx(exact, rel=0.04, abs=2e-6)
+    assert histogram.count == len(samples)
+    assert histogram.max == max(samples)
+    assert histogram.mean == pytest.approx(sum(samples) / len(samples))
+
+
+def test_histogram_memory_is_fixed():
+    """Test that huge values are clamped instead of growing the histogram."""
+    histogram = LatencyHistogram(max_seconds=1.0)
+    size = len(histogram._counts)
+    histogram.record(1e6)
+    assert len(histogram._counts) == size
+    assert histogram.percentile(1.0) == 1e6
+
+
+def test_empty_histogram():
+    """Test statistics of a histogram with no samples."""
+    summary = LatencyHistogram().as_dict()
+    assert summary["count"] == 0
+    assert summary["p99"] == 0.0
+    assert summary["min"] == 0.0
+
+
+def test_client_records_per_address():
+    """Test sends, receives, latency and timeouts recorded by the client."""
+    events = []
+    metrics = ClientMetrics(callback=events.append)
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=RECEIVE_PORT):
+        client = AbletonOSCClient(
+            send_port=SEND_PORT, receive_port=RECEIVE_PORT, metrics=metrics
+        )
+        try:
+            for _ in range(3):
+                client.query("/live/song/get/tempo")
+            client.query_many([("/live/track/get/name", (t,)) for t in range(2)])
+            client.send("/live/song/set/tempo", 121.0)
+            with pytest.raises(TimeoutError):
+                client.query("/live/track/get/name", 99, timeout=0.1)
+        finally:
+            client.close()
+
+    data = metrics.as_dict()
+    tempo = data["/live/song/get/tempo"]
+    assert tempo["sent"] == 3
+    assert tempo["received"] == 3
+    assert tempo["sent_bytes"] == 3 * message_size("/live/song/get/tempo", ())
+    assert tempo["received_bytes"] == 3 * message_size("/live/song/get/tempo", (120.0,))
+    assert tempo["latency"]["count"] == 3
+    assert tempo["latency"]["p50"] > 0
+
+    names = data["/live/track/get/name"]
+    assert names["sent"] == 3
+    assert names["latency"]["count"] == 2
+    assert names["timeouts"] == 1
+    assert data["/live/song/set/tempo"]["sent"] == 1
+    assert "/live/error" in data
+
+    kinds = {event.kind for event in events}
+    assert kinds == {"send", "receive", "response", "timeout"}
+    assert metrics.top(1)[0][0] in ("/live/song/get/tempo", "/live/track/get/name")
+
+
+def test_prometheus_text():
+    """Test the Prometheus exposition format."""
+    metrics = ClientMetrics()
+    metrics.on_send('/live/"odd"', 12)
+    metrics.on_response("/live/song/get/tempo", 0.0)
+    text = metrics.prometheus_text()
+    assert "# TYPE abletonosc_messages_sent_total counter" in text
+    assert 'abletonosc_messages_sent_total{address="/live/\\"odd\\""} 1' in text
+    assert "# TYPE abletonosc_query_latency_seconds summary" in text
+    assert (
+        'abletonosc_query_latency_seconds{address="/live/song/get/tempo",quantile="0.99"}'
+        in text
+    )
+    assert 'abletonosc_query_latency_seconds_count{address="/live/song/get/tempo"} 1' in text
+    metrics.reset()
+    assert metrics.as_dict() == {}
+
+
+def test_async_client_records():
+    """Test that the async client records the same metrics."""
+    metrics = ClientMetrics()
+
+    async def run():
+        async with AsyncAbletonOSCClient(
+            send_port=SEND_PORT, receive_port=RECEIVE_PORT, metrics=metrics
+        ) as client:
+            await client.query("/live/song/get/tempo")
+            await client.query_many([("/live/track/get/name", (0,))])
+
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=RECEIVE_PORT):
+        asyncio.run(run())
+    data = metrics.as_dict()
+    assert data["/live/song/get/tempo"]["latency"]["count"] == 1
+    assert data["/live/track/get/name"]["received"] == 1
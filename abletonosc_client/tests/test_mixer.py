@@ -0,0 +1,72 @@
+"""Tests for the mixer mirror (no Ableton required)."""
+
+import pytest
+
+from abletonosc_client.metrics import ClientMetrics
+from abletonosc_client.mixer import MixerMirror
+from abletonosc_client.track import Track
+from abletonosc_client.waiting import wait_until
+
+
+def _sent(metrics: ClientMetrics) -> int:
+    return sum(stats["sent"] for stats in metrics.as_dict().values())
+
+
+def test_initial_state(fake_server):
+    """Test that start() reads every track's mixer values."""
+    server, client = fake_server
+    server.live_set.tracks[2].props["mute"] = True
+    server.live_set.tracks[1].sends[1] = 0.4
+    with MixerMirror(client, num_sends=2) as mixer:
+        assert mixer.num_tracks == 4
+        assert mixer.get_mute(2) and not mixer.get_mute(0)
+        assert mixer.get_volume(0) == pytest.approx(0.85)
+        assert mixer.get_send(1, 1) == pytest.approx(0.4)
+        assert mixer.get_track(1)["sends"] == [0.0, pytest.approx(0.4)]
+        with pytest.raises(IndexError):
+            mixer.get_send(0, 2)
+
+
+def test_reads_are_local_and_follow_changes(fake_server):
+    """Test that listener updates keep the mirror current without queries."""
+    server, client = fake_server
+    client.metrics = ClientMetrics()
+    with MixerMirror(client, num_sends=2) as mixer:
+        track = Track(client)
+        track.set_volume(3, 0.25)
+        track.set_solo(0, True)
+        track.set_send(2, 0, 0.75)
+        wait_until(lambda: mixer.get_send(2, 0), lambda v: v == pytest.approx(0.75))
+        wait_until(lambda: mixer.get_solo(0), bool)
+        assert mixer.get_volume(3) == pytest.approx(0.25)
+
+        sent = _sent(client.metrics)
+        for _ in range(1000):
+            mixer.get_volume(3)
+            mixer.get_mute(1)
+        assert _sent(client.metrics) == sent
+    client.metrics = None
+
+
+def test_resync_picks_up_new_tracks(fake_server):
+    """Test that resync() re-reads the set and listens to new tracks."""
+    server, client = fake_server
+    with MixerMirror(client) as mixer:
+        server.handle("/live/song/create_audio_track", (-1,))
+        mixer.resync()
+        assert mixer.num_tracks == 5
+        Track(client).set_panning(4, -0.5)
+        wait_until(lambda: mixer.get_panning(4), lambda v: v == pytest.approx(-0.5))
+
+
+def test_close_stops_listening(capture):
+    """Test that close() unsubscribes everything in one bundle."""
+    client = capture.client
+    mixer = MixerMirror(client, num_sends=1)
+    mixer.num_tracks = 8
+    mixer._subscribe()
+    capture.datagrams()
+    mixer.close()
+    messages = capture.messages()
+    assert len(messages) == 8 * 5
+    assert all("/stop_listen/" in address for address, _ in messages)
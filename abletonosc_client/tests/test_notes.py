@@ -0,0 +1,110 @@
+"""Tests for Note and NoteArray - no Ableton connection required."""
+
+import pytest
+
+from abletonosc_client import notes as notes_module
+from abletonosc_client.notes import Note, NoteArray
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test with and without NumPy acceleration."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(notes_module, "_np", None)
+    return request.param
+
+
+@pytest.fixture
+def chord():
+    return NoteArray.from_notes(
+        [
+            Note(60, 0.0, 1.0, 100),
+            Note(64, 0.1, 1.0, 90),
+            Note(67, 0.26, 1.0, 80, mute=True),
+        ]
+    )
+
+
+def test_roundtrip_notes(chord):
+    assert chord.to_notes() == [
+        Note(60, 0.0, 1.0, 100, False),
+        Note(64, 0.1, 1.0, 90, False),
+        Note(67, 0.26, 1.0, 80, True),
+    ]
+    assert len(chord) == 3
+    assert chord[2] == Note(67, 0.26, 1.0, 80, True)
+    assert list(chord[1:]) == chord.to_notes()[1:]
+
+
+def test_from_flat_matches_response_layout():
+    flat = (60, 0.0, 0.5, 100, False, 62, 0.5, 0.5, 90.0, True, 99)
+    notes = NoteArray.from_flat(flat)
+    assert notes.to_notes() == [Note(60, 0.0, 0.5, 100), Note(62, 0.5, 0.5, 90, True)]
+    assert notes.rows() == [(60, 0.0, 0.5, 100, 0), (62, 0.5, 0.5, 90, 1)]
+
+
+def test_mismatched_columns():
+    with pytest.raises(ValueError):
+        NoteArray([60, 62], [0.0], [1.0], [100])
+
+
+def test_transpose_clamps(backend, chord):
+    up = chord.transpose(12)
+    assert list(up.pitch) == [72, 76, 79]
+    assert list(chord.pitch) == [60, 64, 67]  # original untouched
+    assert list(chord.transpose(100).pitch) == [127, 127, 127]
+    assert list(chord.transpose(-64, low=0).pitch) == [0, 0, 3]
+
+
+def test_time_shift(backend, chord):
+    assert list(chord.time_shift(4.0).start_time) == pytest.approx([4.0, 4.1, 4.26])
+
+
+def test_quantize(backend, chord):
+    assert list(chord.quantize(0.25).start_time) == pytest.approx([0.0, 0.0, 0.25])
+    assert list(chord.quantize(0.25, strength=0.5).start_time) == pytest.approx(
+        [0.0, 0.05, 0.255]
+    )
+    with pytest.raises(ValueError):
+        chord.quantize(0)
+
+
+def test_humanize(backend, chord):
+    human = chord.humanize(timing=0.05, velocity=10, seed=1)
+    assert human == chord.humanize(timing=0.05, velocity=10, seed=1)
+    for before, after in zip(chord, human):
+        assert abs(after.start_time - before.start_time) <= 0.05 + 1e-9
+        assert after.start_time >= 0.0
+        assert abs(after.velocity - before.velocity) <= 10
+        assert after.pitch == before.pitch
+    assert chord.humanize() == chord
+
+
+def test_concatenate(chord):
+    both = NoteArray.concatenate([chord, chord.time_shift(1.0)])
+    assert len(both) == 6
+    assert both[3].start_time == 1.0
+
+
+def test_numpy_views(chord):
+    np = pytest.importorskip("numpy")
+    columns = chord.to_numpy()
+    columns["velocity"][:] = 64
+    assert list(chord.velocity) == [64, 64, 64]
+
+    rebuilt = NoteArray.from_numpy(
+        np.array([60, 61]), np.array([0.0, 1.0]), np.array([1.0, 1.0]), np.array([90, 91])
+    )
+    assert rebuilt.to_notes() == [Note(60, 0.0, 1.0, 90), Note(61, 1.0, 1.0, 91)]
+
+
+def test_add_notes_accepts_note_array(capture):
+    from abletonosc_client.clip import Clip
+
+    notes = NoteArray([60, 64], [0.0, 0.5], [1.0, 0.25], [100, 90], [0, 1])
+    assert Clip(capture.client).add_notes(0, 1, notes) == 2
+    assert capture.messages() == [
+        ("/live/clip/add/notes", (0, 1, 60, 0.0, 1.0, 100, 0, 64, 0.5, 0.25, 90, 1))
+    ]
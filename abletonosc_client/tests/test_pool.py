@@ -0,0 +1,110 @@
+"""Tests for the client pool (no Ableton required)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+from abletonosc_client.pool import ClientPool
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+
+SEND_PORT = 19964
+RECEIVE_PORT = 19960
+
+
+@pytest.fixture
+def server():
+    """A fake server that replies to each sender's own port."""
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=None) as server:
+        yield server
+
+
+def _pool(**options):
+    return ClientPool(send_port=SEND_PORT, receive_port=RECEIVE_PORT, **options)
+
+
+def test_round_robin(server):
+    """Test that queries rotate through the clients and get their answers."""
+    with _pool(size=4, strategy="round_robin") as pool:
+        track = Track(pool)
+        names = [track.get_name(t % 4) for t in range(8)]
+        assert names == ["1-MIDI", "2-MIDI", "3-Audio", "4-Audio"] * 2
+        assert pool.dispatched == [2, 2, 2, 2]
+
+
+def test_least_outstanding_under_concurrency(server):
+    """Test that concurrent queries spread over several clients."""
+    server.processing_time = 0.002
+    with _pool(size=4) as pool:
+        song = Song(pool)
+        with ThreadPoolExecutor(max_workers=8) as workers:
+            tempos = list(workers.map(lambda _: song.get_tempo(), range(32)))
+        assert tempos == [120.0] * 32
+        assert sum(pool.dispatched) == 32
+        assert sum(1 for count in pool.dispatched if count) > 1
+
+
+def test_query_many_is_sharded(server):
+    """Test that a batch is split across clients and reassembled in order."""
+    with _pool(size=3) as pool:
+        requests = [("/live/track/get/name", (t % 4,)) for t in range(12)]
+        results = pool.query_many(requests)
+        assert [r[0] for r in results] == [t % 4 for t in range(12)]
+        assert pool.dispatched == [1, 1, 1]
+
+
+def test_query_many_empty(server):
+    """Test that an empty batch returns nothing, like the client."""
+    with _pool(size=3) as pool:
+        assert pool.query_many([]) == []
+        assert pool.dispatched == [0, 0, 0]
+
+
+def test_fixed_reply_port_uses_first_client():
+    """Test that clients whose replies go elsewhere are never dispatched to."""
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=RECEIVE_PORT):
+        with _pool(size=3) as pool:
+            assert pool.healthy == [True, False, False]
+            requests = [("/live/track/get/name", (t,)) for t in range(4)]
+            assert [r[1] for r in pool.query_many(requests, timeout=1.0)] == [
+                "1-MIDI",
+                "2-MIDI",
+                "3-Audio",
+                "4-Audio",
+            ]
+            assert pool.dispatched == [1, 0, 0]
+
+
+def test_sends_and_wrappers_use_the_pool(server):
+    """Test writes through the pool, bundled and not."""
+    with _pool(size=2) as pool:
+        song = Song(pool)
+        song.set_tempo(130.0)
+        with pool.bundle():
+            Track(pool).set_name(0, "Drums")
+            assert Track(pool).get_name(0) == "Drums"
+        assert song.get_tempo() == 130.0
+
+
+def test_health_checks(server):
+    """Test that unhealthy clients are skipped and an empty pool fails."""
+    with _pool(size=2, strategy="round_robin") as pool:
+        assert pool.check_health() == [True, True]
+        pool.healthy = [False, True]
+        for _ in range(3):
+            pool.query("/live/test")
+        assert pool.dispatched == [0, 3]
+
+        server.close()
+        assert pool.check_health(timeout=0.1) == [False, False]
+        with pytest.raises(RuntimeError):
+            pool.query("/live/test")
+
+
+def test_invalid_arguments():
+    """Test that bad sizes and strategies are rejected."""
+    with pytest.raises(ValueError):
+        ClientPool(size=0)
+    with pytest.raises(ValueError):
+        ClientPool(size=1, strategy="random")
@@ -0,0 +1,108 @@
+"""Tests for outbound rate limiting (no Ableton required)."""
+
+import asyncio
+import time
+
+import pytest
+
+from abletonosc_client.async_client import AsyncAbletonOSCClient
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+from abletonosc_client.ratelimit import RateLimiter, TokenBucket, classify_address
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+
+ASYNC_SEND_PORT = 19959
+ASYNC_RECEIVE_PORT = 19958
+
+
+def test_classify_address():
+    """Test the default address classes."""
+    assert classify_address("/live/song/create_midi_track") == "structural"
+    assert classify_address("/live/song/delete_scene") == "structural"
+    assert classify_address("/live/clip_slot/duplicate_clip_to") == "structural"
+    assert classify_address("/live/browser/load_item") == "structural"
+    assert classify_address("/live/song/undo") == "structural"
+    assert classify_address("/live/track/set/volume") == "write"
+    assert classify_address("/live/device/set/parameter/value") == "write"
+    assert classify_address("/live/clip/add/notes") == "write"
+    assert classify_address("/live/clip_slot/fire") == "write"
+    assert classify_address("/live/song/get/tempo") == "read"
+    assert classify_address("/live/song/start_listen/beat") == "read"
+    assert classify_address("/live/browser/list_instruments") == "read"
+    assert classify_address("/live/test") == "read"
+
+
+def test_token_bucket_reservations():
+    """Test that a spent bucket hands out evenly spaced reservations."""
+    bucket = TokenBucket(rate=10.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+    assert TokenBucket(rate=None).reserve() == 0.0
+
+
+def test_invalid_budgets():
+    """Test that unknown classes and non-positive rates are rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter({"bulk": (10.0, 1)})
+    with pytest.raises(ValueError):
+        RateLimiter({"write": (0.0, 1)})
+
+
+def test_blocking_sends_are_paced(fake_server):
+    """Test that structural edits beyond the burst wait for their budget."""
+    server, client = fake_server
+    client.rate_limit = RateLimiter({"structural": (50.0, 1)})
+    song = Song(client)
+    start = time.monotonic()
+    for _ in range(10):
+        song.create_scene(-1)
+        song.set_tempo(125.0)
+    elapsed = time.monotonic() - start
+    # 9 waits of 20 ms; the writes stay within their budget
+    assert elapsed >= 0.17
+    stats = client.rate_limit.stats()
+    assert stats["throttled"]["structural"] == 9
+    assert stats["throttled"]["write"] == 0
+    assert song.get_num_scenes() == 18
+    client.rate_limit = None
+
+
+def test_bundled_sends_are_paced(fake_server):
+    """Test that messages are limited one by one inside a bundle."""
+    server, client = fake_server
+    client.rate_limit = RateLimiter({"write": (100.0, 1)})
+    start = time.monotonic()
+    with client.bundle():
+        for t in range(5):
+            Track(client).set_name(t % 4, f"T{t}")
+    assert time.monotonic() - start >= 0.035
+    assert Track(client).get_name(0) == "T4"
+    client.rate_limit = None
+
+
+def test_async_client_queues_sends_in_order():
+    """Test that async sends never block and reach the server in order."""
+
+    async def main():
+        with FakeAbletonOSCServer(
+            port=ASYNC_SEND_PORT, reply_port=ASYNC_RECEIVE_PORT
+        ) as server:
+            limiter = RateLimiter({"write": (100.0, 1)})
+            async with AsyncAbletonOSCClient(
+                send_port=ASYNC_SEND_PORT,
+                receive_port=ASYNC_RECEIVE_PORT,
+                rate_limit=limiter,
+            ) as client:
+                start = time.monotonic()
+                for tempo in range(100, 106):
+                    client.send("/live/song/set/tempo", float(tempo))
+                # send() returned at once; the writes are queued
+                assert time.monotonic() - start < 0.02
+                # The query goes out after every queued write
+                assert await client.query("/live/song/get/tempo") == (105.0,)
+                assert time.monotonic() - start >= 0.045
+                assert server.live_set.song["tempo"] == 105.0
+
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""Tests for query retries (no Ableton required)."""
+
+import asyncio
+import socket
+import time
+
+import pytest
+
+from abletonosc_client.async_client import AsyncAbletonOSCClient
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.fake_server import FakeAbletonOSCServer
+from abletonosc_client.retry import RetryPolicy
+
+SEND_PORT = 19981
+RECEIVE_PORT = 19980
+
+
+@pytest.fixture
+def silent():
+    """A client whose queries go to a socket that never answers."""
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", SEND_PORT))
+    sink.settimeout(0.05)
+    policy = RetryPolicy(attempts=3, initial_timeout=0.02, jitter=0.0)
+    client = AbletonOSCClient(
+        send_port=SEND_PORT, receive_port=RECEIVE_PORT, retry=policy
+    )
+
+    def received():
+        count = 0
+        while True:
+            try:
+                sink.recv(65536)
+            except socket.timeout:
+                return count
+            count += 1
+
+    yield client, received
+    client.close()
+    sink.close()
+
+
+def test_waits_back_off_exponentially():
+    """Test the wait schedule, its cap and its jitter bounds."""
+    policy = RetryPolicy(attempts=5, initial_timeout=0.1, max_timeout=0.5, jitter=0.0)
+    assert list(policy.waits()) == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+    policy = RetryPolicy(attempts=50, initial_timeout=0.1, max_timeout=0.1, jitter=0.2)
+    assert all(0.08 <= w <= 0.12 for w in policy.waits())
+    assert list(RetryPolicy(attempts=1).waits()) == []
+
+
+def test_invalid_policy():
+    """Test that nonsensical settings are rejected."""
+    with pytest.raises(ValueError):
+        RetryPolicy(attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=1.5)
+
+
+def test_only_idempotent_addresses_are_retried():
+    """Test which addresses may be resent."""
+    policy = RetryPolicy()
+    assert policy.should_retry("/live/track/get/name")
+    assert policy.should_retry("/live/test")
+    assert not policy.should_retry("/live/track/insert_device")
+    assert not policy.should_retry("/live/clip_slot/create_clip")
+
+
+def test_get_queries_are_resent(silent):
+    """Test that an unanswered get is sent once per attempt, then fails."""
+    client, received = silent
+    with pytest.raises(TimeoutError):
+        client.query("/live/song/get/tempo", timeout=0.3)
+    assert received() == 3
+    assert client.retry.stats() == {"retries": 2, "recovered": 0, "failures": 1}
+
+
+def test_other_queries_are_sent_once(silent):
+    """Test that non-idempotent queries are never resent."""
+    client, received = silent
+    with pytest.raises(TimeoutError):
+        client.query("/live/track/insert_device", 0, "Reverb", timeout=0.3)
+    assert received() == 1
+    assert client.retry.stats()["retries"] == 0
+
+
+def test_late_answers_to_resent_queries_are_dropped(silent):
+    """Test that answers arriving after a resent query is done are discarded."""
+    client, received = silent
+    updates = []
+    client.start_listener(
+        "/live/song/get/tempo", lambda address, *args: updates.append(args)
+    )
+    with pytest.raises(TimeoutError):
+        client.query("/live/song/get/tempo", timeout=0.3)
+    assert received() == 3
+    # One late answer per unanswered send is dropped; later messages are updates
+    for tempo in (120.0, 120.0, 120.0, 128.0):
+        client._handle_response("/live/song/get/tempo", tempo)
+    assert updates == [(128.0,)]
+
+
+def test_client_deadline_caps_timeout(silent):
+    """Test that the policy's deadline bounds a long per-call timeout."""
+    client, _ = silent
+    client.retry.deadline = 0.1
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.query("/live/song/get/tempo", timeout=5.0)
+    assert time.monotonic() - start < 1.0
+
+
+def test_queries_survive_packet_loss():
+    """Test that retried queries succeed against a lossy server."""
+    policy = RetryPolicy(attempts=10, initial_timeout=0.02, max_timeout=0.05, seed=1)
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=RECEIVE_PORT, loss=0.3, seed=2):
+        client = AbletonOSCClient(
+            send_port=SEND_PORT, receive_port=RECEIVE_PORT, retry=policy
+        )
+        try:
+            for _ in range(20):
+                assert client.query("/live/song/get/tempo") == (120.0,)
+            requests = [("/live/track/get/name", (t,)) for t in range(4)] * 5
+            results = client.query_many(requests)
+            assert [r[1] for r in results[:4]] == ["1-MIDI", "2-MIDI", "3-Audio", "4-Audio"]
+        finally:
+            client.close()
+    assert policy.retries > 0
+    assert policy.recovered > 0
+    assert policy.failures == 0
+
+
+def test_async_queries_survive_packet_loss():
+    """Test that the async client retries too."""
+    policy = RetryPolicy(attempts=10, initial_timeout=0.02, max_timeout=0.05, seed=1)
+
+    async def run():
+        async with AsyncAbletonOSCClient(
+            send_port=SEND_PORT, receive_port=RECEIVE_PORT, retry=policy
+        ) as client:
+            for _ in range(20):
+                assert await client.query("/live/song/get/tempo") == (120.0,)
+            results = await client.query_many(
+                [("/live/track/get/name", (t,)) for t in range(4)]
+            )
+            assert [r[1] for r in results] == ["1-MIDI", "2-MIDI", "3-Audio", "4-Audio"]
+
+    with FakeAbletonOSCServer(port=SEND_PORT, reply_port=RECEIVE_PORT, loss=0.3, seed=3):
+        asyncio.run(run())
+    assert policy.recovered > 0
+    assert policy.failures == 0
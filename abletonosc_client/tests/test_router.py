@@ -0,0 +1,135 @@
+"""Tests for the listener router (no Ableton required)."""
+
+import threading
+
+import pytest
+
+from abletonosc_client.clip import Clip
+from abletonosc_client.device import Device
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+
+
+def test_start_and_stop_listen_are_refcounted(capture):
+    """Test that AbletonOSC is told once per (address, indices)."""
+    router = capture.client.router
+    first = router.subscribe("/live/track/get/volume", (0,), print)
+    second = router.subscribe("/live/track/get/volume", (0,), repr)
+    other = router.subscribe("/live/track/get/volume", (1,), print)
+    assert router.subscriber_count("/live/track/get/volume", (0,)) == 2
+    router.unsubscribe(first)
+    assert capture.messages() == [
+        ("/live/track/start_listen/volume", (0,)),
+        ("/live/track/start_listen/volume", (1,)),
+    ]
+
+    router.unsubscribe_many([second, other])
+    router.unsubscribe(second)
+    # Both stops go out in one bundle
+    datagrams = capture.datagrams()
+    assert len(datagrams) == 1
+    assert capture.messages_from(datagrams) == [
+        ("/live/track/stop_listen/volume", (0,)),
+        ("/live/track/stop_listen/volume", (1,)),
+    ]
+    assert "/live/track/get/volume" not in capture.client._listeners
+
+
+def test_dispatch_by_indices(capture):
+    """Test that updates reach only the subscribers of their object."""
+    client = capture.client
+    received = []
+    client.router.subscribe(
+        "/live/device/get/parameter/value", (0, 1, 2), lambda *a: received.append(a)
+    )
+    client._handle_response("/live/device/get/parameter/value", 0, 1, 2, 0.5)
+    client._handle_response("/live/device/get/parameter/value", 0, 1, 3, 0.7)
+    client._handle_response("/live/device/get/parameter/value", 1, 1, 2, 0.9)
+    assert received == [(0, 1, 2, 0.5)]
+
+
+def test_wrappers_share_properties(capture):
+    """Test that two wrappers on one client both receive updates."""
+    client = capture.client
+    first, second = [], []
+    Track(client).on_volume_change(0, lambda t, v: first.append((t, v)))
+    other = Track(client)
+    other.on_volume_change(0, lambda t, v: second.append((t, v)))
+    client._handle_response("/live/track/get/volume", 0, 0.5)
+    assert first == [(0, 0.5)] and second == [(0, 0.5)]
+
+    other.stop_volume_listener(0)
+    client._handle_response("/live/track/get/volume", 0, 0.25)
+    assert first == [(0, 0.5), (0, 0.25)] and second == [(0, 0.5)]
+    assert [m[0] for m in capture.messages()] == ["/live/track/start_listen/volume"]
+
+
+def test_raising_subscriber_does_not_block_others(capture, caplog):
+    """Test that one failing callback doesn't stop the update for the rest."""
+    client = capture.client
+    received = []
+
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    client.router.subscribe("/live/track/get/volume", (0,), fail)
+    client.router.subscribe(
+        "/live/track/get/volume", (0,), lambda *args: received.append(args)
+    )
+    client._handle_response("/live/track/get/volume", 0, 0.5)
+    assert received == [(0, 0.5)]
+    [record] = caplog.records
+    assert record.name == "abletonosc_client.router"
+    assert record.exc_info[0] is RuntimeError
+
+
+def test_adapters_ignore_extra_arguments(capture):
+    """Test wrapper listeners with updates carrying trailing arguments."""
+    client = capture.client
+    calls = []
+    Track(client).on_volume_change(0, lambda t, v: calls.append((t, v)))
+    Clip(client).on_playing_position_change(0, 1, lambda t, c, p: calls.append(p))
+    client._handle_response("/live/track/get/volume", 0, 0.5, "extra")
+    client._handle_response("/live/clip/get/playing_position", 0, 1, 2.0, "extra")
+    assert calls == [(0, 0.5), 2.0]
+
+
+def test_reregistering_replaces_own_callback(capture):
+    """Test that a wrapper's second on_* call replaces its first callback."""
+    client = capture.client
+    song = Song(client)
+    calls = []
+    song.on_tempo_change(lambda tempo: calls.append(("old", tempo)))
+    song.on_tempo_change(lambda tempo: calls.append(("new", tempo)))
+    client._handle_response("/live/song/get/tempo", 128.0)
+    assert calls == [("new", 128.0)]
+    assert capture.messages() == [("/live/song/start_listen/tempo", ())]
+
+
+def test_invalid_subscriptions(capture):
+    """Test that non-property addresses and wrong index counts are rejected."""
+    router = capture.client.router
+    with pytest.raises(ValueError):
+        router.subscribe("/live/song/create_scene", (), print)
+    with pytest.raises(ValueError):
+        router.subscribe("/live/clip/get/playing_position", (0,), print)
+
+
+def test_listener_updates_from_server(fake_server):
+    """Test parameter listeners end to end through the fake server."""
+    _, client = fake_server
+    received = threading.Event()
+    values = []
+
+    def on_value(t, d, p, value):
+        values.append((t, d, p, value))
+        if value == 0.75:
+            received.set()
+
+    device = Device(client)
+    device.on_parameter_value_change(0, 0, 1, on_value)
+    device.set_parameter_value(0, 0, 1, 0.75)
+    assert received.wait(1.0)
+    # The current value on start_listen, then the change
+    assert values == [(0, 0, 1, 0.5), (0, 0, 1, 0.75)]
+    device.stop_parameter_value_listener(0, 0, 1)
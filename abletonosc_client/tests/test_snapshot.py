@@ -0,0 +1,137 @@
+"""Tests for session snapshots."""
+
+import dataclasses
+
+import pytest
+
+from abletonosc_client.device import Parameter
+from abletonosc_client.notes import Note
+from abletonosc_client.snapshot import (
+    ClipSnapshot,
+    SessionSnapshot,
+    take_snapshot,
+)
+
+
+class _SetClient:
+    """Answers query_many from a small in-memory set, counting calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.queries = []
+
+    def query_many(self, requests, timeout=2.0):
+        self.calls += 1
+        requests = list(requests)
+        self.queries.extend(requests)
+        return [self._answer(address, args) for address, args in requests]
+
+    def _answer(self, address, args):
+        song = {
+            "/live/song/get/tempo": (120.0,),
+            "/live/song/get/signature_numerator": (4,),
+            "/live/song/get/signature_denominator": (4,),
+            "/live/song/get/num_tracks": (2,),
+            "/live/song/get/num_scenes": (2,),
+        }
+        if address in song:
+            return song[address]
+        t = args[0]
+        track = {
+            "name": (f"Track {t}",),
+            "volume": (0.85,),
+            "panning": (0.0,),
+            "mute": (t,),
+            "solo": (0,),
+            "color": (100 + t,),
+            "has_midi_input": (int(t == 0),),
+            "clips/name": ("Intro", None),
+            "clips/length": (4.0, None),
+            "clips/color": (7, None),
+            "devices/name": ("Drift",) if t == 0 else (),
+            "devices/class_name": ("Drift",) if t == 0 else (),
+            "devices/type": (1,) if t == 0 else (),
+        }
+        prop = address.split("/get/", 1)[1]
+        if address.startswith("/live/track/"):
+            return (t, *track[prop])
+        if address.startswith("/live/scene/"):
+            return (t, f"Scene {t}") if prop == "name" else (t, 0)
+        if address.startswith("/live/device/"):
+            columns = {
+                "parameters/name": ("Device On", "Cutoff"),
+                "parameters/value": (1.0, 0.25),
+                "parameters/min": (0.0, 0.0),
+                "parameters/max": (1.0, 1.0),
+            }
+            return (*args, *columns[prop])
+        if address == "/live/clip/get/notes":
+            return (*args, 60, 0.0, 1.0, 100, 0, 64, 1.0, 1.0, 90, 1)
+        raise AssertionError(f"Unexpected query {address}")
+
+
+def test_snapshot_tree():
+    """Test that the snapshot tree reflects the set."""
+    client = _SetClient()
+    snapshot = take_snapshot(client, notes=True)
+
+    assert snapshot.tempo == 120.0
+    assert [t.name for t in snapshot.tracks] == ["Track 0", "Track 1"]
+    assert [s.name for s in snapshot.scenes] == ["Scene 0", "Scene 1"]
+    assert snapshot.tracks[1].mute is True
+
+    # Only occupied slots become clips; notes only for MIDI tracks
+    assert snapshot.tracks[0].clips == (
+        ClipSnapshot(
+            index=0,
+            name="Intro",
+            length=4.0,
+            color=7,
+            notes=(Note(60, 0.0, 1.0, 100, False), Note(64, 1.0, 1.0, 90, True)),
+        ),
+    )
+    assert snapshot.tracks[1].clips[0].notes is None
+
+    device = snapshot.tracks[0].devices[0]
+    assert device.class_name == "Drift"
+    assert device.parameters[1] == Parameter(1, "Cutoff", 0.25, 0.0, 1.0)
+    assert snapshot.tracks[1].devices == ()
+
+
+def test_snapshot_is_pipelined_per_stage():
+    """Test that each stage is one query_many and timings are recorded."""
+    client = _SetClient()
+    snapshot = take_snapshot(client, notes=True)
+    assert client.calls == 5
+    assert set(snapshot.timings) == {
+        "song", "tracks", "scenes", "parameters", "notes", "total",
+    }
+    assert snapshot.num_queries == len(client.queries)
+
+
+def test_snapshot_batches_large_stages():
+    """Test that large stages are split into windows of batch_size queries."""
+    client = _SetClient()
+    take_snapshot(client, parameters=False, batch_size=5)
+    # song (5) + tracks (2 x 13 in windows of 5) + scenes (4)
+    assert client.calls == 1 + 6 + 1
+
+
+def test_snapshot_is_immutable_and_comparable():
+    """Test that snapshots are frozen and equal regardless of timings."""
+    first = take_snapshot(_SetClient())
+    second = take_snapshot(_SetClient())
+    assert first == second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.tempo = 90.0
+    with pytest.raises(TypeError):
+        first.timings["total"] = 0.0
+    assert not hasattr(first, "__dict__")
+
+
+def test_song_snapshot(song):
+    """Test taking a snapshot of the live set."""
+    snapshot = song.snapshot()
+    assert isinstance(snapshot, SessionSnapshot)
+    assert len(snapshot.tracks) == song.get_num_tracks()
+    assert snapshot.tempo == song.get_tempo()
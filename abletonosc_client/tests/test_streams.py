@@ -0,0 +1,139 @@
+"""Tests for bounded listener event queues (no Ableton required)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from abletonosc_client.song import Song
+from abletonosc_client.streams import EventQueue, EventQueueClosed
+from abletonosc_client.track import Track
+
+
+def test_drop_oldest():
+    """Test that a full queue discards its oldest updates."""
+    queue = EventQueue(maxsize=3)
+    for i in range(5):
+        queue(0, i)
+    queue.close()
+    assert list(queue) == [(0, 2), (0, 3), (0, 4)]
+    assert queue.dropped == 2
+
+
+def test_coalesce_latest_per_key():
+    """Test that updates for a queued key replace it in place."""
+    queue = EventQueue(maxsize=2, overflow="coalesce")
+    queue(0, 0.1)
+    queue(1, 0.5)
+    queue(0, 0.2)
+    queue(0, 0.3)
+    assert queue.get(timeout=0) == (0, 0.3)
+    queue(2, 0.9)
+    queue(3, 0.7)
+    queue.close()
+    assert list(queue) == [(2, 0.9), (3, 0.7)]
+    assert queue.coalesced == 2
+    assert queue.dropped == 1
+
+
+def test_block_waits_for_room():
+    """Test that a blocking put resumes once the consumer takes an update."""
+    queue = EventQueue(maxsize=1, overflow="block")
+    queue(1)
+    producer = threading.Thread(target=queue, args=(2,))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()
+    assert queue.get(timeout=1.0) == (1,)
+    producer.join(timeout=1.0)
+    assert not producer.is_alive()
+    assert queue.get(timeout=1.0) == (2,)
+    assert queue.dropped == 0
+
+
+def test_get_timeout_and_close():
+    """Test get() timing out, then ending once the queue is closed."""
+    queue = EventQueue()
+    with pytest.raises(TimeoutError):
+        queue.get(timeout=0.01)
+    closed = []
+    queue = EventQueue(on_close=lambda: closed.append(True))
+    queue.close()
+    queue.close()
+    queue(1)
+    with pytest.raises(EventQueueClosed):
+        queue.get()
+    assert closed == [True]
+
+
+def test_invalid_options():
+    """Test that bad sizes and overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        EventQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        EventQueue(overflow="drop_newest")
+
+
+def test_async_iteration_from_another_thread():
+    """Test async iteration over updates put from a receive thread."""
+
+    async def main():
+        queue = EventQueue()
+
+        def produce():
+            for i in range(3):
+                time.sleep(0.01)
+                queue(i)
+            queue.close()
+
+        threading.Thread(target=produce).start()
+        return [item async for item in queue]
+
+    assert asyncio.run(main()) == [(0,), (1,), (2,)]
+
+
+def test_cancelled_async_get_loses_nothing():
+    """Test that a cancelled get_async() doesn't consume an update."""
+
+    async def main():
+        queue = EventQueue()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.get_async(), 0.01)
+        queue(7)
+        return await asyncio.wait_for(queue.get_async(), 1.0)
+
+    assert asyncio.run(main()) == (7,)
+
+
+def test_slow_consumer_does_not_stall_queries(fake_server):
+    """Test a wrapper listener feeding a queue while queries keep flowing."""
+    _, client = fake_server
+    track = Track(client)
+    with EventQueue(maxsize=4, overflow="coalesce") as volumes:
+        track.on_volume_change(0, volumes)
+        track.on_volume_change(1, volumes)
+        for value in (0.1, 0.2, 0.3):
+            track.set_volume(0, value)
+        track.set_volume(1, 0.6)
+        # Nobody consumes yet, and queries still answer
+        assert Song(client).get_tempo() == 120.0
+        time.sleep(0.1)
+        updates = dict(volumes.get(timeout=1.0) for _ in range(2))
+        assert updates == {0: pytest.approx(0.3), 1: pytest.approx(0.6)}
+        assert volumes.coalesced >= 3
+
+
+def test_router_stream_unsubscribes_on_close(capture):
+    """Test that closing a router stream stops the subscription."""
+    client = capture.client
+    stream = client.router.stream("/live/song/get/beat", maxsize=8)
+    client._handle_response("/live/song/get/beat", 1)
+    client._handle_response("/live/song/get/beat", 2)
+    stream.close()
+    assert list(stream) == [(1,), (2,)]
+    assert client.router.subscriber_count("/live/song/get/beat") == 0
+    assert [m[0] for m in capture.messages()] == [
+        "/live/song/start_listen/beat",
+        "/live/song/stop_listen/beat",
+    ]
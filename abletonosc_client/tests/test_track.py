@@ -631,6 +631,49 @@ def test_multiple_track_listeners(track):
             track.set_volume(1, original_1)
 
 
+def test_subscribe_many(track):
+    """Test bulk subscription to several properties of several tracks."""
+    updates = []
+    received = threading.Event()
+
+    def callback(track_idx, prop, value):
+        updates.append((track_idx, prop, value))
+        if (track_idx, prop) == (1, "mute") and value:
+            received.set()
+
+    original_mute = track.get_mute(1)
+    subscriptions = track.subscribe_many(("volume", "mute"), (0, 1), callback)
+    try:
+        assert len(subscriptions) == 4
+        track.set_mute(1, True)
+        assert received.wait(timeout=2.0), "Mute callback not triggered"
+        assert (1, "mute", True) in updates
+        assert all(isinstance(v, float) for _, p, v in updates if p == "volume")
+    finally:
+        track.unsubscribe_many(subscriptions)
+        track.set_mute(1, original_mute)
+
+
+def test_subscribe_many_bundles_start_listen(capture):
+    """Test that bulk subscription sends its start_listens bundled."""
+    from abletonosc_client.track import Track
+
+    track = Track(capture.client)
+    subscriptions = track.subscribe_many(
+        ("volume", "mute", "solo", "arm"), range(16), print
+    )
+    datagrams = capture.datagrams()
+    messages = capture.messages_from(datagrams)
+    assert len(messages) == 64
+    assert len(datagrams) < 8
+    assert messages[:2] == [
+        ("/live/track/start_listen/volume", (0,)),
+        ("/live/track/start_listen/mute", (0,)),
+    ]
+    track.unsubscribe_many(subscriptions)
+    assert len(capture.messages()) == 64
+
+
 # New endpoint tests (Gap Coverage)
 
 
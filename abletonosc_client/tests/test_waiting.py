@@ -0,0 +1,83 @@
+"""Tests for waiting on fire-and-forget commands (no Ableton required)."""
+
+import time
+
+import pytest
+
+from abletonosc_client.clip_slot import ClipSlot
+from abletonosc_client.song import Song
+from abletonosc_client.track import Track
+from abletonosc_client.waiting import wait_until
+
+
+def test_wait_until_backs_off():
+    """Test that polls start immediately and then back off geometrically."""
+    polls = []
+
+    def probe():
+        polls.append(time.monotonic())
+        return len(polls)
+
+    assert wait_until(probe, lambda n: n >= 6, interval=0.002, max_interval=0.008) == 6
+    gaps = [b - a for a, b in zip(polls, polls[1:])]
+    assert gaps[0] >= 0.002
+    assert gaps[-1] >= 0.008
+    assert wait_until(lambda: 1, bool) == 1
+
+
+def test_wait_until_times_out():
+    """Test that an unmet condition raises TimeoutError after the deadline."""
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="new track"):
+        wait_until(lambda: 0, bool, timeout=0.05, description="new track")
+    assert time.monotonic() - start < 0.5
+
+
+def test_barrier(fake_server):
+    """Test that a barrier returns once earlier sends are applied."""
+    server, client = fake_server
+    with client.bundle():
+        Track(client).set_name(0, "Drums")
+        client.barrier()
+        assert server.live_set.tracks[0].props["name"] == "Drums"
+
+
+def test_create_tracks_and_scenes_and_wait(fake_server):
+    """Test that the *_and_wait helpers return the new index."""
+    server, client = fake_server
+    song = Song(client)
+    assert song.create_midi_track_and_wait() == 4
+    assert song.create_audio_track_and_wait(0) == 0
+    assert song.create_scene_and_wait() == 8
+    assert song.get_num_tracks() == 6
+    assert len(server.live_set.scenes) == 9
+
+
+def test_create_clip_and_wait(fake_server):
+    """Test that create_clip_and_wait returns once the slot has the clip."""
+    _, client = fake_server
+    slots = ClipSlot(client)
+    slots.create_clip_and_wait(0, 3, 8.0)
+    assert slots.has_clip(0, 3)
+
+
+def test_insert_device_and_wait(fake_server):
+    """Test that insert_device_and_wait returns the new device's index."""
+    _, client = fake_server
+    track = Track(client)
+    assert track.insert_device_and_wait(1, "Reverb") == 0
+    assert track.get_device_names(1) == ("Reverb",)
+    assert track.insert_device_and_wait(1, "No Such Device") == -1
+
+
+def test_and_wait_times_out(fake_server, monkeypatch):
+    """Test that a change Live never applies raises TimeoutError."""
+    server, client = fake_server
+    handle = server.handle
+    monkeypatch.setattr(
+        server,
+        "handle",
+        lambda address, args: [] if "create" in address else handle(address, args),
+    )
+    with pytest.raises(TimeoutError, match="new scene"):
+        Song(client).create_scene_and_wait(timeout=0.1)
@@ -3,9 +3,25 @@
 Covers /live/track/* endpoints for individual track control.
 """
 
-from typing import Callable
+from typing import Any, Callable, Iterable
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
+from abletonosc_client.waiting import wait_until
+
+# Value types of listenable properties, for converting updates; other
+# properties are passed through as received
+_LISTENER_TYPES: dict[str, Callable] = {
+    "volume": float,
+    "panning": float,
+    "mute": bool,
+    "solo": bool,
+    "arm": bool,
+    "name": str,
+    "output_meter_level": float,
+    "output_meter_left": float,
+    "output_meter_right": float,
+}
 
 
 class Track:
@@ -13,10 +29,8 @@ class Track:
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
-        # Track listener callbacks: {"property": {track_index: callback}}
-        self._track_callbacks: dict[str, dict[int, Callable]] = {}
-        # Set of properties with dispatchers registered
-        self._dispatcher_registered: set[str] = set()
+        # Listener subscriptions: {("property", track_index): subscription}
+        self._subscriptions: dict[tuple[str, int], Subscription] = {}
 
     # Name
 
@@ -291,6 +305,41 @@ class Track:
         # Response format: (track_index, device_index)
         return int(result[1]) if len(result) > 1 else -1
 
+    def insert_device_and_wait(
+        self,
+        track_index: int,
+        device_name: str,
+        device_index: int = -1,
+        timeout: float = 5.0,
+    ) -> int:
+        """Insert a device and wait until it shows up in the track's chain.
+
+        Loading from the browser can complete after insert_device answers;
+        this polls the track's device count until the device is there.
+
+        Args:
+            track_index: Track index (0-based)
+            device_name: Name of the device to load (e.g., "Wavetable", "Reverb")
+            device_index: Position to insert device (-1 = end of chain)
+            timeout: How long to wait for the device in seconds
+
+        Returns:
+            Index of newly inserted device, or -1 if device not found
+
+        Raises:
+            TimeoutError: If the device count does not grow within timeout
+        """
+        before = self.get_num_devices(track_index)
+        index = self.insert_device(track_index, device_name, device_index)
+        if index >= 0:
+            wait_until(
+                lambda: self.get_num_devices(track_index),
+                lambda n: n > before,
+                timeout=timeout,
+                description=f"{device_name} on track {track_index}",
+            )
+        return index
+
     def get_device_names(self, track_index: int) -> tuple:
         """Get names of all devices on a track.
 
@@ -783,27 +832,6 @@ class Track:
 
     # Listener infrastructure
 
-    def _make_dispatcher(self, prop: str, converter: Callable) -> Callable:
-        """Create a dispatcher that routes callbacks by track index.
-
-        Args:
-            prop: Property name (e.g., "volume")
-            converter: Function to convert the value (e.g., float, bool)
-
-        Returns:
-            Dispatcher function for the OSC callback
-        """
-
-        def dispatcher(addr, *args):
-            # Response format: (track_index, value)
-            track_index = int(args[0])
-            value = converter(args[1])
-            if prop in self._track_callbacks:
-                if track_index in self._track_callbacks[prop]:
-                    self._track_callbacks[prop][track_index](track_index, value)
-
-        return dispatcher
-
     def _start_track_listener(
         self, track_index: int, prop: str, callback: Callable, converter: Callable
     ) -> None:
@@ -815,23 +843,19 @@ class Track:
             callback: Function(track_index, value) to call on change
             converter: Function to convert the value
         """
-        # Initialize callback dict for this property if needed
-        if prop not in self._track_callbacks:
-            self._track_callbacks[prop] = {}
-
-        # Register callback for this track
-        self._track_callbacks[prop][track_index] = callback
-
-        # Register dispatcher if not already done for this property
-        if prop not in self._dispatcher_registered:
-            response_addr = f"/live/track/get/{prop}"
-            self._client.start_listener(
-                response_addr, self._make_dispatcher(prop, converter)
-            )
-            self._dispatcher_registered.add(prop)
-
-        # Tell AbletonOSC to start sending updates for this track
-        self._client.send(f"/live/track/start_listen/{prop}", track_index)
+        router = self._client.router
+        # Response format: (track_index, value)
+        subscription = router.subscribe(
+            f"/live/track/get/{prop}",
+            (track_index,),
+            lambda index, value, *_: callback(int(index), converter(value)),
+        )
+        # Replace this wrapper's previous callback (after subscribing, so
+        # AbletonOSC isn't told to stop and restart)
+        previous = self._subscriptions.get((prop, track_index))
+        self._subscriptions[(prop, track_index)] = subscription
+        if previous is not None:
+            router.unsubscribe(previous)
 
     def _stop_track_listener(self, track_index: int, prop: str) -> None:
         """Stop a listener for a track property.
@@ -840,18 +864,10 @@ class Track:
             track_index: Track index (0-based)
             prop: Property name
         """
-        # Tell AbletonOSC to stop sending updates for this track
-        self._client.send(f"/live/track/stop_listen/{prop}", track_index)
-
-        # Remove callback
-        if prop in self._track_callbacks:
-            self._track_callbacks[prop].pop(track_index, None)
-
-            # If no more callbacks for this property, unregister dispatcher
-            if not self._track_callbacks[prop]:
-                response_addr = f"/live/track/get/{prop}"
-                self._client.stop_listener(response_addr)
-                self._dispatcher_registered.discard(prop)
+        # AbletonOSC stops sending updates once no subscriber is left
+        subscription = self._subscriptions.pop((prop, track_index), None)
+        if subscription is not None:
+            self._client.router.unsubscribe(subscription)
 
     # Track Listeners
 
@@ -968,3 +984,52 @@ class Track:
             track_index: Track index (0-based)
         """
         self._stop_track_listener(track_index, "name")
+
+    # Bulk listeners
+
+    def subscribe_many(
+        self,
+        props: Iterable[str],
+        track_indices: Iterable[int],
+        callback: Callable[[int, str, Any], None],
+    ) -> list[Subscription]:
+        """Listen to several properties of several tracks with one callback.
+
+        Registers every (property, track) pair in one pass and sends the
+        start_listen messages bundled, e.g. to monitor a whole mixer:
+
+            subs = track.subscribe_many(
+                ("volume", "mute", "solo", "arm"), range(64), on_change
+            )
+
+        These subscriptions are independent of the on_* listeners.
+
+        Args:
+            props: Property names (e.g., "volume", "mute", "output_meter_level")
+            track_indices: Track indices (0-based)
+            callback: Function(track_index, prop, value) called on each change
+
+        Returns:
+            Subscriptions, for unsubscribe_many()
+        """
+        props = list(props)
+        requests = []
+        for track_index in track_indices:
+            for prop in props:
+                convert = _LISTENER_TYPES.get(prop)
+
+                def handler(index, value, *_, prop=prop, convert=convert):
+                    callback(
+                        int(index), prop, value if convert is None else convert(value)
+                    )
+
+                requests.append((f"/live/track/get/{prop}", (track_index,), handler))
+        return self._client.router.subscribe_many(requests)
+
+    def unsubscribe_many(self, subscriptions: Iterable[Subscription]) -> None:
+        """Stop subscriptions made by subscribe_many(), bundling the stops.
+
+        Args:
+            subscriptions: Subscriptions returned by subscribe_many()
+        """
+        self._client.router.unsubscribe_many(subscriptions)
@@ -6,6 +6,7 @@ Covers /live/view/* endpoints for navigation and selection.
 from typing import Callable
 
 from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.router import Subscription
 
 
 class View:
@@ -13,6 +14,8 @@ class View:
 
     def __init__(self, client: AbletonOSCClient):
         self._client = client
+        # Listener subscriptions: {"property": subscription}
+        self._subscriptions: dict[str, Subscription] = {}
 
     def get_selected_track(self) -> int:
         """Get the currently selected track index.
@@ -128,22 +131,36 @@ class View:
 
     # Listeners
 
+    def _start_listener(self, prop: str, callback: Callable) -> None:
+        """Subscribe callback(*args) to view property updates.
+
+        Replaces this wrapper's previous callback for the property; other
+        wrappers' subscriptions are unaffected.
+        """
+        router = self._client.router
+        subscription = router.subscribe(f"/live/view/get/{prop}", (), callback)
+        previous = self._subscriptions.get(prop)
+        self._subscriptions[prop] = subscription
+        if previous is not None:
+            router.unsubscribe(previous)
+
+    def _stop_listener(self, prop: str) -> None:
+        """Remove this wrapper's callback for a view property."""
+        subscription = self._subscriptions.pop(prop, None)
+        if subscription is not None:
+            self._client.router.unsubscribe(subscription)
+
     def on_selected_track_change(self, callback: Callable[[int], None]) -> None:
         """Register a callback for track selection changes.
 
         Args:
             callback: Function(track_index) called when selection changes
         """
-        self._client.send("/live/view/start_listen/selected_track")
-        self._client.start_listener(
-            "/live/view/get/selected_track",
-            lambda addr, *args: callback(int(args[0])),
-        )
+        self._start_listener("selected_track", lambda value, *_: callback(int(value)))
 
     def stop_selected_track_listener(self) -> None:
         """Stop listening for track selection changes."""
-        self._client.send("/live/view/stop_listen/selected_track")
-        self._client.stop_listener("/live/view/get/selected_track")
+        self._stop_listener("selected_track")
 
     def on_selected_scene_change(self, callback: Callable[[int], None]) -> None:
         """Register a callback for scene selection changes.
@@ -151,13 +168,8 @@ class View:
         Args:
             callback: Function(scene_index) called when selection changes
         """
-        self._client.send("/live/view/start_listen/selected_scene")
-        self._client.start_listener(
-            "/live/view/get/selected_scene",
-            lambda addr, *args: callback(int(args[0])),
-        )
+        self._start_listener("selected_scene", lambda value, *_: callback(int(value)))
 
     def stop_selected_scene_listener(self) -> None:
         """Stop listening for scene selection changes."""
-        self._client.send("/live/view/stop_listen/selected_scene")
-        self._client.stop_listener("/live/view/get/selected_scene")
+        self._stop_listener("selected_scene")
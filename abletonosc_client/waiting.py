@@ -0,0 +1,57 @@
+"""Waiting for Live to apply fire-and-forget commands.
+
+Structural commands (create_midi_track, create_scene, create_clip...) are
+plain sends with no reply, so a script that uses the result straight away
+can race Live. wait_until() polls a cheap query until it shows the change,
+starting with an immediate check and backing off geometrically, so callers
+continue as soon as Live has caught up instead of sleeping a fixed time:
+
+    before = song.get_num_tracks()
+    song.create_midi_track()
+    wait_until(song.get_num_tracks, lambda n: n > before)
+
+The wrappers' *_and_wait methods (Song.create_midi_track_and_wait,
+ClipSlot.create_clip_and_wait...) do exactly this. To only wait until Live
+has processed everything sent so far, use client.barrier().
+"""
+
+import time
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def wait_until(
+    probe: Callable[[], T],
+    predicate: Callable[[T], bool],
+    timeout: float = 5.0,
+    interval: float = 0.001,
+    max_interval: float = 0.05,
+    description: str = "condition",
+) -> T:
+    """Poll probe() until predicate accepts its result.
+
+    Args:
+        probe: Function querying the observable (e.g. song.get_num_tracks)
+        predicate: Function returning True once the change is visible
+        timeout: Overall deadline in seconds
+        interval: Pause after the first unsuccessful poll
+        max_interval: Longest pause between polls; pauses double up to it
+        description: What is awaited, for the timeout message
+
+    Returns:
+        The probe result that satisfied the predicate
+
+    Raises:
+        TimeoutError: If the predicate is not satisfied within timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        value = probe()
+        if predicate(value):
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Timed out waiting for {description} after {timeout}s")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
@@ -0,0 +1,11 @@
+"""Benchmarks for the client's transport and wrapper hot paths.
+
+Everything runs offline against FakeAbletonOSCServer on loopback. Run the
+whole suite, or a subset by name prefix, and optionally save JSON results:
+
+    python -m benchmarks
+    python -m benchmarks transport notes --json results.json
+    python -m benchmarks --quick
+
+Each module registers its benchmarks with @benchmark (see harness.py).
+"""
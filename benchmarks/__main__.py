@@ -0,0 +1,54 @@
+"""Command-line entry point: python -m benchmarks [names...] [options]."""
+
+import argparse
+import sys
+
+# Imported for registration, in report order
+from benchmarks import transport  # noqa: F401
+from benchmarks import encoding  # noqa: F401
+from benchmarks import notes  # noqa: F401
+from benchmarks import device_parameters  # noqa: F401
+from benchmarks import listeners  # noqa: F401
+from benchmarks import theory  # noqa: F401
+from benchmarks.harness import BENCHMARKS, Context, format_table, run, to_json
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the abletonosc-client benchmarks against a loopback fake server.",
+    )
+    parser.add_argument(
+        "names", nargs="*", help="Benchmark name prefixes to run (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=200, help="Samples per measurement")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed runs first")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and counts")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON ('-' for stdout)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    options = parser.parse_args(argv)
+
+    if options.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    context = Context(repeat=options.repeat, warmup=options.warmup, quick=options.quick)
+    if options.quick and options.repeat == parser.get_default("repeat"):
+        context.repeat = 20
+    results = run(options.names, context)
+    if not results:
+        parser.error(f"No benchmarks match {options.names}")
+
+    if options.json == "-":
+        print(to_json(results))
+        return 0
+    print(format_table(results))
+    if options.json:
+        with open(options.json, "w") as f:
+            f.write(to_json(results) + "\n")
+        print(f"\nWrote {options.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
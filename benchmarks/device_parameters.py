@@ -0,0 +1,62 @@
+"""Benchmark Device.get_parameters strategies end to end.
+
+Serves a device with many parameters (Wavetable, ~100) with a fixed
+per-message processing delay standing in for Live's main-thread latency,
+and reports the time and number of queries each strategy needs.
+
+Usage:
+    python -m benchmarks device
+    python -m benchmarks.device_parameters [--delay-ms 1.0] [--repeat 5]
+"""
+
+import argparse
+
+from abletonosc_client.device import PARAMETER_STRATEGIES, Device
+from abletonosc_client.fake_server import FakeLiveSet
+
+from benchmarks.harness import Context, Result, benchmark, format_table, loopback, measure
+
+DEVICE = "Wavetable"
+
+
+def get_parameters(context: Context, delay: float = 0.001) -> list[Result]:
+    """Time each strategy against a device served with the given delay."""
+    live_set = FakeLiveSet(devices={0: [DEVICE]})
+    results = []
+    with loopback(live_set, processing_time=delay) as (server, client):
+        device = Device(client)
+        num_parameters = len(live_set.tracks[0].devices[0].parameters)
+        for strategy in PARAMETER_STRATEGIES:
+            before = server.messages_received
+            device.get_parameters(0, 0, strategy=strategy)
+            queries = server.messages_received - before
+            repeat = max(context.repeat // (50 if strategy == "bulk" else 200), 2)
+            results.append(
+                measure(
+                    f"device.get_parameters[{strategy}]",
+                    lambda: device.get_parameters(0, 0, strategy=strategy),
+                    Context(repeat=repeat, warmup=1, quick=context.quick),
+                    parameters=num_parameters,
+                    queries=queries,
+                    delay_ms=delay * 1000,
+                )
+            )
+    return results
+
+
+benchmark("device.get_parameters")(get_parameters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delay-ms", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    results = get_parameters(
+        Context(repeat=options.repeat, warmup=1), options.delay_ms / 1000
+    )
+    print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Cost of encoding hot-path setter messages."""
+
+from abletonosc_client.encoding import build_message, build_message_uncached
+
+from benchmarks.harness import Context, Result, benchmark, measure
+
+# Encodes per timed sample; single encodes are too fast for the timer
+NUMBER = 1000
+
+CASES = (
+    ("set_volume", "/live/track/set/volume", (3, 0.85)),
+    ("set_parameter_value", "/live/device/set/parameter/value", (0, 1, 7, 0.5)),
+)
+
+
+@benchmark("encoding")
+def encoding(context: Context) -> list[Result]:
+    """Time per message of python-osc's builder and the cached templates."""
+    results = []
+    for name, address, args in CASES:
+        builder = measure(
+            f"encoding.{name}[builder]",
+            lambda: build_message_uncached(address, args),
+            context,
+            number=NUMBER,
+        )
+        template = measure(
+            f"encoding.{name}[template]",
+            lambda: build_message(address, args),
+            context,
+            number=NUMBER,
+        )
+        template.extra["speedup"] = builder.p50 / template.p50
+        results += [builder, template]
+    return results
@@ -0,0 +1,242 @@
+"""Benchmark registry, timing and reporting.
+
+A benchmark is a function taking a Context and returning one or more
+Results. Register it with @benchmark("group.name"); the CLI in __main__.py
+imports the benchmark modules, runs the selected ones and prints a table
+or writes JSON.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterator
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.fake_server import FakeAbletonOSCServer, FakeLiveSet
+
+# Loopback ports the benchmark server listens and replies on
+SEND_PORT = 19969
+RECEIVE_PORT = 19968
+
+# Format version of the JSON output
+SCHEMA_VERSION = 1
+
+BENCHMARKS: dict[str, Callable] = {}
+
+
+@dataclass
+class Context:
+    """Options shared by all benchmarks.
+
+    Attributes:
+        repeat: Timed samples per measurement
+        warmup: Untimed runs before sampling
+        quick: Use smaller sizes (for smoke tests and CI)
+    """
+
+    repeat: int = 200
+    warmup: int = 10
+    quick: bool = False
+
+
+@dataclass
+class Result:
+    """Summary of one measurement.
+
+    Attributes:
+        name: Benchmark name ("group.name[parameters]")
+        unit: Unit of the statistics ("s" per operation, or "ops/s")
+        samples: Number of samples
+        mean: Mean of the samples
+        min: Fastest sample
+        max: Slowest sample
+        p50: Median
+        p90: 90th percentile
+        p99: 99th percentile
+        extra: Benchmark-specific numbers (counts, rates)
+    """
+
+    name: str
+    unit: str
+    samples: int
+    mean: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+    extra: dict = field(default_factory=dict)
+
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark function under a dotted name."""
+
+    def register(func: Callable) -> Callable:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def summarize(name: str, samples: list[float], unit: str = "s", **extra) -> Result:
+    """Reduce samples to a Result with percentiles.
+
+    Args:
+        name: Result name
+        samples: Measured values (at least one)
+        unit: Unit of the samples
+        **extra: Additional numbers to report
+
+    Returns:
+        Result
+    """
+    ordered = sorted(samples)
+    if len(ordered) > 1:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = ordered[0]
+    return Result(
+        name=name,
+        unit=unit,
+        samples=len(ordered),
+        mean=statistics.fmean(ordered),
+        min=ordered[0],
+        max=ordered[-1],
+        p50=p50,
+        p90=p90,
+        p99=p99,
+        extra=extra,
+    )
+
+
+def measure(
+    name: str,
+    func: Callable,
+    context: Context,
+    repeat: int | None = None,
+    number: int = 1,
+    **extra,
+) -> Result:
+    """Time func() repeatedly and summarize the per-call durations.
+
+    Args:
+        name: Result name
+        func: Function to time (called without arguments)
+        context: Benchmark options
+        repeat: Samples to take (default: context.repeat)
+        number: Calls per sample, for functions too fast to time singly
+        **extra: Additional numbers to report
+
+    Returns:
+        Result in seconds per call
+    """
+    for _ in range(context.warmup):
+        func()
+    samples = []
+    for _ in range(repeat or context.repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return summarize(name, samples, **extra)
+
+
+@contextmanager
+def loopback(
+    live_set: FakeLiveSet | None = None,
+    client_options: dict | None = None,
+    **server_options,
+) -> Iterator[tuple[FakeAbletonOSCServer, AbletonOSCClient]]:
+    """Run a fake server on loopback and connect a client to it.
+
+    Args:
+        live_set: Set to serve (default: FakeLiveSet())
+        client_options: Extra AbletonOSCClient arguments (e.g. receive_mode)
+        **server_options: latency, jitter, loss, processing_time, seed
+
+    Yields:
+        (server, client)
+    """
+    with FakeAbletonOSCServer(
+        port=SEND_PORT, reply_port=RECEIVE_PORT, live_set=live_set, **server_options
+    ) as server:
+        client = AbletonOSCClient(
+            send_port=SEND_PORT, receive_port=RECEIVE_PORT, **(client_options or {})
+        )
+        try:
+            yield server, client
+        finally:
+            client.close()
+
+
+def run(names: list[str], context: Context) -> list[Result]:
+    """Run the registered benchmarks whose names start with any of names.
+
+    Args:
+        names: Name prefixes to select (all benchmarks if empty)
+        context: Benchmark options
+
+    Returns:
+        Results in registration order
+    """
+    results: list[Result] = []
+    for name, func in BENCHMARKS.items():
+        if names and not any(name.startswith(prefix) for prefix in names):
+            continue
+        outcome = func(context)
+        results.extend(outcome if isinstance(outcome, list) else [outcome])
+    return results
+
+
+def metadata() -> dict:
+    """Describe the environment the results were measured in."""
+    try:
+        from importlib.metadata import version
+
+        package_version = version("abletonosc-client")
+    except Exception:
+        package_version = None
+    return {
+        "schema": SCHEMA_VERSION,
+        "package_version": package_version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def to_json(results: list[Result]) -> str:
+    """Serialize results with environment metadata."""
+    return json.dumps(
+        {"metadata": metadata(), "results": [asdict(r) for r in results]}, indent=2
+    )
+
+
+def _format(value: float, unit: str) -> str:
+    if unit == "s":
+        if value < 1e-3:
+            return f"{value * 1e6:.1f}us"
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:,.0f}"
+
+
+def format_table(results: list[Result]) -> str:
+    """Format results as a plain-text table."""
+    columns = ("p50", "p90", "p99", "mean")
+    header = f"{'benchmark':<40} {'unit':>5} " + " ".join(f"{c:>10}" for c in columns)
+    lines = [header + "  extra", "-" * (len(header) + 7)]
+    for r in results:
+        values = " ".join(f"{_format(getattr(r, c), r.unit):>10}" for c in columns)
+        extra = " ".join(
+            f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}"
+            for k, v in r.extra.items()
+        )
+        lines.append(f"{r.name:<40} {r.unit:>5} {values}  {extra}")
+    return "\n".join(lines)
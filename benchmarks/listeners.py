@@ -0,0 +1,91 @@
+"""Listener dispatch rate.
+
+A raw socket plays AbletonOSC and fires a stream of /live/song/get/beat
+updates at the client's receive port, keeping a bounded number in flight;
+the rate is the number of callbacks run per second. Datagrams lost anyway
+are reported as "lost".
+"""
+
+import socket
+import threading
+import time
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.encoding import build_message
+
+from benchmarks.harness import RECEIVE_PORT, Context, Result, benchmark, summarize
+
+ADDRESS = "/live/song/get/beat"
+
+# Updates in flight before the sender waits for callbacks to catch up
+WINDOW = 64
+
+# Client configurations to compare: (name, AbletonOSCClient arguments)
+CONFIGURATIONS = (
+    ("threading", {"receive_mode": "threading"}),
+    ("single", {"receive_mode": "single"}),
+    ("single+workers", {"receive_mode": "single", "callback_workers": 2}),
+)
+
+
+def _dispatch_rate(client: AbletonOSCClient, count: int) -> tuple[float, int]:
+    """Fire count updates and return (callbacks per second, lost)."""
+    received = 0
+    finished = 0.0
+    progress = threading.Condition()
+
+    def on_beat(address, beat):
+        nonlocal received, finished
+        with progress:
+            received += 1
+            finished = time.perf_counter()
+            progress.notify()
+
+    client.start_listener(ADDRESS, on_beat)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    datagram = build_message(ADDRESS, (1,))
+    try:
+        start = time.perf_counter()
+        for sent in range(count):
+            # Keep at most WINDOW updates in flight so the kernel buffer
+            # doesn't overflow; a lost datagram only stalls for a timeout
+            with progress:
+                if sent - received >= WINDOW:
+                    progress.wait_for(lambda: sent - received < WINDOW, timeout=0.1)
+            sender.sendto(datagram, ("127.0.0.1", RECEIVE_PORT))
+        with progress:
+            progress.wait_for(lambda: received == count, timeout=0.5)
+    finally:
+        sender.close()
+        client.stop_listener(ADDRESS)
+    return received / (finished - start), count - received
+
+
+@benchmark("listeners.dispatch")
+def dispatch(context: Context) -> list[Result]:
+    """Listener callbacks per second for each receive configuration."""
+    count = 500 if context.quick else 5000
+    rounds = max(context.repeat // 40, 3)
+    results = []
+    for name, options in CONFIGURATIONS:
+        client = AbletonOSCClient(
+            send_port=RECEIVE_PORT + 1000, receive_port=RECEIVE_PORT, **options
+        )
+        try:
+            rates, lost = [], 0
+            for _ in range(rounds):
+                rate, dropped = _dispatch_rate(client, count)
+                rates.append(rate)
+                lost += dropped
+        finally:
+            client.close()
+        results.append(
+            summarize(
+                f"listeners.dispatch[{name}]",
+                rates,
+                unit="ops/s",
+                updates=count,
+                lost=lost,
+            )
+        )
+    return results
@@ -0,0 +1,94 @@
+"""Note encode/decode cost by note count.
+
+notes.add_notes measures the client side only (encoding and sending, into a
+socket nobody reads); notes.get_notes is the full round trip, including
+decoding into Note objects or a NoteArray.
+"""
+
+import random
+import socket
+
+from abletonosc_client.client import AbletonOSCClient
+from abletonosc_client.clip import Clip
+from abletonosc_client.fake_server import FakeClip, FakeLiveSet
+from abletonosc_client.notes import Note
+
+from benchmarks.harness import Context, Result, benchmark, loopback, measure
+
+# Largest size stays under the 64 KiB UDP limit for a single reply
+SIZES = (16, 256, 2048)
+QUICK_SIZES = (16, 256)
+
+SINK_PORT = 19967
+
+
+def _notes(count: int, seed: int = 0) -> list[Note]:
+    rng = random.Random(seed)
+    return [
+        Note(
+            pitch=rng.randrange(36, 96),
+            start_time=rng.randrange(64) / 4,
+            duration=0.25,
+            velocity=rng.randrange(1, 128),
+        )
+        for _ in range(count)
+    ]
+
+
+def _sizes(context: Context) -> tuple[int, ...]:
+    return QUICK_SIZES if context.quick else SIZES
+
+
+@benchmark("notes.add_notes")
+def add_notes(context: Context) -> list[Result]:
+    """Encode and send notes with Clip.add_notes."""
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", SINK_PORT))
+    client = AbletonOSCClient(send_port=SINK_PORT, receive_port=SINK_PORT - 1)
+    clip = Clip(client)
+    results = []
+    try:
+        for size in _sizes(context):
+            notes = _notes(size)
+            repeat = max(context.repeat * 16 // size, 5)
+            results.append(
+                measure(
+                    f"notes.add_notes[{size}]",
+                    lambda: clip.add_notes(0, 0, notes),
+                    context,
+                    repeat=repeat,
+                    notes=size,
+                )
+            )
+    finally:
+        client.close()
+        sink.close()
+    return results
+
+
+@benchmark("notes.get_notes")
+def get_notes(context: Context) -> list[Result]:
+    """Fetch and decode notes with Clip.get_notes, as list and NoteArray."""
+    results = []
+    for size in _sizes(context):
+        live_set = FakeLiveSet()
+        fake_clip = FakeClip(16.0)
+        fake_clip.notes = [
+            (n.pitch, n.start_time, n.duration, n.velocity, n.mute) for n in _notes(size)
+        ]
+        live_set.tracks[0].slots[0] = fake_clip
+        repeat = max(context.repeat * 16 // size, 5)
+        with loopback(live_set) as (_, client):
+            clip = Clip(client)
+            for as_array in (False, True):
+                kind = "array" if as_array else "list"
+                results.append(
+                    measure(
+                        f"notes.get_notes[{kind},{size}]",
+                        lambda: clip.get_notes(0, 0, as_array=as_array),
+                        context,
+                        repeat=repeat,
+                        notes=size,
+                    )
+                )
+    return results
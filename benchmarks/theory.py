@@ -0,0 +1,29 @@
+"""Throughput of the scales and chords helpers."""
+
+from abletonosc_client import chords, scales
+
+from benchmarks.harness import Context, Result, benchmark, measure
+
+# Calls per timed sample; single calls are too fast for the timer
+NUMBER = 100
+
+CASES = (
+    ("scales.get_scale", lambda: scales.get_scale("D", "dorian")),
+    ("scales.get_scale_range", lambda: scales.get_scale_range("C", "major", 36, 96)),
+    ("scales.in_scale", lambda: scales.in_scale(61, "C", "major")),
+    ("scales.snap_to_scale", lambda: scales.snap_to_scale(61, "C", "major")),
+    ("scales.note_to_midi", lambda: scales.note_to_midi("F#", 3)),
+    ("chords.get_chord", lambda: chords.get_chord("A", "min7")),
+    ("chords.get_chord_in_key", lambda: chords.get_chord_in_key("C", 4, "dom7")),
+    ("chords.get_progression", lambda: chords.get_progression("G", "ii-V-I")),
+    ("chords.voice_lead", lambda: chords.voice_lead([60, 64, 67], [65, 69, 72])),
+)
+
+
+@benchmark("theory")
+def theory(context: Context) -> list[Result]:
+    """Time per call of each helper."""
+    return [
+        measure(f"theory.{name}", func, context, number=NUMBER)
+        for name, func in CASES
+    ]
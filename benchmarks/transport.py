@@ -0,0 +1,79 @@
+"""Query latency and send throughput over loopback."""
+
+import time
+
+from abletonosc_client.metrics import ClientMetrics
+
+from benchmarks.harness import Context, Result, benchmark, loopback, measure, summarize
+
+# Queries per query_many() batch
+BATCH_SIZE = 64
+
+
+@benchmark("transport.query")
+def query_latency(context: Context) -> list[Result]:
+    """Round-trip latency of a single query, in both receive modes."""
+    results = []
+    for mode in ("threading", "single"):
+        with loopback(client_options={"receive_mode": mode}) as (_, client):
+            results.append(
+                measure(
+                    f"transport.query[{mode}]",
+                    lambda: client.query("/live/song/get/tempo"),
+                    context,
+                )
+            )
+    return results
+
+
+@benchmark("transport.query_metrics")
+def query_latency_with_metrics(context: Context) -> Result:
+    """Round-trip latency of a single query with instrumentation enabled."""
+    with loopback(client_options={"metrics": ClientMetrics()}) as (_, client):
+        return measure(
+            "transport.query[metrics]",
+            lambda: client.query("/live/song/get/tempo"),
+            context,
+        )
+
+
+@benchmark("transport.query_many")
+def query_many_latency(context: Context) -> Result:
+    """Latency of a pipelined batch of queries, per query."""
+    requests = [("/live/track/get/volume", (t % 4,)) for t in range(BATCH_SIZE)]
+    with loopback() as (_, client):
+        result = measure(
+            f"transport.query_many[{BATCH_SIZE}]",
+            lambda: client.query_many(requests),
+            context,
+            repeat=max(context.repeat // 4, 1),
+        )
+    # Report per query rather than per batch
+    for stat in ("mean", "min", "max", "p50", "p90", "p99"):
+        setattr(result, stat, getattr(result, stat) / BATCH_SIZE)
+    result.extra["batch"] = BATCH_SIZE
+    return result
+
+
+@benchmark("transport.send")
+def send_throughput(context: Context) -> list[Result]:
+    """Messages per second through send(), unbundled and bundled."""
+    count = 200 if context.quick else 2000
+    rounds = max(context.repeat // 20, 3)
+    results = []
+    with loopback() as (_, client):
+        for bundled in (False, True):
+            rates = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                if bundled:
+                    with client.bundle():
+                        for i in range(count):
+                            client.send("/live/track/set/volume", i % 4, 0.5)
+                else:
+                    for i in range(count):
+                        client.send("/live/track/set/volume", i % 4, 0.5)
+                rates.append(count / (time.perf_counter() - start))
+            name = "transport.send[bundled]" if bundled else "transport.send"
+            results.append(summarize(name, rates, unit="ops/s", messages=count))
+    return results
@@ -4,7 +4,6 @@
 Run this script with Ableton Live open and AbletonOSC enabled.
 """
 
-import time
 import abletonosc_client
 from abletonosc_client.clip import Note
 
@@ -22,14 +21,13 @@ def create_tracks(client):
 
     print("\nCreating 5 MIDI tracks...")
     for i, name in enumerate(track_names):
-        song.create_midi_track(i)
-        time.sleep(0.1)  # Small delay for Ableton to process
+        song.create_midi_track_and_wait(i)
 
     # Name the tracks
     print("Naming tracks...")
-    for i, name in enumerate(track_names):
-        track.set_name(i, name)
-        time.sleep(0.05)
+    with client.bundle():
+        for i, name in enumerate(track_names):
+            track.set_name(i, name)
 
     # Verify
     print("\nCreated tracks:")
@@ -55,16 +53,16 @@ def compose_song(client):
 
     print("\nCreating clips...")
     for track_idx in range(5):
-        clip_slot.create_clip(track_idx, 0, clip_length)
-        time.sleep(0.1)
+        clip_slot.create_clip_and_wait(track_idx, 0, clip_length)
 
     # Name the clips
     clip_names = ["Drum Loop", "Bass Line", "Melody", "Pad Chords", "Accents"]
-    for i, name in enumerate(clip_names):
-        clip.set_name(i, 0, name)
+    with client.bundle():
+        for i, name in enumerate(clip_names):
+            clip.set_name(i, 0, name)
 
-    # Name the scene
-    scene.set_name(0, "Main Loop")
+        # Name the scene
+        scene.set_name(0, "Main Loop")
 
     print("Composing notes...")
 